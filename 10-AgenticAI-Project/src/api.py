@@ -0,0 +1,308 @@
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
+from pydantic import BaseModel
+
+from langgraphagenticai.LLMS.client_pool import llm_client_pool
+from langgraphagenticai.LLMS.hedging import get_hedged_client, hedging_stats
+from langgraphagenticai.batch.runner import BatchRunner, BATCH_CONCURRENCY
+from langgraphagenticai.graph.checkpointer import checkpointer_stats, flush_checkpointer, get_checkpointer
+from langgraphagenticai.graph.graph_registry import graph_registry, make_model_id, get_tool_set
+from langgraphagenticai.graph.usecases import STREAMING_NODES, RESULT_KEYS, USECASE_SLUGS, answer_message, extract_answer
+from langgraphagenticai.nodes.cascade_chatbot_node import answered_by, cascade_stats
+from langgraphagenticai.nodes.consultant_bot_node import consultation_cache_stats
+from langgraphagenticai.news.prefetch import prefetch_stats
+from langgraphagenticai.tools.parallel_tool_node import tool_call_stats
+from langgraphagenticai.tools.tool_cache import tool_cache_stats
+from langgraphagenticai.ui.uiconfigfile import Config
+from langgraphagenticai.utils.latency import LatencyTracker
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+from langgraphagenticai.utils.upstream import limiter_stats
+from langgraphagenticai.utils.circuit_breaker import breaker_stats
+from langgraphagenticai.utils.blob_store import blob_store_stats
+from langgraphagenticai.utils.single_flight import single_flight_stats
+
+## Headless HTTP API for the AgenticAI graphs.
+## Run from the project root:  uvicorn api:app --app-dir src
+## Every worker process builds its graphs and LLM clients once and keeps them for its lifetime.
+## Workers share the SQLite checkpointer, so a conversation (thread_id) can continue on any worker
+## once its previous turn is committed (CHECKPOINT_SHARED).
+
+API_LLM_PROVIDER = os.environ.get("API_LLM_PROVIDER", "groq")  # "stub" needs no API key or network
+API_CONFIG = Config(os.path.join(os.path.dirname(__file__), "langgraphagenticai", "ui", "uiconfigfile.ini"))
+API_MODEL = os.environ.get("API_MODEL") or API_CONFIG.get_groq_model_options()[0]
+# Models a request may ask for; each one gets its own clients and compiled graphs
+API_MODELS = list(dict.fromkeys([API_MODEL] + [m.strip() for m in API_CONFIG.get_groq_model_options()]))
+# Small model Chatbot With Web tries first; API_CASCADE_MODEL=none or a blank GROQ_CASCADE_MODEL disables it
+API_CASCADE_MODEL = os.environ.get("API_CASCADE_MODEL") or API_CONFIG.get_groq_cascade_model()
+API_WORKERS = int(os.environ.get("API_WORKERS", "1"))
+
+logger = get_logger("api")
+request_latency = LatencyTracker()
+ttft_tracker = LatencyTracker()
+
+
+class ChatRequest(BaseModel):
+    message: str
+    # Continue a conversation; any worker can serve it (see above)
+    thread_id: Optional[str] = None
+    model: Optional[str] = None
+
+
+class BatchItem(BaseModel):
+    id: str
+    message: str
+
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem]
+    model: Optional[str] = None
+    max_concurrency: int = BATCH_CONCURRENCY
+
+
+def get_graph(usecase: str, model_name: str, with_checkpointer: bool):
+    api_key = os.environ.get("GROQ_API_KEY", "")
+    model = get_hedged_client(API_LLM_PROVIDER, model_name, api_key)
+    small_model = None
+    if usecase == "Chatbot With Web" and API_CASCADE_MODEL not in ("", "none", model_name):
+        small_model = get_hedged_client(API_LLM_PROVIDER, API_CASCADE_MODEL, api_key)
+    return graph_registry.get_graph(
+        usecase,
+        model,
+        make_model_id(f"{API_LLM_PROVIDER}:{model_name}", api_key),
+        get_tool_set(usecase),
+        asynchronous=True,
+        checkpointer=get_checkpointer() if with_checkpointer else None,
+        small_model=small_model,
+    )
+
+
+def resolve_model(model: Optional[str]) -> str:
+    """
+    Returns the requested model, or API_MODEL when none is given.
+    """
+    if model is None:
+        return API_MODEL
+    if model not in API_MODELS:
+        raise HTTPException(status_code=422, detail=f"Unknown model '{model}'. Choose from: {API_MODELS}")
+    return model
+
+
+def resolve(slug: str, request: ChatRequest):
+    """
+    Returns (usecase, graph, run config) for a request.
+    """
+    usecase = USECASE_SLUGS.get(slug)
+    if usecase is None:
+        raise HTTPException(status_code=404, detail=f"Unknown use case '{slug}'. Choose from: {list(USECASE_SLUGS)}")
+    if not request.message.strip():
+        raise HTTPException(status_code=422, detail="message must not be empty")
+
+    graph = get_graph(usecase, resolve_model(request.model), request.thread_id is not None)
+    config = None
+    if request.thread_id is not None:
+        config = {"configurable": {"thread_id": f"{request.thread_id}:{usecase}"}}
+    return usecase, graph, config
+
+
+def sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    ## Compile every graph and create the LLM client before the first request
+    for usecase in USECASE_SLUGS.values():
+        try:
+            get_graph(usecase, API_MODEL, with_checkpointer=False)
+        except Exception as e:
+            logger.warning("could not prebuild graph", extra={"usecase": usecase, "error": str(e)})
+    if API_LLM_PROVIDER == "groq" and os.environ.get("GROQ_API_KEY"):
+        llm_client_pool.warm_up("groq", [API_MODEL], os.environ["GROQ_API_KEY"])
+    yield
+    ## Only a checkpointer that threaded requests created has writes to wait for
+    flush_checkpointer()
+
+
+app = FastAPI(title="LangGraph AgenticAI API", lifespan=lifespan)
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
+
+
+@app.get("/usecases")
+async def usecases():
+    return {"usecases": USECASE_SLUGS, "provider": API_LLM_PROVIDER, "model": API_MODEL, "models": API_MODELS}
+
+
+@app.post("/v1/{slug}/invoke")
+async def invoke(slug: str, request: ChatRequest):
+    usecase, graph, config = resolve(slug, request)
+    started = time.perf_counter()
+    try:
+        values = await graph.ainvoke({"messages": [HumanMessage(content=request.message)]}, config)
+    except Exception as e:
+        logger.exception("graph run failed", extra={"usecase": usecase})
+        raise HTTPException(status_code=502, detail=f"{usecase} failed: {e}")
+    elapsed = time.perf_counter() - started
+    request_latency.record(usecase, elapsed)
+
+    return {
+        "usecase": usecase,
+        "thread_id": request.thread_id,
+        "answer": extract_answer(usecase, values),
+        # Chatbot With Web with a cascade: {"tier", "model"} that wrote the answer
+        "answered_by": answered_by(answer_message(values)),
+        "latency_ms": round(elapsed * 1000, 1),
+    }
+
+
+@app.post("/v1/{slug}/stream")
+async def stream(slug: str, request: ChatRequest):
+    """
+    Server-sent events: `token` for each answer token, `tool_start`/`tool_end` for tool calls,
+    then one `done` event with the full answer (or an `error` event).
+    """
+    usecase, graph, config = resolve(slug, request)
+    stream_node = STREAMING_NODES.get(usecase)
+
+    async def events():
+        started = time.perf_counter()
+        first_token_at = None
+        streamed = []
+        final_values = {}
+        last_ai_message = None
+        try:
+            async for mode, chunk in graph.astream(
+                {"messages": [HumanMessage(content=request.message)]},
+                config,
+                stream_mode=["messages", "updates"],
+            ):
+                if mode == "messages":
+                    message, metadata = chunk
+                    if metadata.get("langgraph_node") != stream_node:
+                        continue
+                    if not isinstance(message, AIMessageChunk) or not isinstance(message.content, str):
+                        continue
+                    if not message.content:
+                        continue
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                        ttft_tracker.record(usecase, first_token_at - started)
+                    streamed.append(message.content)
+                    yield sse("token", {"content": message.content})
+                    continue
+
+                for update in chunk.values():
+                    if not isinstance(update, dict):
+                        continue
+                    final_values.update({k: v for k, v in update.items() if k != "messages"})
+                    for message in update.get("messages") or []:
+                        if isinstance(message, AIMessage) and message.tool_calls:
+                            for tool_call in message.tool_calls:
+                                yield sse("tool_start", {"name": tool_call["name"], "args": tool_call.get("args", {})})
+                        elif isinstance(message, ToolMessage):
+                            yield sse("tool_end", {"name": message.name, "status": message.status})
+                        elif isinstance(message, AIMessage):
+                            last_ai_message = message
+        except Exception as e:
+            logger.exception("graph run failed", extra={"usecase": usecase})
+            yield sse("error", {"detail": str(e)})
+            return
+
+        if usecase in RESULT_KEYS:
+            answer = final_values.get(RESULT_KEYS[usecase]) or "".join(streamed)
+        else:
+            answer = last_ai_message.content if last_ai_message is not None else "".join(streamed)
+        elapsed = time.perf_counter() - started
+        request_latency.record(usecase, elapsed)
+        yield sse("done", {"answer": answer, "thread_id": request.thread_id, "answered_by": answered_by(last_ai_message),
+                           "latency_ms": round(elapsed * 1000, 1)})
+
+    # X-Accel-Buffering stops nginx from buffering the event stream
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@app.post("/v1/{slug}/batch")
+async def batch(slug: str, request: BatchRequest):
+    """
+    Runs independent prompts with bounded concurrency and streams one JSON line per item
+    as it completes (not in input order), then a final line with the batch summary.
+    """
+    usecase = USECASE_SLUGS.get(slug)
+    if usecase is None:
+        raise HTTPException(status_code=404, detail=f"Unknown use case '{slug}'. Choose from: {list(USECASE_SLUGS)}")
+    graph = get_graph(usecase, resolve_model(request.model), with_checkpointer=False)
+    runner = BatchRunner(graph, usecase, max_concurrency=max(1, request.max_concurrency))
+    items = [item.model_dump() for item in request.items]
+
+    async def lines():
+        results = asyncio.Queue()
+        task = asyncio.create_task(runner.run(items, results.put_nowait))
+        while not (task.done() and results.empty()):
+            getter = asyncio.ensure_future(results.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield json.dumps(getter.result(), ensure_ascii=False) + "\n"
+            else:
+                getter.cancel()
+        report = await task
+        yield json.dumps({"summary": report.summary()}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Per-worker counters; each worker process reports its own.
+    """
+    return {
+        "pid": os.getpid(),
+        "request_latency": request_latency.summary(),
+        "time_to_first_token": ttft_tracker.summary(),
+        "graph_registry": graph_registry.stats(),
+        "llm_client_pool": llm_client_pool.stats(),
+        # Reported once a threaded request created it; None until then
+        "checkpointer": checkpointer_stats(),
+        "blob_store": blob_store_stats(),
+        "tool_caches": tool_cache_stats(),
+        "tool_calls": tool_call_stats(),
+        "consultation_caches": consultation_cache_stats(),
+        "upstream_limiters": limiter_stats(),
+        "circuit_breakers": breaker_stats(),
+        "request_coalescing": single_flight_stats(),
+        "llm_hedging": hedging_stats(),
+        "model_cascade": cascade_stats(),
+        "news_prefetch": prefetch_stats(),
+    }
+
+
+@app.get("/metrics/prometheus", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Per-node latency, LLM/tool time, token and error metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "api:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host=os.environ.get("API_HOST", "127.0.0.1"),
+        port=int(os.environ.get("API_PORT", "8000")),
+        workers=API_WORKERS,
+    )
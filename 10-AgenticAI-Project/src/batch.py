@@ -0,0 +1,53 @@
+import argparse
+import asyncio
+import json
+import os
+
+from langgraphagenticai.LLMS.hedging import get_hedged_client
+from langgraphagenticai.batch.runner import run_jsonl, BATCH_CONCURRENCY
+from langgraphagenticai.graph.graph_registry import graph_registry, make_model_id, get_tool_set
+from langgraphagenticai.graph.usecases import USECASE_SLUGS
+from langgraphagenticai.ui.uiconfigfile import Config
+
+## Bulk runs of a use case over a JSONL file, e.g. from the project root:
+##   python src/batch.py consultant-bot faq.jsonl answers.jsonl --concurrency 32
+## Re-running the same command after a crash skips the items that already completed.
+
+
+def parse_args():
+    default_model = Config(
+        os.path.join(os.path.dirname(__file__), "langgraphagenticai", "ui", "uiconfigfile.ini")
+    ).get_groq_model_options()[0]
+
+    parser = argparse.ArgumentParser(description="Run prompts from a JSONL file through an AgenticAI graph.")
+    parser.add_argument("usecase", choices=list(USECASE_SLUGS), help="Use case to run")
+    parser.add_argument("input", help='JSONL input, one {"id": ..., "message": ...} per line')
+    parser.add_argument("output", help="JSONL output; results are appended as they complete")
+    parser.add_argument("--progress", help="Progress file (default: <output>.progress)")
+    parser.add_argument("--concurrency", type=int, default=BATCH_CONCURRENCY, help="Items in flight at once")
+    parser.add_argument("--provider", default=os.environ.get("API_LLM_PROVIDER", "groq"), help="groq or stub")
+    parser.add_argument("--model", default=os.environ.get("API_MODEL") or default_model)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    usecase = USECASE_SLUGS[args.usecase]
+    api_key = os.environ.get("GROQ_API_KEY", "")
+
+    ## Same client factory as the API's /batch endpoint, so both hedge the same way
+    model = get_hedged_client(args.provider, args.model, api_key)
+    graph = graph_registry.get_graph(
+        usecase,
+        model,
+        make_model_id(f"{args.provider}:{args.model}", api_key),
+        get_tool_set(usecase),
+        asynchronous=True,
+    )
+
+    report = asyncio.run(run_jsonl(graph, usecase, args.input, args.output, args.progress, args.concurrency))
+    print(json.dumps(report.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
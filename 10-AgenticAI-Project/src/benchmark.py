@@ -0,0 +1,93 @@
+import argparse
+import json
+import os
+import sys
+
+## Offline benchmark of the AgenticAI graphs: no Groq or Tavily keys, no network.
+## From the project root:
+##   python src/benchmark.py --output bench.json
+##   python src/benchmark.py --output new.json --baseline bench.json --fail-on-regression
+## Model and search calls are answered by StubChatModel and FakeTavily with the latencies below.
+
+## Caches, prefetched news digests, request coalescing and the Tavily rate limit would turn
+## repeated benchmark requests into cache hits or queueing, so they are off unless set explicitly.
+os.environ.setdefault("CONSULTATION_CACHE", "0")
+os.environ.setdefault("NEWS_PREFETCH", "0")
+os.environ.setdefault("COALESCE_REQUESTS", "0")
+os.environ.setdefault("TAVILY_RPM", "1000000")
+os.environ.setdefault("TAVILY_MAX_CONCURRENCY", "1024")
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from langgraphagenticai.benchmarks.suite import BenchmarkSettings, BenchmarkSuite, compare
+from langgraphagenticai.graph.usecases import USECASE_SLUGS
+
+
+def parse_args():
+    defaults = BenchmarkSettings()
+    parser = argparse.ArgumentParser(description="Benchmark the AgenticAI graphs offline with a stub LLM and stub Tavily.")
+    parser.add_argument("--usecases", nargs="+", choices=list(USECASE_SLUGS), default=list(USECASE_SLUGS))
+    parser.add_argument("--concurrency", nargs="+", type=int, default=list(defaults.concurrency))
+    parser.add_argument("--requests", type=int, default=defaults.requests, help="Requests per concurrency level")
+    parser.add_argument("--overhead-requests", type=int, default=defaults.overhead_requests,
+                        help="Sequential zero-latency requests used to measure graph overhead")
+    parser.add_argument("--sync", action="store_true", help="Benchmark the sync graphs (threads) instead of the async ones")
+    parser.add_argument("--llm-ttft", type=float, default=defaults.llm_ttft, help="Seconds to the first token")
+    parser.add_argument("--llm-tokens", type=int, default=defaults.llm_tokens, help="Tokens per answer")
+    parser.add_argument("--llm-token-interval", type=float, default=defaults.llm_token_interval)
+    parser.add_argument("--search-latency", type=float, default=defaults.search_latency, help="Seconds per Tavily call")
+    parser.add_argument("--search-results", type=int, default=defaults.search_results)
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Relative change counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on a regression")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    settings = BenchmarkSettings(
+        concurrency=tuple(args.concurrency),
+        requests=args.requests,
+        overhead_requests=args.overhead_requests,
+        synchronous=args.sync,
+        llm_ttft=args.llm_ttft,
+        llm_tokens=args.llm_tokens,
+        llm_token_interval=args.llm_token_interval,
+        search_latency=args.search_latency,
+        search_results=args.search_results,
+        usecases=tuple(USECASE_SLUGS[slug] for slug in args.usecases),
+    )
+
+    def show(result):
+        if result.get("scenario") == "overhead":
+            print(f"{result['usecase']:<18} overhead      mean {result['mean_ms']:>8.2f} ms  p50 {result['p50_ms']:>8.1f} ms")
+        else:
+            print(f"{result['usecase']:<18} c={result['concurrency']:<4} {result['throughput_per_s']:>8.2f} req/s  "
+                  f"p50 {result['p50_ms']:>8.1f}  p95 {result['p95_ms']:>8.1f}  p99 {result['p99_ms']:>8.1f} ms  "
+                  f"rss {result['rss_mb']:.0f} MB  failed {result['failed']}")
+
+    results = BenchmarkSuite(settings).run(on_result=show)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("meta", {}).get("settings") != results["meta"]["settings"]:
+            print("Note: the baseline was run with different settings; changes may not be regressions.")
+        rows = compare(results, baseline, args.tolerance)
+        regressions = [row for row in rows if row["regression"]]
+        for row in rows:
+            flag = "REGRESSION" if row["regression"] else ""
+            print(f"{row['usecase']:<18} {row['mode']:<8} c={row['concurrency']:<4} {row['metric']:<17} "
+                  f"{row['baseline']:>10} -> {row['current']:>10} ({row['change']:+.1%}) {flag}")
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
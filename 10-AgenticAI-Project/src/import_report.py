@@ -0,0 +1,99 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from langgraphagenticai.graph.usecases import USECASE_SLUGS
+from langgraphagenticai.utils.import_report import best_of, compare, measure
+
+## Import-time report: what the app costs to import, broken down by subsystem.
+## From the project root:
+##   python src/import_report.py --output imports.json
+##   python src/import_report.py --baseline imports.json --fail-on-regression
+## "app" is the cold start of the Streamlit app module; each use case adds the modules
+## imported when it is first selected (see USECASE_MODULES in graph/usecases.py).
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_CODE = "import langgraphagenticai.main"
+
+
+def usecase_code(usecase: str) -> str:
+    return f"from langgraphagenticai.graph.usecases import load_usecase\nload_usecase({usecase!r})"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Report import time of the AgenticAI app by subsystem.")
+    parser.add_argument("--usecases", nargs="*", choices=list(USECASE_SLUGS), default=list(USECASE_SLUGS),
+                        help="Use cases whose first-selection cost is measured (none for the app only)")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per measurement; the fastest is kept")
+    parser.add_argument("--top", type=int, default=12, help="Rows shown per breakdown")
+    parser.add_argument("--output", help="Write the report to this JSON file")
+    parser.add_argument("--baseline", help="Earlier report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative growth counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on a regression")
+    return parser.parse_args()
+
+
+def run(code: str, repeat: int, setup: str = "") -> dict:
+    # A dummy key lets modules that create API clients at import time load without one
+    env = {"TAVILY_API_KEY": os.environ.get("TAVILY_API_KEY", "import-report"), "LOG_LEVEL": "WARNING"}
+    return best_of([measure(code, setup, cwd=SRC_DIR, env=env) for _ in range(max(1, repeat))])
+
+
+def show(title: str, report: dict, top: int):
+    print(f"\n{title}: {report['total_ms']:.1f} ms")
+    for section in ("subsystems", "packages"):
+        print(f"  by {section[:-1]}:")
+        for key, ms in list(report[section].items())[:top]:
+            print(f"    {key:<45} {ms:>8.1f} ms")
+
+
+def main():
+    args = parse_args()
+    app = run(APP_CODE, args.repeat)
+    show("app cold start", app, args.top)
+
+    usecases = {}
+    for slug in args.usecases:
+        usecase = USECASE_SLUGS[slug]
+        # Measured after the app is imported: only what selecting the use case adds
+        usecases[usecase] = report = run(usecase_code(usecase), args.repeat, setup=APP_CODE)
+        show(f"{usecase} first selection", report, args.top)
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "app": app,
+        "usecases": usecases,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = [("app", row) for row in compare(app, baseline["app"], args.tolerance)]
+        for usecase, report in usecases.items():
+            if usecase in baseline.get("usecases", {}):
+                rows += [(usecase, row) for row in compare(report, baseline["usecases"][usecase], args.tolerance)]
+        regressions = [row for _, row in rows if row["regression"]]
+        print()
+        for scope, row in rows:
+            if row["regression"] or row["entry"] == "total":
+                change = f"{row['change']:+.1%}" if row["change"] is not None else "new"
+                flag = "REGRESSION" if row["regression"] else ""
+                print(f"{scope:<18} {row['entry']:<40} {row['baseline_ms']:>8.1f} -> {row['current_ms']:>8.1f} ms ({change}) {flag}")
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import os
+import threading
+from collections import OrderedDict
+
+import httpx
+
+from langgraphagenticai.utils.hashing import fingerprint
+from langgraphagenticai.utils.instrumentation import LLMMetricsHandler
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.upstream import RateLimitedTransport, AsyncRateLimitedTransport
+
+# Endpoints hit by warm_up() to open a keep-alive connection before the first user request
+WARMUP_URLS = {
+    "groq": "https://api.groq.com/openai/v1/models",
+}
+
+logger = get_logger(__name__)
+
+
+def _create_groq_client(model, api_key, http_client, http_async_client):
+    from langchain_groq import ChatGroq
+
+    return ChatGroq(
+        api_key=api_key,
+        model=model,
+        http_client=http_client,
+        http_async_client=http_async_client,
+        callbacks=[LLMMetricsHandler(f"groq:{model}")],
+    )
+
+
+def _create_stub_client(model, api_key, http_client, http_async_client):
+    from langgraphagenticai.LLMS.stub_llm import StubChatModel
+
+    return StubChatModel(model_name=model, callbacks=[LLMMetricsHandler(f"stub:{model}")])
+
+
+CLIENT_FACTORIES = {
+    "groq": _create_groq_client,
+    "stub": _create_stub_client,
+}
+
+
+class LLMClientPool:
+    """
+    Process-wide registry of long-lived LLM clients keyed by (provider, model, hashed API key).
+    Clients are evicted in LRU order and all of them share one keep-alive HTTP connection pool,
+    so per-user keys get their own client without paying a new TLS handshake per turn.
+    """
+    def __init__(self, max_size: int = 32, max_connections: int = 100,
+                 max_keepalive_connections: int = 20, keepalive_expiry: float = 60.0):
+        self.max_size = max_size
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._http_async_client = None
+        self._warmed_up = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            with self._lock:
+                if self._http_client is None:
+                    # Provider calls go through the process-wide rate limiter (utils/upstream.py)
+                    transport = RateLimitedTransport(httpx.HTTPTransport(limits=self._limits))
+                    self._http_client = httpx.Client(transport=transport, timeout=60.0)
+        return self._http_client
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        if self._http_async_client is None:
+            with self._lock:
+                if self._http_async_client is None:
+                    transport = AsyncRateLimitedTransport(httpx.AsyncHTTPTransport(limits=self._limits))
+                    self._http_async_client = httpx.AsyncClient(transport=transport, timeout=60.0)
+        return self._http_async_client
+
+    def get_client(self, provider: str, model: str, api_key: str):
+        """
+        Returns the pooled client for (provider, model, api key), creating it on first use.
+        """
+        if provider not in CLIENT_FACTORIES:
+            raise ValueError(f"Unsupported LLM provider: {provider}")
+
+        key = (provider, model, fingerprint(api_key))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+
+        client = CLIENT_FACTORIES[provider](model, api_key, self.http_client, self.http_async_client)
+
+        with self._lock:
+            # Another session may have created the same client in the meantime
+            existing = self._clients.get(key)
+            if existing is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return existing
+            self.misses += 1
+            self._clients[key] = client
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+        return client
+
+    def warm_up(self, provider: str, models, api_key: str):
+        """
+        Creates clients for the given models and opens a keep-alive connection to the provider.
+        Repeated calls for the same provider and key are no-ops.
+        """
+        warmup_key = (provider, fingerprint(api_key))
+        with self._lock:
+            if warmup_key in self._warmed_up:
+                return
+            self._warmed_up.add(warmup_key)
+
+        for model in models:
+            self.get_client(provider, model, api_key)
+
+        url = WARMUP_URLS.get(provider)
+        if not url:
+            return
+        try:
+            self.http_client.get(url, headers={"Authorization": f"Bearer {api_key}"})
+        except httpx.HTTPError as e:
+            logger.warning("warm-up request failed", extra={"provider": provider, "error": str(e)})
+
+    def stats(self) -> dict:
+        """
+        Returns pool size and reuse metrics.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "reuse_rate": self.hits / total if total else 0.0,
+            }
+
+
+llm_client_pool = LLMClientPool(max_size=int(os.environ.get("LLM_CLIENT_POOL_SIZE", "32")))
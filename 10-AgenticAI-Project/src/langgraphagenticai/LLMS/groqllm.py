@@ -1,6 +1,7 @@
 import os
 import streamlit as st
-from langchain_groq import ChatGroq
+from langgraphagenticai.LLMS.hedging import get_hedged_client
+from langgraphagenticai.ui.uiconfigfile import Config
 
 class GroqLLM:
     def __init__(self,user_controls_input):
@@ -13,8 +14,20 @@ class GroqLLM:
             if groq_api_key=='' and os.environ["GROQ_API_KEY"] =='':
                 st.error("Please Enter the Groq API KEY")
 
-            llm=ChatGroq(api_key=groq_api_key,model=selected_groq_model)
+            # Reuse the long-lived client (and its keep-alive connections) for this model and key;
+            # slow calls are hedged to the fallback model (see LLMS/hedging.py)
+            llm=get_hedged_client("groq",selected_groq_model,groq_api_key)
 
         except Exception as e:
             raise ValueError(f"Error Occurred With Exception: {e}")
-        return llm
\ No newline at end of file
+        return llm
+
+    def get_small_llm_model(self):
+        """
+        Returns the small model the Chatbot With Web cascade tries first (GROQ_CASCADE_MODEL
+        in uiconfigfile.ini), or None when none is configured or it is the selected model.
+        """
+        small_model=Config().get_groq_cascade_model()
+        if not small_model or small_model==self.user_controls_input["selected_groq_model"]:
+            return None
+        return get_hedged_client("groq",small_model,self.user_controls_input["GROQ_API_KEY"])
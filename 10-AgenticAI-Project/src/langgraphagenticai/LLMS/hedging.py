@@ -0,0 +1,450 @@
+import asyncio
+import os
+import queue
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from contextvars import copy_context
+from functools import lru_cache
+from typing import Any, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel, generate_from_stream
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from langgraphagenticai.LLMS.client_pool import llm_client_pool
+from langgraphagenticai.ui.uiconfigfile import Config
+from langgraphagenticai.utils.circuit_breaker import circuit_open, record_fallback
+from langgraphagenticai.utils.hashing import fingerprint
+from langgraphagenticai.utils.latency import LatencyTracker
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+
+# Set LLM_HEDGING=0 to send every LLM call exactly once
+HEDGING_ENABLED = os.environ.get("LLM_HEDGING", "1") != "0"
+# A duplicate is sent once a call is slower than this percentile of the model's recent calls
+HEDGE_PERCENTILE = float(os.environ.get("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_DELAY = float(os.environ.get("HEDGE_MIN_DELAY", "0.5"))
+# Also the delay until HEDGE_MIN_SAMPLES calls have been timed
+HEDGE_MAX_DELAY = float(os.environ.get("HEDGE_MAX_DELAY", "10"))
+HEDGE_MIN_SAMPLES = int(os.environ.get("HEDGE_MIN_SAMPLES", "20"))
+# Extra requests allowed, as a fraction of all requests, and how many may be saved up
+HEDGE_BUDGET = float(os.environ.get("HEDGE_BUDGET", "0.1"))
+HEDGE_BUDGET_BURST = float(os.environ.get("HEDGE_BUDGET_BURST", "5"))
+# Threads for sync hedges; a slow call is not hedged while all of them are busy
+HEDGE_WORKERS = int(os.environ.get("HEDGE_WORKERS", "64"))
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "ui", "uiconfigfile.ini")
+
+logger = get_logger(__name__)
+
+HEDGES_SENT = metrics_registry.counter(
+    "agenticai_llm_hedges_sent_total", "Duplicate LLM requests sent because the first one was slow.", ("model", "hedge_model"))
+HEDGES_WON = metrics_registry.counter(
+    "agenticai_llm_hedges_won_total", "Duplicate LLM requests that answered before the original.", ("model", "hedge_model"))
+HEDGES_SKIPPED = metrics_registry.counter(
+    "agenticai_llm_hedges_skipped_total", "Slow LLM requests that were not hedged because the budget was spent or the hedge threads were busy.", ("model",))
+
+# Inner calls don't inherit the graph's callbacks, or both attempts would stream tokens to the UI
+_DETACHED = {"callbacks": []}
+
+_END = object()
+
+
+class HedgeBudget:
+    """
+    Token bucket capping hedges to `ratio` of all requests: every request earns `ratio`
+    of a hedge, up to `burst` saved, and every hedge spends one.
+    """
+    def __init__(self, ratio: float = HEDGE_BUDGET, burst: float = HEDGE_BUDGET_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def available(self) -> bool:
+        return self._tokens >= 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+hedge_budget = HedgeBudget()
+# Time to the first chunk ("ttft") and to the full response ("total") per model
+hedge_latency = LatencyTracker()
+
+_executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="llm-hedge")
+# Taken before a hedge is submitted, so a hedge never waits in the executor's queue
+_hedge_slots = threading.BoundedSemaphore(HEDGE_WORKERS)
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _count(model: str, key: str):
+    with _stats_lock:
+        _stats.setdefault(model, Counter())[key] += 1
+
+
+def hedging_stats() -> dict:
+    with _stats_lock:
+        stats = {model: dict(counter) for model, counter in _stats.items()}
+    for model, counter in stats.items():
+        counter["hedge_delay_ms"] = {
+            kind: round(delay * 1000, 1)
+            for kind in ("ttft", "total")
+            if (delay := hedge_delay(model, kind)) is not None
+        }
+    return stats
+
+
+def hedge_delay(model: str, kind: str) -> float:
+    """
+    Seconds to wait for `model` before hedging: the configured percentile of its recent
+    latencies, clamped to [HEDGE_MIN_DELAY, HEDGE_MAX_DELAY].
+    """
+    key = f"{model}:{kind}"
+    if hedge_latency.count(key) < HEDGE_MIN_SAMPLES:
+        return HEDGE_MAX_DELAY
+    return min(HEDGE_MAX_DELAY, max(HEDGE_MIN_DELAY, hedge_latency.percentile(key, HEDGE_PERCENTILE)))
+
+
+def _spawn(fn, *args):
+    # The primary request gets its own thread, so the hedge pool never limits how many
+    # LLM calls run at once
+    threading.Thread(target=fn, args=args, name="llm-primary", daemon=True).start()
+
+
+def _submit_hedge(fn, *args):
+    # The caller took a slot of `_hedge_slots`; it is returned once the hedge is done
+    def run():
+        try:
+            fn(*args)
+        finally:
+            _hedge_slots.release()
+    _executor.submit(run)
+
+
+class _Attempt:
+    """
+    One request of a sync race, run in a background thread started by `start`. Its
+    chunks are queued for the caller; once cancelled it stops reading (closing the
+    stream) at the next chunk.
+    """
+    def __init__(self, produce, arrivals: queue.Queue, start=_spawn):
+        self.items = queue.Queue()
+        self.cancelled = threading.Event()
+        self.started = time.perf_counter()
+        self._arrivals = arrivals
+        self._arrived = False
+        # The node scope travels with the call, so its LLM time and tokens are still counted
+        start(copy_context().run, self._run, produce)
+
+    def _put(self, kind: str, value):
+        self.items.put((kind, value))
+        if not self._arrived:
+            self._arrived = True
+            self._arrivals.put(self)
+
+    def _run(self, produce):
+        if self.cancelled.is_set():
+            return
+        try:
+            iterator = produce()
+            try:
+                for item in iterator:
+                    if self.cancelled.is_set():
+                        return
+                    self._put("item", item)
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            self._put("end", None)
+        except Exception as e:
+            self._put("error", e)
+
+
+class _AsyncAttempt:
+    """
+    One request of an async race; `first` is the task reading its first chunk.
+    """
+    def __init__(self, iterator):
+        self.iterator = iterator
+        self.started = time.perf_counter()
+        self.first = asyncio.ensure_future(anext(iterator, _END))
+
+    async def close(self):
+        # Cancelling the pending read aborts the HTTP request
+        self.first.cancel()
+        with suppress(BaseException):
+            await self.first
+        with suppress(Exception):
+            await self.iterator.aclose()
+
+
+class HedgedChatModel(BaseChatModel):
+    """
+    Chat model that hedges slow calls. When `primary` hasn't answered (or, when streaming,
+    sent its first chunk) within `hedge_delay`, the same request is sent to `hedge`
+    (a faster fallback model, or the same model when None). The first response wins and
+    the other request is cancelled. While the primary model's circuit breaker is open,
+    calls go straight to the fallback model.
+
+    Async calls are cancelled outright. Sync calls are streamed, also when the caller
+    doesn't stream, so the request that lost stops at its next chunk and closes its
+    connection. Sync calls that can be hedged run on their own thread while the caller
+    waits for the race, and sync hedges run on `HEDGE_WORKERS` threads; calls that can't
+    be hedged stay on the caller's thread. Hedges are capped by `hedge_budget`.
+    """
+    primary: Any
+    hedge: Optional[Any] = None
+    model_name: str
+    hedge_model_name: str = ""
+    provider: str = ""
+
+    @property
+    def _llm_type(self) -> str:
+        return "hedged"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.model_copy(update={
+            "primary": self.primary.bind_tools(tools, **kwargs),
+            "hedge": self.hedge.bind_tools(tools, **kwargs) if self.hedge is not None else None,
+        })
+
+    def _fallback(self):
+        """
+        Returns the fallback model when the primary's circuit is open, else None.
+        """
+        breaker = f"{self.provider}:{self.model_name}"
+        if self.hedge is None or not circuit_open(breaker):
+            return None
+        _count(self.model_name, "circuit_fallback")
+        record_fallback(breaker, "fallback_model")
+        return self.hedge
+
+    def _start(self, kind: str):
+        """
+        Counts the request and returns the hedge delay, or None when no hedge can be sent.
+        """
+        _count(self.model_name, "requests")
+        hedge_budget.deposit()
+        if not HEDGING_ENABLED or not hedge_budget.available():
+            return None
+        return hedge_delay(self.model_name, kind)
+
+    def _hedge_sent(self):
+        _count(self.model_name, "hedged")
+        HEDGES_SENT.inc(model=self.model_name, hedge_model=self.hedge_model_name)
+
+    def _finish(self, kind: str, primary, winner, attempts: int, primary_failed: bool):
+        if not primary_failed:
+            # For a primary that lost this is a lower bound, which still moves the percentile up
+            hedge_latency.record(f"{self.model_name}:{kind}", time.perf_counter() - primary.started)
+        if attempts > 1 and winner is not primary:
+            _count(self.model_name, "hedge_won")
+            HEDGES_WON.inc(model=self.model_name, hedge_model=self.hedge_model_name)
+
+    def _skip(self, reason: str = "budget"):
+        _count(self.model_name, f"skipped_{reason}")
+        HEDGES_SKIPPED.inc(model=self.model_name)
+
+    def _race(self, produce_for, kind: str):
+        """
+        Yields the items of whichever model produces its first item first.
+        `produce_for(model)` returns an iterator for one attempt.
+        """
+        fallback = self._fallback()
+        if fallback is not None:
+            yield from produce_for(fallback)
+            return
+        delay = self._start(kind)
+        if delay is None:
+            started = time.perf_counter()
+            for i, item in enumerate(produce_for(self.primary)):
+                if i == 0:
+                    hedge_latency.record(f"{self.model_name}:{kind}", time.perf_counter() - started)
+                yield item
+            return
+
+        arrivals = queue.Queue()
+        primary = _Attempt(lambda: produce_for(self.primary), arrivals)
+        attempts = [primary]
+        try:
+            try:
+                winner = arrivals.get(timeout=delay)
+            except queue.Empty:
+                winner = None
+                if not _hedge_slots.acquire(blocking=False):
+                    self._skip("busy")
+                elif hedge_budget.try_spend():
+                    attempts.append(_Attempt(lambda: produce_for(self.hedge or self.primary), arrivals,
+                                             start=_submit_hedge))
+                    self._hedge_sent()
+                else:
+                    _hedge_slots.release()
+                    self._skip()
+
+            failed = []
+            while True:
+                if winner is None:
+                    winner = arrivals.get()
+                event, value = winner.items.get()
+                # An attempt that failed first doesn't win while another one is still running
+                if event == "error" and len(failed) + 1 < len(attempts):
+                    failed.append(winner)
+                    winner = None
+                    continue
+                break
+            for attempt in attempts:
+                if attempt is not winner:
+                    attempt.cancelled.set()
+            self._finish(kind, primary, winner, len(attempts),
+                         primary in failed or (winner is primary and event == "error"))
+
+            while True:
+                if event == "error":
+                    raise value
+                if event == "end":
+                    return
+                yield value
+                event, value = winner.items.get()
+        finally:
+            for attempt in attempts:
+                attempt.cancelled.set()
+
+    async def _arace(self, produce_for, kind: str):
+        """
+        Async variant of `_race`; `produce_for(model)` returns an async iterator.
+        """
+        fallback = self._fallback()
+        if fallback is not None:
+            async for item in produce_for(fallback):
+                yield item
+            return
+        delay = self._start(kind)
+        if delay is None:
+            started = time.perf_counter()
+            first = True
+            async for item in produce_for(self.primary):
+                if first:
+                    first = False
+                    hedge_latency.record(f"{self.model_name}:{kind}", time.perf_counter() - started)
+                yield item
+            return
+
+        primary = _AsyncAttempt(produce_for(self.primary))
+        attempts = [primary]
+        try:
+            done, _ = await asyncio.wait({primary.first}, timeout=delay)
+            if not done:
+                if hedge_budget.try_spend():
+                    attempts.append(_AsyncAttempt(produce_for(self.hedge or self.primary)))
+                    self._hedge_sent()
+                else:
+                    self._skip()
+
+            racing = {attempt.first: attempt for attempt in attempts}
+            failed, winner = [], None
+            while winner is None:
+                done, _ = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    attempt = racing.pop(task)
+                    if task.exception() is not None and racing:
+                        failed.append(attempt)
+                        continue
+                    winner = attempt
+                    break
+            for attempt in attempts:
+                if attempt is not winner:
+                    await attempt.close()
+            self._finish(kind, primary, winner, len(attempts),
+                         primary in failed or (winner is primary and winner.first.exception() is not None))
+
+            first = winner.first.result()
+            if first is _END:
+                return
+            yield first
+            async for item in winner.iterator:
+                yield item
+        finally:
+            for attempt in attempts:
+                await attempt.close()
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        # Streamed underneath: a blocking invoke that lost the race couldn't be aborted and
+        # would be paid for in full
+        return generate_from_stream(self._stream(messages, stop=stop, **kwargs))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        async def produce(model):
+            yield await model.ainvoke(messages, config=_DETACHED, stop=stop, **kwargs)
+
+        messages_out = [message async for message in self._arace(produce, "total")]
+        return ChatResult(generations=[ChatGeneration(message=messages_out[0])])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        for chunk in self._race(lambda model: model.stream(messages, config=_DETACHED, stop=stop, **kwargs), "ttft"):
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        async for chunk in self._arace(lambda model: model.astream(messages, config=_DETACHED, stop=stop, **kwargs), "ttft"):
+            yield ChatGenerationChunk(message=chunk)
+
+
+@lru_cache(maxsize=None)
+def configured_hedge_model(provider: str) -> Optional[str]:
+    """
+    The fallback model hedges go to (GROQ_HEDGE_MODEL in uiconfigfile.ini), or None to
+    hedge with the same model. Only Groq has a configured fallback. Read once per process.
+    """
+    if provider != "groq":
+        return None
+    config = Config(CONFIG_FILE)
+    model = config.get_groq_hedge_model()
+    if model and model not in config.get_groq_model_options():
+        logger.warning("hedge model is not in GROQ_MODEL_OPTIONS, hedging with the same model", extra={"model": model})
+        return None
+    return model
+
+
+_hedged_clients = OrderedDict()  # (provider, model, hashed key, hedge model) -> HedgedChatModel
+_hedged_clients_lock = threading.Lock()
+
+
+def get_hedged_client(provider: str, model: str, api_key: str, hedge_model: Optional[str] = None):
+    """
+    Returns the pooled client for (provider, model, api key) wrapped in a HedgedChatModel,
+    or the client itself when hedging is disabled. Wrappers are reused like the clients
+    (same LRU size as `llm_client_pool`).
+    """
+    if not HEDGING_ENABLED:
+        return llm_client_pool.get_client(provider, model, api_key)
+    hedge_model = hedge_model or configured_hedge_model(provider)
+    key = (provider, model, fingerprint(api_key), hedge_model)
+    with _hedged_clients_lock:
+        wrapper = _hedged_clients.get(key)
+        if wrapper is not None:
+            _hedged_clients.move_to_end(key)
+            return wrapper
+
+    client = llm_client_pool.get_client(provider, model, api_key)
+    hedge = None
+    if hedge_model and hedge_model != model:
+        hedge = llm_client_pool.get_client(provider, hedge_model, api_key)
+    wrapper = HedgedChatModel(primary=client, hedge=hedge, model_name=model, hedge_model_name=hedge_model or model,
+                              provider=provider)
+    with _hedged_clients_lock:
+        wrapper = _hedged_clients.setdefault(key, wrapper)
+        while len(_hedged_clients) > llm_client_pool.max_size:
+            _hedged_clients.popitem(last=False)
+    return wrapper
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import time
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class StubChatModel(BaseChatModel):
+    """
+    Offline chat model for load tests and benchmarks.
+    Answers with `tokens` words after `ttft` seconds, streaming one word every
+    `token_interval` seconds, so latency looks like a real provider without any network.
+    The async methods sleep on the event loop instead of blocking it.
+
+    With `tool_calls` set, a model bound to tools calls the first one on every user
+    turn (after `ttft`) and answers once the tool result is back, like a model that
+    searches before answering. Otherwise it never calls tools.
+    """
+    model_name: str = "stub"
+    ttft: float = float(os.environ.get("STUB_LLM_TTFT", "0.2"))
+    tokens: int = int(os.environ.get("STUB_LLM_TOKENS", "50"))
+    token_interval: float = float(os.environ.get("STUB_LLM_TOKEN_INTERVAL", "0.01"))
+    tool_calls: bool = os.environ.get("STUB_LLM_TOOL_CALLS", "0") == "1"
+    bound_tools: list = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def bind_tools(self, tools, **kwargs):
+        if not self.tool_calls:
+            return self
+        names = [convert_to_openai_tool(tool)["function"]["name"] for tool in tools]
+        return self.model_copy(update={"bound_tools": names})
+
+    def _tool_call(self, messages):
+        if not self.bound_tools or not messages or not isinstance(messages[-1], HumanMessage):
+            return None
+        query = messages[-1].content if isinstance(messages[-1].content, str) else str(messages[-1].content)
+        # Deterministic id: the position of the call in the conversation
+        return {"name": self.bound_tools[0], "args": {"query": query[:200]}, "id": f"call_stub_{len(messages)}"}
+
+    def _words(self, messages) -> list:
+        last = messages[-1].content if messages else ""
+        prompt = last if isinstance(last, str) else str(last)
+        words = [f"Stub answer to: {prompt[:80]}"]
+        words += [f"token{i}" for i in range(1, self.tokens)]
+        return words
+
+    def _tool_call_chunk(self, call: dict) -> ChatGenerationChunk:
+        return ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[
+            {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": 0}
+        ]))
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        call = self._tool_call(messages)
+        if call:
+            time.sleep(self.ttft)
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="", tool_calls=[call]))])
+        time.sleep(self.ttft + self.token_interval * self.tokens)
+        message = AIMessage(content=" ".join(self._words(messages)))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        call = self._tool_call(messages)
+        if call:
+            await asyncio.sleep(self.ttft)
+            return ChatResult(generations=[ChatGeneration(message=AIMessage(content="", tool_calls=[call]))])
+        await asyncio.sleep(self.ttft + self.token_interval * self.tokens)
+        message = AIMessage(content=" ".join(self._words(messages)))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.ttft)
+        call = self._tool_call(messages)
+        if call:
+            yield self._tool_call_chunk(call)
+            return
+        for i, word in enumerate(self._words(messages)):
+            if i:
+                time.sleep(self.token_interval)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=word if i == 0 else f" {word}"))
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.ttft)
+        call = self._tool_call(messages)
+        if call:
+            yield self._tool_call_chunk(call)
+            return
+        for i, word in enumerate(self._words(messages)):
+            if i:
+                await asyncio.sleep(self.token_interval)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=word if i == 0 else f" {word}"))
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
@@ -0,0 +1,166 @@
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+
+from langgraphagenticai.graph.usecases import extract_answer
+from langgraphagenticai.utils.latency import LatencyTracker
+
+BATCH_CONCURRENCY = int(os.environ.get("BATCH_CONCURRENCY", "16"))
+# Items handed to abatch_as_completed at a time, so huge input files are never fully in memory
+BATCH_CHUNK_SIZE = int(os.environ.get("BATCH_CHUNK_SIZE", "5000"))
+
+
+@dataclass
+class BatchReport:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0  # completed in an earlier run (resume)
+    elapsed: float = 0.0
+    latency: LatencyTracker = field(default_factory=lambda: LatencyTracker(window=1_000_000))
+
+    def summary(self) -> dict:
+        done = self.succeeded + self.failed
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed_s": round(self.elapsed, 2),
+            "throughput_per_s": round(done / self.elapsed, 2) if self.elapsed else 0.0,
+            "p50_ms": self._percentile_ms(50),
+            "p95_ms": self._percentile_ms(95),
+            "p99_ms": self._percentile_ms(99),
+        }
+
+    def _percentile_ms(self, q: float) -> float:
+        return round(self.latency.percentile("item", q, 0.0) * 1000, 1)
+
+
+class BatchRunner:
+    """
+    Drives a compiled (async) graph over many independent prompts with bounded concurrency.
+
+    Items go through `abatch_as_completed`, so each result is handed to `on_result`
+    as soon as it finishes rather than in input order. A failed item is reported
+    with its error instead of failing the batch.
+    """
+    def __init__(self, graph, usecase: str, max_concurrency: int = BATCH_CONCURRENCY,
+                 chunk_size: int = BATCH_CHUNK_SIZE):
+        self.usecase = usecase
+        self.max_concurrency = max_concurrency
+        self.chunk_size = chunk_size
+
+        async def run_item(item: dict) -> dict:
+            started = time.perf_counter()
+            result = {"id": item["id"]}
+            try:
+                values = await graph.ainvoke({"messages": [HumanMessage(content=item["message"])]})
+                result["answer"] = extract_answer(usecase, values)
+            except Exception as e:
+                result["error"] = str(e)
+            result["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            return result
+
+        self._run_item = RunnableLambda(run_item, name=f"batch-{usecase}")
+
+    async def run(self, items, on_result, report: BatchReport = None) -> BatchReport:
+        """
+        Runs every item (dicts with `id` and `message`) and
+        calls `on_result(result)` as each one completes.
+        """
+        report = report or BatchReport()
+        started = time.perf_counter()
+
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self.chunk_size:
+                await self._run_chunk(chunk, on_result, report)
+                chunk = []
+        if chunk:
+            await self._run_chunk(chunk, on_result, report)
+
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    async def _run_chunk(self, chunk: list, on_result, report: BatchReport):
+        report.total += len(chunk)
+        async for _, result in self._run_item.abatch_as_completed(
+            chunk, config={"max_concurrency": self.max_concurrency}
+        ):
+            report.latency.record("item", result["latency_ms"] / 1000)
+            if "error" in result:
+                report.failed += 1
+            else:
+                report.succeeded += 1
+            on_result(result)
+
+
+def read_items(path: str, done_ids: set = frozenset()):
+    """
+    Yields batch items from a JSONL file, skipping ids in `done_ids`.
+    Lines are {"message": ...} with an optional "id" (defaults to the line number).
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            item_id = str(record.get("id", line_number))
+            if item_id in done_ids:
+                continue
+            yield {"id": item_id, "message": record["message"]}
+
+
+class ProgressFile:
+    """
+    Append-only list of completed item ids, so a crashed run resumes where it stopped.
+    An item is recorded only after its result has been written, so results are
+    delivered at least once. Failed items are not recorded and are retried on the next run.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.done_ids = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done_ids = {line.strip() for line in f if line.strip()}
+        self._file = open(path, "a", encoding="utf-8")
+
+    def mark_done(self, item_id: str):
+        self._file.write(f"{item_id}\n")
+        self._file.flush()
+        self.done_ids.add(item_id)
+
+    def close(self):
+        self._file.close()
+
+
+async def run_jsonl(graph, usecase: str, input_path: str, output_path: str, progress_path: str = None,
+                    max_concurrency: int = BATCH_CONCURRENCY) -> BatchReport:
+    """
+    Runs a JSONL file through the graph, appending one JSON result per line to
+    `output_path` as items complete. Re-running with the same progress file skips
+    items that already completed.
+    """
+    progress = ProgressFile(progress_path or f"{output_path}.progress")
+    report = BatchReport(skipped=len(progress.done_ids))
+
+    with open(output_path, "a", encoding="utf-8") as output:
+        def on_result(result):
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+            output.flush()
+            if "error" not in result:
+                progress.mark_done(result["id"])
+
+        try:
+            runner = BatchRunner(graph, usecase, max_concurrency=max_concurrency)
+            await runner.run(read_items(input_path, progress.done_ids), on_result, report)
+        finally:
+            progress.close()
+    return report
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+import zlib
+
+# Words the fake articles are made of; fixed so every run summarizes the same text
+_ARTICLE_WORDS = (
+    "model agents benchmark release open weights inference latency training dataset "
+    "researchers announced evaluation reasoning multimodal context window tokens"
+).split()
+
+
+class FakeTavily:
+    """
+    Deterministic offline stand-in for the Tavily search API.
+    Every search returns `results` articles of `content_words` words after `latency`
+    seconds; the articles depend only on the query, so runs are repeatable.
+    `latency` may be changed between runs.
+    """
+    def __init__(self, latency: float = 0.3, results: int = 5, content_words: int = 80):
+        self.latency = latency
+        self.results = results
+        self.content_words = content_words
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def response(self, query: str, max_results: int = None) -> dict:
+        seed = zlib.crc32(query.encode("utf-8"))
+        results = []
+        for i in range(min(self.results, max_results or self.results)):
+            words = [_ARTICLE_WORDS[(seed + i * 7 + j) % len(_ARTICLE_WORDS)] for j in range(self.content_words)]
+            results.append({
+                "title": f"{query[:60]} ({i + 1})",
+                "url": f"https://news.example.com/{seed:08x}/{i}",
+                "content": " ".join(words).capitalize() + ".",
+                "score": round(1.0 - i * 0.05, 2),
+                "published_date": "Mon, 12 Oct 2026 09:00:00 GMT",
+            })
+        return {"query": query, "results": results}
+
+    def search(self, query: str, max_results: int = None, **kwargs) -> dict:
+        self._count()
+        if self.latency:
+            time.sleep(self.latency)
+        return self.response(query, max_results)
+
+    async def asearch(self, query: str, max_results: int = None, **kwargs) -> dict:
+        self._count()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.response(query, max_results)
+
+    def _count(self):
+        with self._lock:
+            self.calls += 1
+
+
+class _FakeTavilyClient:
+    def __init__(self, fake: FakeTavily):
+        self._fake = fake
+
+    def search(self, query: str, **kwargs) -> dict:
+        return self._fake.search(query, **kwargs)
+
+
+class _FakeAsyncTavilyClient:
+    def __init__(self, fake: FakeTavily):
+        self._fake = fake
+
+    async def search(self, query: str, **kwargs) -> dict:
+        return await self._fake.asearch(query, **kwargs)
+
+
+def install_fake_tavily(fake: FakeTavily):
+    """
+    Routes every Tavily call of the AgenticAI graphs to `fake`: the AI News node's
+    clients and the web search tool. Returns a function that restores the real clients.
+    """
+    from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
+    from langgraphagenticai.nodes import ai_news_node
+
+    # The search tool passes every search option positionally
+    def raw_results(wrapper, query, max_results=5, *args, **kwargs):
+        return fake.search(query, max_results)
+
+    async def raw_results_async(wrapper, query, max_results=5, *args, **kwargs):
+        return await fake.asearch(query, max_results)
+
+    originals = [
+        (ai_news_node, "TavilyClient", ai_news_node.TavilyClient),
+        (ai_news_node, "AsyncTavilyClient", ai_news_node.AsyncTavilyClient),
+        (TavilySearchAPIWrapper, "raw_results", TavilySearchAPIWrapper.raw_results),
+        (TavilySearchAPIWrapper, "raw_results_async", TavilySearchAPIWrapper.raw_results_async),
+    ]
+    ai_news_node.TavilyClient = lambda *args, **kwargs: _FakeTavilyClient(fake)
+    ai_news_node.AsyncTavilyClient = lambda *args, **kwargs: _FakeAsyncTavilyClient(fake)
+    TavilySearchAPIWrapper.raw_results = raw_results
+    TavilySearchAPIWrapper.raw_results_async = raw_results_async
+
+    def restore():
+        for owner, name, original in originals:
+            setattr(owner, name, original)
+    return restore
@@ -0,0 +1,228 @@
+import asyncio
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+
+from langchain_core.messages import HumanMessage
+
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+from langgraphagenticai.batch.runner import BatchReport, BatchRunner
+from langgraphagenticai.benchmarks.fakes import FakeTavily, install_fake_tavily
+from langgraphagenticai.graph.graph_builder import GraphBuilder
+from langgraphagenticai.graph.usecases import extract_answer
+from langgraphagenticai.utils.instrumentation import LLMMetricsHandler
+
+# One prompt per use case; `{n}` keeps every request distinct so no cache answers it
+PROMPTS = {
+    "Basic Chatbot": "Explain how transformers use attention, request {n}",
+    "Chatbot With Web": "Search the web for this week's AI agent releases, request {n}",
+    "AI News": "Latest open-weights model releases, request {n}",
+    "Consultant Bot": "How should a small SaaS company price its AI features? Request {n}",
+}
+
+# Metrics compared against a baseline, and whether a higher value is better
+COMPARED_METRICS = {
+    "throughput_per_s": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+}
+
+
+@dataclass
+class BenchmarkSettings:
+    concurrency: tuple = (1, 8, 32)
+    requests: int = 50
+    overhead_requests: int = 100
+    synchronous: bool = False
+    llm_ttft: float = 0.2
+    llm_tokens: int = 50
+    llm_token_interval: float = 0.005
+    search_latency: float = 0.3
+    search_results: int = 5
+    usecases: tuple = tuple(PROMPTS)
+
+
+def rss_mb() -> float:
+    """
+    Current resident set size of the process in MB (peak RSS where /proc is unavailable).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class BenchmarkSuite:
+    """
+    Runs the AgenticAI graphs offline against StubChatModel and FakeTavily.
+
+    For every use case it measures:
+    - graph overhead: sequential requests with zero model and search latency, i.e. the
+      time spent in LangGraph, the nodes, caches, limiters and instrumentation;
+    - load: `requests` requests at each concurrency level with the configured latencies,
+      reporting throughput, p50/p95/p99 latency and memory.
+    """
+    def __init__(self, settings: BenchmarkSettings):
+        self.settings = settings
+        self.tavily = FakeTavily(latency=settings.search_latency, results=settings.search_results)
+        self._request_number = 0
+        # One loop for every async scenario: module-level semaphores bind to the first loop that uses them
+        self._loop = None
+
+    def run(self, on_result=None) -> dict:
+        restore = install_fake_tavily(self.tavily)
+        self._loop = asyncio.new_event_loop()
+        try:
+            overhead, scenarios = {}, []
+            for usecase in self.settings.usecases:
+                overhead[usecase] = self.measure_overhead(usecase)
+                if on_result:
+                    on_result({"usecase": usecase, "scenario": "overhead", **overhead[usecase]})
+                for concurrency in self.settings.concurrency:
+                    result = self.measure_load(usecase, concurrency)
+                    scenarios.append(result)
+                    if on_result:
+                        on_result(result)
+        finally:
+            restore()
+            self._loop.close()
+
+        return {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "settings": asdict(self.settings),
+            },
+            "overhead": overhead,
+            "scenarios": scenarios,
+        }
+
+    def measure_overhead(self, usecase: str) -> dict:
+        self.tavily.latency = 0.0
+        graph = self._build_graph(usecase, zero_latency=True)
+        report = self._run(graph, usecase, self.settings.overhead_requests, concurrency=1)
+        summary = report.summary()
+        return {
+            "requests": report.total,
+            "failed": report.failed,
+            "mean_ms": round(report.elapsed / max(1, report.total) * 1000, 3),
+            "p50_ms": summary["p50_ms"],
+            "p95_ms": summary["p95_ms"],
+        }
+
+    def measure_load(self, usecase: str, concurrency: int) -> dict:
+        self.tavily.latency = self.settings.search_latency
+        graph = self._build_graph(usecase)
+        rss_before = rss_mb()
+        report = self._run(graph, usecase, self.settings.requests, concurrency)
+        summary = report.summary()
+        return {
+            "usecase": usecase,
+            "concurrency": concurrency,
+            "mode": "sync" if self.settings.synchronous else "async",
+            "requests": report.total,
+            "failed": report.failed,
+            "elapsed_s": summary["elapsed_s"],
+            "throughput_per_s": summary["throughput_per_s"],
+            "p50_ms": summary["p50_ms"],
+            "p95_ms": summary["p95_ms"],
+            "p99_ms": summary["p99_ms"],
+            "rss_mb": round(rss_mb(), 1),
+            "rss_delta_mb": round(rss_mb() - rss_before, 1),
+        }
+
+    def _build_graph(self, usecase: str, zero_latency: bool = False):
+        settings = self.settings
+        llm = StubChatModel(
+            model_name="benchmark",
+            ttft=0.0 if zero_latency else settings.llm_ttft,
+            tokens=settings.llm_tokens,
+            token_interval=0.0 if zero_latency else settings.llm_token_interval,
+            tool_calls=True,
+            callbacks=[LLMMetricsHandler("stub:benchmark")],
+        )
+        return GraphBuilder(llm, asynchronous=not settings.synchronous).setup_graph(usecase)
+
+    def _items(self, usecase: str, count: int) -> list:
+        items = []
+        for _ in range(count):
+            self._request_number += 1
+            items.append({"id": str(self._request_number), "message": PROMPTS[usecase].format(n=self._request_number)})
+        return items
+
+    def _run(self, graph, usecase: str, count: int, concurrency: int) -> BatchReport:
+        items = self._items(usecase, count)
+        if not self.settings.synchronous:
+            runner = BatchRunner(graph, usecase, max_concurrency=concurrency)
+            return self._loop.run_until_complete(runner.run(items, lambda result: None))
+        return self._run_sync(graph, usecase, items, concurrency)
+
+    def _run_sync(self, graph, usecase: str, items: list, concurrency: int) -> BatchReport:
+        # Threads calling `invoke`, the way concurrent Streamlit sessions drive the sync graphs
+        report = BatchReport(total=len(items))
+
+        def run_item(item):
+            started = time.perf_counter()
+            try:
+                extract_answer(usecase, graph.invoke({"messages": [HumanMessage(content=item["message"])]}))
+                ok = True
+            except Exception:
+                ok = False
+            return ok, time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for ok, seconds in executor.map(run_item, items):
+                report.latency.record("item", seconds)
+                if ok:
+                    report.succeeded += 1
+                else:
+                    report.failed += 1
+        report.elapsed = time.perf_counter() - started
+        return report
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.10) -> list:
+    """
+    Compares two benchmark results scenario by scenario. Returns one row per metric
+    with the relative change; `regression` is set when it is worse by more than `tolerance`.
+    """
+    def index(result):
+        rows = {(s["usecase"], s["mode"], s["concurrency"]): s for s in result.get("scenarios", [])}
+        for usecase, overhead in result.get("overhead", {}).items():
+            rows[(usecase, "overhead", 1)] = overhead
+        return rows
+
+    rows = []
+    current_rows, baseline_rows = index(current), index(baseline)
+    for key, scenario in current_rows.items():
+        before = baseline_rows.get(key)
+        if before is None:
+            continue
+        metrics = {"mean_ms": False, "p50_ms": False} if key[1] == "overhead" else COMPARED_METRICS
+        for metric, higher_is_better in metrics.items():
+            old, new = before.get(metric), scenario.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            rows.append({
+                "usecase": key[0],
+                "mode": key[1],
+                "concurrency": key[2],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": round(change, 4),
+                "regression": worse > tolerance,
+            })
+    return rows
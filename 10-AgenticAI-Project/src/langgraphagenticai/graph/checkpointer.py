@@ -0,0 +1,555 @@
+import asyncio
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraphagenticai.utils.blob_store import BLOB_STORE, STATE_BLOBS_ENABLED
+from langgraphagenticai.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINT_DB = os.environ.get("CHECKPOINT_DB", "./.checkpoints/agenticai.sqlite")
+# Log rows a thread may accumulate before it is compacted to its latest checkpoints
+CHECKPOINT_COMPACT_AFTER = int(os.environ.get("CHECKPOINT_COMPACT_AFTER", "200"))
+# Set to 0 when a single process uses the database, to skip the check for other processes' writes
+CHECKPOINT_SHARED = os.environ.get("CHECKPOINT_SHARED", "1") != "0"
+
+
+class WriteBehindSqliteSaver(MemorySaver):
+    """
+    Durable checkpointer that serves every read from memory and persists writes to SQLite
+    in batches on a background thread, keeping disk I/O off the response path.
+
+    SQLite holds an append-only log of `put`/`put_writes` calls indexed by thread id.
+    A thread that isn't in memory (e.g. after a restart) is resumed with one indexed
+    range scan that replays its log into memory. Threads beyond `max_threads` are
+    dropped from memory in LRU order, once their queued writes are committed, and
+    reloaded on their next use.
+
+    Every record holds the full value of the channels it changed (e.g. all messages),
+    so once a thread has `compact_after` rows in the log the writer replaces them with
+    the latest checkpoint of each namespace and its pending writes. Older checkpoints
+    of a compacted thread are no longer resumable from SQLite.
+
+    With `shared`, several processes (e.g. API workers) can use the same database: each
+    remembers the last log row it applied per thread, and a read that starts a run
+    (`get_tuple`, `list`) first replays the rows other processes committed since. A
+    process sees another's writes once they are committed, within `flush_interval`.
+    """
+    def __init__(self, path: str = CHECKPOINT_DB, batch_size: int = 64,
+                 flush_interval: float = 0.5, max_threads: int = 1000,
+                 compact_after: int = CHECKPOINT_COMPACT_AFTER, shared: bool = CHECKPOINT_SHARED):
+        super().__init__()
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_threads = max_threads
+        self.compact_after = compact_after
+        self.shared = shared
+        self._threads = OrderedDict()  # thread ids currently loaded in memory
+        self._threads_lock = threading.RLock()
+        self._load_locks = {}  # thread id -> lock held while the thread is read from SQLite
+        self._pending_by_thread = Counter()
+        self._log_rows = Counter()  # rows in the log per thread, as far as this process knows
+        self._deleted = Counter()  # thread id -> queued deletes the writer hasn't committed yet
+        self._log_seq = {}  # thread id -> last log row applied to memory
+        self._readers = threading.local()  # per-thread connection for freshness checks
+        self._replaying = threading.local()
+        self._queue = queue.Queue()
+        self.pending = 0
+        self.batches_written = 0
+        self.records_written = 0
+        self.compactions = 0
+        self.refreshes = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS checkpoint_log (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    thread_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    payload BLOB NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_checkpoint_log_thread ON checkpoint_log (thread_id, seq)"
+            )
+
+        self._writer = threading.Thread(target=self._write_loop, name="checkpoint-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    # Reads: load the thread from SQLite on first use, then serve from memory
+
+    def get_tuple(self, config):
+        self._ensure_fresh(config["configurable"]["thread_id"])
+        return super().get_tuple(config)
+
+    def list(self, config, *, filter=None, before=None, limit=None):
+        if config:
+            self._ensure_fresh(config["configurable"]["thread_id"])
+        return super().list(config, filter=filter, before=before, limit=limit)
+
+    def get_delta_channel_history(self, *, config, channels):
+        self._ensure_loaded(config["configurable"]["thread_id"])
+        return super().get_delta_channel_history(config=config, channels=channels)
+
+    # Async API: a cold thread is read from SQLite off the event loop, everything else
+    # is served from memory like the sync methods
+
+    async def aget_tuple(self, config):
+        await self._aensure_loaded(config["configurable"]["thread_id"], fresh=True)
+        return MemorySaver.get_tuple(self, config)
+
+    async def alist(self, config, *, filter=None, before=None, limit=None):
+        if config:
+            await self._aensure_loaded(config["configurable"]["thread_id"], fresh=True)
+        for item in MemorySaver.list(self, config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aget_delta_channel_history(self, *, config, channels):
+        await self._aensure_loaded(config["configurable"]["thread_id"])
+        return self.get_delta_channel_history(config=config, channels=channels)
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        await self._aensure_loaded(config["configurable"]["thread_id"])
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        await self._aensure_loaded(config["configurable"]["thread_id"])
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id):
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    # Writes: apply in memory immediately, persist in the background
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        self._ensure_loaded(thread_id)
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+
+        if not self._is_replaying():
+            # Only changed channels are stored, exactly what MemorySaver keeps on replay
+            values = checkpoint.get("channel_values", {})
+            record = (
+                self._persisted_config(config),
+                {**checkpoint, "channel_values": {k: values[k] for k in new_versions if k in values}},
+                metadata,
+                dict(new_versions),
+            )
+            self._enqueue(thread_id, "checkpoint", record)
+        return next_config
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        self._ensure_loaded(thread_id)
+        super().put_writes(config, writes, task_id, task_path)
+
+        if not self._is_replaying():
+            record = (self._persisted_config(config), list(writes), task_id, task_path)
+            self._enqueue(thread_id, "writes", record)
+
+    def delete_thread(self, thread_id):
+        with self._threads_lock:
+            load_lock = self._load_locks.setdefault(thread_id, threading.Lock())
+        # Waits for a load in progress, which would otherwise bring the rows back
+        with load_lock:
+            with self._threads_lock:
+                super().delete_thread(thread_id)
+                # Until the writer commits the DELETE, SQLite still has the old rows:
+                # the thread stays loaded (and empty) instead of being read back
+                self._deleted[thread_id] += 1
+                self._threads[thread_id] = True
+                self._threads.move_to_end(thread_id)
+                self._log_rows.pop(thread_id, None)
+                self._log_seq[thread_id] = 0
+                self._load_locks.pop(thread_id, None)
+                self._enqueue(thread_id, "delete", None)
+
+    def flush(self, timeout: float = 10.0):
+        """
+        Blocks until every queued write has been committed (or the timeout expires).
+        """
+        deadline = time.monotonic() + timeout
+        while self.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def stats(self) -> dict:
+        with self._threads_lock:
+            threads_in_memory = len(self._threads)
+        return {
+            "pending": self.pending,
+            "batches_written": self.batches_written,
+            "records_written": self.records_written,
+            "compactions": self.compactions,
+            "refreshes": self.refreshes,
+            "threads_in_memory": threads_in_memory,
+        }
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _persisted_config(self, config):
+        configurable = config["configurable"]
+        return {
+            "configurable": {
+                "thread_id": configurable["thread_id"],
+                "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                "checkpoint_id": configurable.get("checkpoint_id"),
+            }
+        }
+
+    def _is_replaying(self) -> bool:
+        return getattr(self._replaying, "active", False)
+
+    def _enqueue(self, thread_id, kind, record):
+        with self._threads_lock:
+            self.pending += 1
+            self._pending_by_thread[thread_id] += 1
+        # Serialization happens on the writer thread, not in the request
+        self._queue.put((thread_id, kind, record))
+
+    async def _aensure_loaded(self, thread_id, fresh: bool = False):
+        if fresh and self.shared:
+            # The freshness check is a SQLite query: keep it off the event loop too
+            await asyncio.to_thread(self._ensure_fresh, thread_id)
+            return
+        with self._threads_lock:
+            if thread_id in self._threads:
+                self._threads.move_to_end(thread_id)
+                return
+        await asyncio.to_thread(self._ensure_loaded, thread_id)
+
+    def _ensure_fresh(self, thread_id):
+        self._ensure_loaded(thread_id)
+        if self.shared:
+            self._refresh(thread_id)
+
+    def _ensure_loaded(self, thread_id):
+        with self._threads_lock:
+            if thread_id in self._threads:
+                self._threads.move_to_end(thread_id)
+                return
+            if self._deleted[thread_id]:
+                # Deleted, but the DELETE isn't committed: the rows in SQLite are stale
+                self._threads[thread_id] = True
+                self._log_seq[thread_id] = 0
+                self._evict()
+                return
+            load_lock = self._load_locks.setdefault(thread_id, threading.Lock())
+
+        # Only requests for this thread wait while it is read from SQLite
+        with load_lock:
+            with self._threads_lock:
+                if thread_id in self._threads:
+                    self._threads.move_to_end(thread_id)
+                    return
+            rows, last_seq = self._load_thread(thread_id)
+            with self._threads_lock:
+                self._threads[thread_id] = True
+                self._load_locks.pop(thread_id, None)
+                self._log_rows[thread_id] = rows
+                self._log_seq[thread_id] = last_seq
+                self._evict()
+
+    def _refresh(self, thread_id):
+        """
+        Replays the log rows other processes committed for a loaded thread since this
+        process last applied its log. Records are idempotent, so replaying this process's
+        own rows (or another process's compacted rows) leaves the thread as it was.
+        """
+        with self._threads_lock:
+            # Queued writes of this process would conflict; they win until committed
+            if self._pending_by_thread[thread_id] or self._deleted[thread_id]:
+                return
+            load_lock = self._load_locks.setdefault(thread_id, threading.Lock())
+
+        with load_lock:
+            with self._threads_lock:
+                if thread_id not in self._threads:
+                    return
+                applied = self._log_seq.get(thread_id, 0)
+            conn = self._reader()
+            latest = conn.execute(
+                "SELECT MAX(seq) FROM checkpoint_log WHERE thread_id = ?", (thread_id,)
+            ).fetchone()[0]
+            if latest is None:
+                if applied:
+                    # Deleted by another process
+                    MemorySaver.delete_thread(self, thread_id)
+                    self._note_refresh(thread_id, 0, 0)
+                return
+            if latest <= applied:
+                return
+
+            rows = conn.execute(
+                "SELECT seq, kind, type, payload FROM checkpoint_log WHERE thread_id = ? AND seq > ? ORDER BY seq",
+                (thread_id, applied),
+            ).fetchall()
+            self._replaying.active = True
+            try:
+                self._replay(self, rows)
+            finally:
+                self._replaying.active = False
+            self._note_refresh(thread_id, rows[-1][0] if rows else latest, len(rows))
+
+    def _note_refresh(self, thread_id, last_seq, rows):
+        with self._threads_lock:
+            self._load_locks.pop(thread_id, None)
+            self._log_seq[thread_id] = last_seq
+            self._log_rows[thread_id] = self._log_rows[thread_id] + rows if last_seq else 0
+            self.refreshes += 1
+        logger.debug("thread refreshed from the log", extra={"thread_id": thread_id, "rows": rows})
+
+    def _reader(self):
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = self._readers.conn = self._connect()
+        return conn
+
+    def _evict(self):
+        # Threads with queued writes stay: reloading them from SQLite would lose those writes
+        for thread_id in [t for t in self._threads if not self._pending_by_thread[t]]:
+            if len(self._threads) <= self.max_threads:
+                break
+            del self._threads[thread_id]
+            self._log_rows.pop(thread_id, None)
+            self._log_seq.pop(thread_id, None)
+            # Memory only: the thread stays in SQLite and is reloaded on demand
+            MemorySaver.delete_thread(self, thread_id)
+
+    def _read_log(self, conn, thread_id) -> list:
+        return conn.execute(
+            "SELECT seq, kind, type, payload FROM checkpoint_log WHERE thread_id = ? ORDER BY seq",
+            (thread_id,),
+        ).fetchall()
+
+    def _replay(self, saver, rows):
+        """
+        Applies logged records to `saver` (this saver or a scratch MemorySaver) and
+        returns them decoded as (seq, kind, record) tuples.
+        """
+        records = []
+        for seq, kind, type_, payload in rows:
+            record = self.serde.loads_typed((type_, payload))
+            if kind == "checkpoint":
+                config, checkpoint, metadata, new_versions = record
+                MemorySaver.put(saver, config, checkpoint, metadata, new_versions)
+            elif kind == "writes":
+                config, writes, task_id, task_path = record
+                MemorySaver.put_writes(saver, config, [tuple(w) for w in writes], task_id, task_path)
+            records.append((seq, kind, record))
+        return records
+
+    def _load_thread(self, thread_id) -> tuple:
+        """
+        Replays the log of a thread into memory; returns its row count and last seq.
+        """
+        with self._connect() as conn:
+            rows = self._read_log(conn, thread_id)
+        if not rows:
+            return 0, 0
+
+        self._replaying.active = True
+        try:
+            self._replay(self, rows)
+        finally:
+            self._replaying.active = False
+        return len(rows), rows[-1][0]
+
+    def _max_seqs(self, conn, thread_ids) -> dict:
+        return {
+            thread_id: conn.execute(
+                "SELECT MAX(seq) FROM checkpoint_log WHERE thread_id = ?", (thread_id,)
+            ).fetchone()[0] or 0
+            for thread_id in thread_ids
+        }
+
+    def _advance_seqs(self, before: dict, after: dict):
+        """
+        After this process committed rows, marks them as applied for the threads that had
+        no rows from other processes in between (those are replayed on the next read).
+        """
+        with self._threads_lock:
+            for thread_id, last_seq in after.items():
+                if thread_id in self._threads and self._log_seq.get(thread_id, 0) >= before[thread_id]:
+                    self._log_seq[thread_id] = last_seq
+
+    def _write_loop(self):
+        conn = self._connect()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(conn, batch)
+                # Before the batch stops counting as pending, so flush() also waits for this
+                self._compact_batch_threads(conn, batch)
+            except Exception as e:
+                logger.error("checkpoint writer failed", extra={"records": len(batch), "error": str(e)})
+            finally:
+                with self._threads_lock:
+                    self.pending -= len(batch)
+                    for thread_id, _, _ in batch:
+                        self._pending_by_thread[thread_id] -= 1
+                        if not self._pending_by_thread[thread_id]:
+                            del self._pending_by_thread[thread_id]
+                    if len(self._threads) > self.max_threads:
+                        self._evict()
+
+    def _write_batch(self, conn, batch):
+        # Runs of inserts separated by deletes, so a thread deleted and written again
+        # within one batch keeps the new rows
+        steps, rows, deleted = [], [], Counter()
+        for thread_id, kind, record in batch:
+            if kind == "delete":
+                if rows:
+                    steps.append(("insert", rows))
+                    rows = []
+                steps.append(("delete", thread_id))
+                deleted[thread_id] += 1
+                continue
+            type_, payload = self.serde.dumps_typed(record)
+            rows.append((thread_id, kind, type_, payload))
+        if rows:
+            steps.append(("insert", rows))
+
+        # One transaction per batch, taking the write lock up front so the seqs read
+        # before and after the inserts bracket exactly this batch's rows
+        thread_ids = {thread_id for thread_id, _, _ in batch}
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = self._max_seqs(conn, thread_ids)
+            for step, args in steps:
+                if step == "insert":
+                    conn.executemany(
+                        "INSERT INTO checkpoint_log (thread_id, kind, type, payload) VALUES (?, ?, ?, ?)",
+                        args,
+                    )
+                else:
+                    conn.execute("DELETE FROM checkpoint_log WHERE thread_id = ?", (args,))
+            after = self._max_seqs(conn, thread_ids)
+        self._advance_seqs(before, after)
+
+        with self._threads_lock:
+            for step, args in steps:
+                if step == "insert":
+                    for thread_id, _, _, _ in args:
+                        self._log_rows[thread_id] += 1
+                else:
+                    self._log_rows.pop(args, None)
+            # Committed: reads may go back to SQLite for these threads
+            self._deleted.subtract(deleted)
+            for thread_id in deleted:
+                if self._deleted[thread_id] <= 0:
+                    del self._deleted[thread_id]
+        self.batches_written += 1
+        self.records_written += sum(len(args) for step, args in steps if step == "insert")
+
+    def _compact_batch_threads(self, conn, batch):
+        for thread_id in {thread_id for thread_id, _, _ in batch}:
+            with self._threads_lock:
+                log_rows = self._log_rows[thread_id]
+            if log_rows < self.compact_after:
+                continue
+            try:
+                self._compact(conn, thread_id)
+            except Exception as e:
+                logger.error("checkpoint compaction failed", extra={"error": str(e)})
+
+    def _compact(self, conn, thread_id):
+        """
+        Replaces the log of a thread with the latest checkpoint of each namespace (with
+        all its channel values) and that checkpoint's pending writes. Runs on the writer
+        thread, the only one writing the log, so no row is added while it runs.
+        """
+        rows = self._read_log(conn, thread_id)
+        if not rows:
+            return
+        scratch = MemorySaver(serde=self.serde)
+        records = self._replay(scratch, rows)
+
+        compacted, latest_ids = [], set()
+        for checkpoint_ns in list(scratch.storage.get(thread_id, {})):
+            latest = scratch.get_tuple({"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns}})
+            if latest is None:
+                continue
+            latest_ids.add((checkpoint_ns, latest.checkpoint["id"]))
+            config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns, "checkpoint_id": None}}
+            record = (config, latest.checkpoint, latest.metadata, dict(latest.checkpoint["channel_versions"]))
+            compacted.append(("checkpoint",) + self.serde.dumps_typed(record))
+        for _, kind, record in records:
+            configurable = record[0]["configurable"]
+            if kind == "writes" and (configurable["checkpoint_ns"], configurable["checkpoint_id"]) in latest_ids:
+                compacted.append(("writes",) + self.serde.dumps_typed(record))
+
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = self._max_seqs(conn, [thread_id])
+            conn.execute("DELETE FROM checkpoint_log WHERE thread_id = ? AND seq <= ?", (thread_id, rows[-1][0]))
+            conn.executemany(
+                "INSERT INTO checkpoint_log (thread_id, kind, type, payload) VALUES (?, ?, ?, ?)",
+                [(thread_id,) + row for row in compacted],
+            )
+            after = self._max_seqs(conn, [thread_id])
+        self._advance_seqs(before, after)
+        with self._threads_lock:
+            self._log_rows[thread_id] = len(compacted)
+        self.compactions += 1
+
+
+_checkpointer = None
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> WriteBehindSqliteSaver:
+    """
+    Returns the process-wide durable checkpointer.
+    """
+    global _checkpointer
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            _checkpointer = WriteBehindSqliteSaver(CHECKPOINT_DB)
+            if STATE_BLOBS_ENABLED and BLOB_STORE == "memory":
+                logger.warning("checkpoints survive restarts but their blobs don't; set BLOB_STORE=disk "
+                               "to resume threads with offloaded values after a restart",
+                               extra={"blob_store": BLOB_STORE})
+        return _checkpointer
+
+
+def flush_checkpointer():
+    """
+    Waits for the queued writes of the process-wide checkpointer, if one was created.
+    """
+    with _checkpointer_lock:
+        checkpointer = _checkpointer
+    if checkpointer is not None:
+        checkpointer.flush()
+
+
+def checkpointer_stats():
+    """
+    Stats of the process-wide checkpointer, or None if no request has created it yet.
+    """
+    with _checkpointer_lock:
+        checkpointer = _checkpointer
+    return checkpointer.stats() if checkpointer is not None else None
@@ -2,16 +2,24 @@
 from langgraph.graph import StateGraph
 from langgraphagenticai.state.state import State
 from langgraph.graph import START,END
-from langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode
-from langgraphagenticai.tools.search_tool import get_tools,create_tool_node
-from langgraph.prebuilt import tools_condition,ToolNode
-from langgraphagenticai.nodes.chatbot_with_Tool_node import ChatbotWithToolNode
-from langgraphagenticai.nodes.ai_news_node import AINewsNode
-from langgraphagenticai.nodes.consultant_bot_node import ConsultantBotNode
+from langgraphagenticai.graph.usecases import COALESCE_KEYS, load_usecase
+from langgraphagenticai.utils.instrumentation import instrument_node
+import os
+
+# Set COALESCE_REQUESTS=0 to stop identical in-flight requests from sharing one run
+COALESCE_REQUESTS = os.environ.get("COALESCE_REQUESTS", "1") != "0"
 
 class GraphBuilder:
-    def __init__(self,model):
+    def __init__(self,model,asynchronous=False,small_model=None):
+        """
+        When `asynchronous` is True the graph is built from the async node variants,
+        so it must be run with `ainvoke`/`astream` on an event loop.
+        With a `small_model`, Chatbot With Web tries it before `model` (see CascadeChatbotNode).
+        """
         self.llm=model
+        self.small_llm=small_model
+        self.asynchronous=asynchronous
+        self.usecase=None
         self.graph_builder=StateGraph(State)
 
     def basic_chatbot_build_graph(self):
@@ -21,10 +29,13 @@ class GraphBuilder:
         and integrates it into the graph. The chatbot node is set as both the 
         entry and exit point of the graph.
         """
+        ## Node modules are imported on first use (see USECASE_MODULES in graph/usecases.py)
+        from langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode
 
         self.basic_chatbot_node=BasicChatbotNode(self.llm)
 
-        self.graph_builder.add_node("chatbot",self.basic_chatbot_node.process)
+        process=self.basic_chatbot_node.aprocess if self.asynchronous else self.basic_chatbot_node.process
+        self._add_node("chatbot",process)
         
         self.graph_builder.add_edge(START,"chatbot")
         self.graph_builder.add_edge("chatbot",END)
@@ -38,6 +49,11 @@ class GraphBuilder:
         capabilities, and sets up conditional and direct edges between nodes. 
         The chatbot node is set as the entry point.
         """
+        from langgraph.prebuilt import tools_condition
+        from langgraphagenticai.tools.search_tool import get_tools,create_tool_node
+        from langgraphagenticai.nodes.chatbot_with_Tool_node import ChatbotWithToolNode
+        from langgraphagenticai.nodes.cascade_chatbot_node import CascadeChatbotNode
+
         ## Define the tool and tool node
         tools=get_tools()
         tool_node=create_tool_node(tools)
@@ -45,13 +61,19 @@ class GraphBuilder:
         ## Define the LLM
         llm=self.llm
 
-        ## Define the chatbot node
+        ## Define the chatbot node: small model first when a cascade model is configured
 
-        obj_chatbot_with_node=ChatbotWithToolNode(llm)
-        chatbot_node=obj_chatbot_with_node.create_chatbot(tools)
+        if self.small_llm is not None:
+            obj_chatbot_with_node=CascadeChatbotNode(llm,self.small_llm)
+        else:
+            obj_chatbot_with_node=ChatbotWithToolNode(llm)
+        if self.asynchronous:
+            chatbot_node=obj_chatbot_with_node.create_async_chatbot(tools)
+        else:
+            chatbot_node=obj_chatbot_with_node.create_chatbot(tools)
         ## Add nodes
-        self.graph_builder.add_node("chatbot",chatbot_node)
-        self.graph_builder.add_node("tools",tool_node)
+        self._add_node("chatbot",chatbot_node)
+        self._add_node("tools",tool_node)
 
         # Define conditional and direct edges
         self.graph_builder.add_edge(START,"chatbot")
@@ -61,13 +83,18 @@ class GraphBuilder:
     
 
     def ai_news_builder_graph(self):
+        from langgraphagenticai.nodes.ai_news_node import AINewsNode
 
-        ai_news_node=AINewsNode(self.llm)
+        ai_news_node=AINewsNode(self.llm,coalesce_key=self._coalesce_key("AI News"))
 
         ## added the nodes
 
-        self.graph_builder.add_node("fetch_news",ai_news_node.fetch_news)
-        self.graph_builder.add_node("summarize_news",ai_news_node.summarize_news)
+        if self.asynchronous:
+            self._add_node("fetch_news",ai_news_node.afetch_news)
+            self._add_node("summarize_news",ai_news_node.asummarize_news)
+        else:
+            self._add_node("fetch_news",ai_news_node.fetch_news)
+            self._add_node("summarize_news",ai_news_node.summarize_news)
 
         #added the edges
 
@@ -83,10 +110,15 @@ class GraphBuilder:
         This method creates a single-node graph that provides comprehensive
         consultation responses across various business and technical domains.
         """
-        consultant_node = ConsultantBotNode(self.llm)
+        from langgraphagenticai.nodes.consultant_bot_node import ConsultantBotNode
+
+        consultant_node = ConsultantBotNode(self.llm, coalesce_key=self._coalesce_key("Consultant Bot"))
     
         # Add the consultation node
-        self.graph_builder.add_node("consultant", consultant_node.provide_consultation)
+        if self.asynchronous:
+            self._add_node("consultant", consultant_node.aprovide_consultation)
+        else:
+            self._add_node("consultant", consultant_node.provide_consultation)
     
         # Add edges
         self.graph_builder.add_edge(START, "consultant")
@@ -96,10 +128,26 @@ class GraphBuilder:
   
 
 
-    def setup_graph(self, usecase: str):
+    def _add_node(self, name: str, node):
+        """
+        Adds a node wrapped with per-node latency, token and error metrics (utils/instrumentation.py).
+        """
+        self.graph_builder.add_node(name, instrument_node(self.usecase, name, node))
+
+    def _coalesce_key(self, usecase: str):
+        """
+        Returns the coalescing key function configured for the use case in COALESCE_KEYS.
+        """
+        return COALESCE_KEYS.get(usecase) if COALESCE_REQUESTS else None
+
+    def setup_graph(self, usecase: str, checkpointer=None):
         """
         Sets up the graph for the selected use case.
+        With a `checkpointer` the state is saved per `thread_id` (passed in the run config),
+        so later messages on the same thread continue the conversation.
         """
+        self.usecase = usecase
+        load_usecase(usecase)
         if usecase == "Basic Chatbot":
             self.basic_chatbot_build_graph()
         elif usecase == "Chatbot With Web":
@@ -110,4 +158,4 @@ class GraphBuilder:
         elif usecase == "Consultant Bot":
             self.consultant_bot_build_graph()
 
-        return self.graph_builder.compile()
\ No newline at end of file
+        return self.graph_builder.compile(checkpointer=checkpointer)
\ No newline at end of file
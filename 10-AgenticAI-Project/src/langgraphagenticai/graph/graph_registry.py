@@ -0,0 +1,137 @@
+import itertools
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+from langgraphagenticai.graph.graph_builder import GraphBuilder
+from langgraphagenticai.utils.hashing import fingerprint
+
+# Tools each use case instantiates while its graph is built. Tavily clients read
+# their API key when they are constructed, so the key is part of the tool set.
+USECASE_TOOLS = {
+    "Basic Chatbot": (),
+    "Chatbot With Web": ("tavily_search_results_json",),
+    "AI News": ("tavily_news_search",),
+    "Consultant Bot": (),
+}
+
+
+def make_model_id(model_name: str, api_key: str = "") -> str:
+    """
+    Builds the model part of a registry key from the model name and a hash of the API key.
+    """
+    return f"{model_name}:{fingerprint(api_key)}"
+
+
+def get_tool_set(usecase: str) -> tuple:
+    """
+    Returns the tool set part of a registry key for the given use case.
+    """
+    tools = USECASE_TOOLS.get(usecase, ())
+    if not tools:
+        return ()
+    return tools + (fingerprint(os.environ.get("TAVILY_API_KEY", "")),)
+
+
+_checkpointer_tokens = weakref.WeakKeyDictionary()
+_checkpointer_counter = itertools.count(1)
+_checkpointer_tokens_lock = threading.Lock()
+
+
+def checkpointer_token(checkpointer) -> int:
+    """
+    Returns a number identifying `checkpointer` for as long as it lives. Unlike id(), it is
+    never reused by a later checkpointer.
+    """
+    if checkpointer is None:
+        return None
+    with _checkpointer_tokens_lock:
+        token = _checkpointer_tokens.get(checkpointer)
+        if token is None:
+            token = _checkpointer_tokens[checkpointer] = next(_checkpointer_counter)
+        return token
+
+
+class GraphRegistry:
+    """
+    Process-wide registry of compiled graphs keyed by (use case, model id, tool set, small model).
+    Each graph is built and compiled once and then shared by every session.
+    Sync and async graphs, and graphs compiled with different checkpointers, are cached separately.
+    Graphs hold their LLM clients, so at most `max_size` are kept and evicted in LRU order,
+    letting the client pool release the clients of per-user keys.
+    """
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        self._graphs = OrderedDict()
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_graph(self, usecase: str, model, model_id: str, tool_set: tuple = (), asynchronous: bool = False,
+                  checkpointer=None, small_model=None):
+        """
+        Returns the compiled graph for the key, building it with `model` on the first request.
+        `small_model` (the cascade's first tier) shares the API key of `model`.
+        """
+        small_model_name = getattr(small_model, "model_name", None) if small_model is not None else None
+        key = (usecase, model_id, tuple(tool_set), asynchronous, checkpointer_token(checkpointer),
+               small_model_name)
+
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                self.hits += 1
+                return graph
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Only callers that race on the same key wait for the compile
+        with key_lock:
+            with self._lock:
+                graph = self._graphs.get(key)
+                if graph is not None:
+                    self._graphs.move_to_end(key)
+                    self.hits += 1
+                    return graph
+                self.misses += 1
+
+            graph = GraphBuilder(model, asynchronous=asynchronous, small_model=small_model).setup_graph(
+                usecase, checkpointer=checkpointer)
+
+            with self._lock:
+                self._graphs[key] = graph
+                self._key_locks.pop(key, None)
+                while len(self._graphs) > self.max_size:
+                    self._graphs.popitem(last=False)
+                    self.evictions += 1
+        return graph
+
+    def stats(self) -> dict:
+        """
+        Returns hit/miss/eviction counters and the number of cached graphs.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._graphs),
+                "max_size": self.max_size,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._graphs.clear()
+            self._key_locks.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+# Shared across Streamlit sessions and reruns: modules stay imported for the process lifetime
+graph_registry = GraphRegistry(max_size=int(os.environ.get("GRAPH_REGISTRY_SIZE", "64")))
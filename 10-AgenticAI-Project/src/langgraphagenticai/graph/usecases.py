@@ -0,0 +1,110 @@
+import importlib
+import sys
+import time
+
+from langchain_core.messages import AIMessage
+
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.text import normalize_query
+
+logger = get_logger(__name__)
+
+# Use cases offered by the UI (see ui/uiconfigfile.ini) and how their answers are produced
+
+# Node whose LLM tokens make up the streamed answer, per use case
+STREAMING_NODES = {
+    "Basic Chatbot": "chatbot",
+    "Chatbot With Web": "chatbot",
+    "AI News": "summarize_news",
+    "Consultant Bot": "consultant",
+}
+
+# State key holding the final answer for use cases that don't answer through `messages`
+RESULT_KEYS = {
+    "AI News": "summary",
+    "Consultant Bot": "consultation",
+}
+
+# URL-friendly names used by the HTTP API
+USECASE_SLUGS = {
+    "basic-chatbot": "Basic Chatbot",
+    "chatbot-with-web": "Chatbot With Web",
+    "ai-news": "AI News",
+    "consultant-bot": "Consultant Bot",
+}
+
+# Modules each use case's graph needs, imported the first time the use case is built
+# so selecting "Basic Chatbot" never pays for Tavily, numpy or the tool stack.
+# Keep in sync with the local imports of the GraphBuilder method that builds the use case.
+USECASE_MODULES = {
+    "Basic Chatbot": (
+        "langgraphagenticai.nodes.basic_chatbot_node",
+    ),
+    "Chatbot With Web": (
+        "langgraph.prebuilt",
+        "langgraphagenticai.tools.search_tool",
+        "langgraphagenticai.nodes.chatbot_with_Tool_node",
+        "langgraphagenticai.nodes.cascade_chatbot_node",
+    ),
+    "AI News": (
+        "langgraphagenticai.nodes.ai_news_node",
+    ),
+    "Consultant Bot": (
+        "langgraphagenticai.nodes.consultant_bot_node",
+    ),
+}
+
+
+def load_usecase(usecase: str) -> float:
+    """
+    Imports the modules of a use case and returns the seconds it took (0 once loaded).
+    """
+    missing = [name for name in USECASE_MODULES.get(usecase, ()) if name not in sys.modules]
+    if not missing:
+        return 0.0
+    started = time.perf_counter()
+    for name in missing:
+        importlib.import_module(name)
+    elapsed = time.perf_counter() - started
+    logger.info("use case loaded", extra={"usecase": usecase, "import_ms": round(elapsed * 1000, 1)})
+    return elapsed
+
+
+def latest_query_key(state: dict):
+    """
+    Coalescing key from the latest user message, normalized so trivial variations match.
+    """
+    messages = state.get("messages") or []
+    if not messages:
+        return None
+    content = messages[-1] if isinstance(messages[-1], str) else messages[-1].content
+    return normalize_query(content) or None
+
+
+# Key function per use case for coalescing identical in-flight runs (see utils/single_flight.py).
+# A function maps a node's input state to a key (None = don't coalesce); use cases that
+# aren't listed never share runs, e.g. chatbots whose answers depend on the conversation.
+COALESCE_KEYS = {
+    "AI News": latest_query_key,
+    "Consultant Bot": latest_query_key,
+}
+
+
+def answer_message(values: dict):
+    """
+    Returns the AI message holding the final answer of a chat graph's output state, or None.
+    """
+    for message in reversed(values.get("messages", [])):
+        if isinstance(message, AIMessage) and message.content and not message.tool_calls:
+            return message
+    return None
+
+
+def extract_answer(usecase: str, values: dict) -> str:
+    """
+    Returns the final answer from a graph's output state.
+    """
+    if usecase in RESULT_KEYS:
+        return values.get(RESULT_KEYS[usecase]) or ""
+    message = answer_message(values)
+    return message.content if message is not None else ""
@@ -1,9 +1,23 @@
+import os
+import uuid
 import streamlit as st
 
 from langgraphagenticai.ui.streamlitui.loadui import LoadStreamlitUI
 from langgraphagenticai.LLMS.groqllm import GroqLLM
-from langgraphagenticai.graph.graph_builder import GraphBuilder
+from langgraphagenticai.LLMS.client_pool import llm_client_pool
+from langgraphagenticai.LLMS.hedging import hedging_stats
+from langgraphagenticai.graph.graph_registry import graph_registry, make_model_id, get_tool_set
+from langgraphagenticai.graph.checkpointer import get_checkpointer
+from langgraphagenticai.utils.upstream import limiter_stats
+from langgraphagenticai.utils.circuit_breaker import breaker_stats
+from langgraphagenticai.utils.blob_store import blob_store_stats
+from langgraphagenticai.utils.single_flight import single_flight_stats
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import start_http_server
 from langgraphagenticai.ui.streamlitui.display_result import DisplayResultStreamlit
+
+logger=get_logger(__name__)
+
 def load_langgraph_agenticai_app():
     """
     Loads and runs the LangGraph AgenticAI application with Streamlit UI.
@@ -13,6 +27,15 @@ def load_langgraph_agenticai_app():
 
     """
 
+    ## Optional Prometheus endpoint for the node metrics, once per process
+    if os.environ.get("METRICS_PORT"):
+        start_http_server(int(os.environ["METRICS_PORT"]))
+
+    ## Optional warm-up of the LLM client pool, once per process
+    warmup_models=os.environ.get("GROQ_WARMUP_MODELS","")
+    if warmup_models and os.environ.get("GROQ_API_KEY"):
+        llm_client_pool.warm_up("groq",warmup_models.split(","),os.environ["GROQ_API_KEY"])
+
     ##Load UI
     ui=LoadStreamlitUI()
     user_input=ui.load_streamlit_ui()
@@ -25,6 +48,10 @@ def load_langgraph_agenticai_app():
 
     user_message = st.chat_input("Enter your message:")
 
+    ## Conversation thread bound to this Streamlit session
+    if "thread_id" not in st.session_state:
+        st.session_state["thread_id"]=str(uuid.uuid4())
+
     if user_message:
         try:
             ## Configure The LLM's
@@ -42,13 +69,45 @@ def load_langgraph_agenticai_app():
                     st.error("Error: No use case selected.")
                     return
             
-            ## Graph Builder
+            ## Graph Registry: compiled once per (use case, model, tool set) and reused across reruns
 
-            graph_builder=GraphBuilder(model)
+            model_id=make_model_id(user_input.get("selected_groq_model"),user_input.get("GROQ_API_KEY"))
+            ## Chatbot With Web answers easy turns with a small model first (GROQ_CASCADE_MODEL)
+            small_model=obj_llm_config.get_small_llm_model() if usecase=="Chatbot With Web" else None
             try:
-                 graph=graph_builder.setup_graph(usecase)
-                 print(user_message)
-                 DisplayResultStreamlit(usecase,graph,user_message).display_result_on_ui()
+                 checkpointer=get_checkpointer()
+                 graph=graph_registry.get_graph(usecase,model,model_id,get_tool_set(usecase),checkpointer=checkpointer,
+                                                small_model=small_model)
+                 consultation_cache=None
+                 cascade=None
+                 news_prefetch=None
+                 if usecase=="Consultant Bot":
+                      ## Imported here so other use cases don't load the Consultant Bot modules
+                      from langgraphagenticai.nodes.consultant_bot_node import consultation_cache_stats
+                      consultation_cache=consultation_cache_stats()
+                 if small_model is not None:
+                      from langgraphagenticai.nodes.cascade_chatbot_node import cascade_stats
+                      cascade=cascade_stats()
+                 if usecase=="AI News":
+                      from langgraphagenticai.news.prefetch import prefetch_stats
+                      news_prefetch=prefetch_stats()
+                 logger.info("app stats",extra={
+                      "graph_registry":graph_registry.stats(),
+                      "llm_client_pool":llm_client_pool.stats(),
+                      "checkpointer":checkpointer.stats(),
+                      "blob_store":blob_store_stats(),
+                      "upstream_limiters":limiter_stats(),
+                      "circuit_breakers":breaker_stats(),
+                      "request_coalescing":single_flight_stats(),
+                      "llm_hedging":hedging_stats(),
+                      "consultation_cache":consultation_cache,
+                      "model_cascade":cascade,
+                      "news_prefetch":news_prefetch,
+                 })
+                 logger.info("user message",extra={"usecase":usecase,"chars":len(user_message)})
+                 ## One thread per use case, since each use case has its own state shape
+                 config={"configurable":{"thread_id":f"{st.session_state['thread_id']}:{usecase}"}}
+                 DisplayResultStreamlit(usecase,graph,user_message,config).display_result_on_ui()
             except Exception as e:
                  st.error(f"Error: Graph set up failed- {e}")
                  return
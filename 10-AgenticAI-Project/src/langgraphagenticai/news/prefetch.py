@@ -0,0 +1,240 @@
+import math
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from langgraphagenticai.news.search import SEARCH_BREAKER
+from langgraphagenticai.utils.circuit_breaker import circuit_open
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+from langgraphagenticai.utils.ttl_cache import TTLCache
+
+# Set NEWS_PREFETCH=0 to summarize every AI News request on demand
+NEWS_PREFETCH_ENABLED = os.environ.get("NEWS_PREFETCH", "1") != "0"
+# Seconds between prefetch rounds; a digest younger than this isn't rebuilt
+PREFETCH_INTERVAL = float(os.environ.get("NEWS_PREFETCH_INTERVAL", "300"))
+PREFETCH_TOP_K = int(os.environ.get("NEWS_PREFETCH_TOP_K", "5"))
+# Decayed request count a topic needs before it is prefetched (1.5: asked more than once lately)
+PREFETCH_MIN_REQUESTS = float(os.environ.get("NEWS_PREFETCH_MIN_REQUESTS", "1.5"))
+# Digests built per hour at most (each costs a few Tavily searches and one summary)
+PREFETCH_BUDGET = int(os.environ.get("NEWS_PREFETCH_BUDGET", "12"))
+POPULARITY_HALF_LIFE = float(os.environ.get("NEWS_POPULARITY_HALF_LIFE", "3600"))
+POPULARITY_MAX_TOPICS = int(os.environ.get("NEWS_POPULARITY_MAX_TOPICS", "1000"))
+# Seconds a digest is served to users
+DIGEST_TTL = float(os.environ.get("NEWS_DIGEST_TTL", "900"))
+DIGEST_MAX_SIZE = int(os.environ.get("NEWS_DIGEST_MAX_SIZE", "64"))
+DIGEST_PATH = os.environ.get("NEWS_DIGEST_PATH") or None
+# Digests are built with the server's own client, never with a user's API key:
+# for "groq" that is GROQ_API_KEY, and without it nothing is prefetched
+PREFETCH_PROVIDER = os.environ.get("NEWS_PREFETCH_PROVIDER", "groq")
+
+logger = get_logger(__name__)
+
+DIGEST_LOOKUPS = metrics_registry.counter(
+    "agenticai_news_digest_lookups_total", "AI News requests looked up in the prefetched digests.", ("result",))
+PREFETCH_RUNS = metrics_registry.counter(
+    "agenticai_news_prefetch_total", "AI News digests the prefetcher built, skipped or failed to build.", ("status",))
+PREFETCH_SECONDS = metrics_registry.histogram(
+    "agenticai_news_prefetch_seconds", "Time to build one prefetched AI News digest.")
+
+
+class PopularityTracker:
+    """
+    Request counts per topic that halve every `half_life` seconds, so topics that
+    stop being asked for fall out of the top. Each topic keeps the latest query text
+    and the model it was asked of, which the prefetcher reuses to rebuild its digest.
+    """
+    def __init__(self, half_life: float = POPULARITY_HALF_LIFE, max_topics: int = POPULARITY_MAX_TOPICS):
+        self.half_life = half_life
+        self.max_topics = max_topics
+        self._topics = {}  # key -> [score, updated at, query, model]
+        self._lock = threading.Lock()
+
+    def _decayed(self, entry: list, now: float) -> float:
+        return entry[0] * math.pow(0.5, (now - entry[1]) / self.half_life)
+
+    def record(self, key: str, query: str, model: str):
+        now = time.time()
+        with self._lock:
+            entry = self._topics.get(key)
+            score = self._decayed(entry, now) + 1 if entry else 1.0
+            self._topics[key] = [score, now, query, model]
+            if len(self._topics) > self.max_topics:
+                coldest = min(self._topics, key=lambda k: self._decayed(self._topics[k], now))
+                del self._topics[coldest]
+
+    def top(self, k: int, min_score: float = 0.0) -> list:
+        """
+        Returns up to `k` (key, score, query, model) tuples, most popular first.
+        """
+        now = time.time()
+        with self._lock:
+            ranked = [(key, self._decayed(entry, now), entry[2], entry[3]) for key, entry in self._topics.items()]
+        ranked = [item for item in ranked if item[1] >= min_score]
+        ranked.sort(key=lambda item: -item[1])
+        return ranked[:k]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._topics)
+
+
+class NewsPrefetcher:
+    """
+    Keeps ready-made digests (search results and summary) of the most requested AI News
+    topics, so a request on a hot topic is answered without searching or summarizing.
+
+    Every `interval` seconds a background thread rebuilds the digests of the `top_k`
+    topics with at least `min_requests` recent requests whose digest is missing or older
+    than `interval`, at most `budget` digests per hour. Rounds are skipped while the
+    Tavily circuit is open.
+
+    Digests are shared by every user of a model, so they are built with a server-owned
+    client of `provider` and the server's API key, whoever asked for the topic.
+    """
+    def __init__(self, interval: float = PREFETCH_INTERVAL, top_k: int = PREFETCH_TOP_K,
+                 min_requests: float = PREFETCH_MIN_REQUESTS, budget: int = PREFETCH_BUDGET,
+                 digest_ttl: float = DIGEST_TTL, provider: str = PREFETCH_PROVIDER):
+        self.interval = interval
+        self.top_k = top_k
+        self.min_requests = min_requests
+        self.budget = budget
+        self.digest_ttl = digest_ttl
+        self.provider = provider
+        self._nodes = {}  # model -> server-owned AINewsNode
+        self.popularity = PopularityTracker()
+        self.digests = TTLCache(ttl=digest_ttl, max_size=DIGEST_MAX_SIZE, persist_path=DIGEST_PATH,
+                                name="news-digests")
+        self._built_at = deque()  # build times within the last hour
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record(self, key: str, query: str, model: str):
+        """
+        Counts a request for the topic `key` (asked of `model`) and starts the background
+        thread on first use, if the server has credentials to build digests.
+        """
+        self.popularity.record(key, query, model)
+        if self._thread is None and self.can_build():
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._loop, name="news-prefetch", daemon=True)
+                    self._thread.start()
+
+    def lookup(self, key: str):
+        """
+        Returns the digest of `key` while it is younger than `digest_ttl`, else None.
+        """
+        digest, age = self.digests.get(key)
+        hit = digest is not None and age < self.digest_ttl
+        self._count("hits" if hit else "misses")
+        DIGEST_LOOKUPS.inc(result="hit" if hit else "miss")
+        return digest if hit else None
+
+    def run_once(self) -> int:
+        """
+        Rebuilds the stale digests of the current top topics; returns how many were built.
+        """
+        built = 0
+        for key, score, query, model in self.popularity.top(self.top_k, self.min_requests):
+            digest, age = self.digests.get(key)
+            if digest is not None and age < self.interval:
+                continue
+            if not self.can_build():
+                self._skip("no_server_key")
+                break
+            if circuit_open(SEARCH_BREAKER):
+                self._skip("circuit_open")
+                break
+            if not self._spend():
+                self._skip("budget")
+                break
+            built += self._build(key, query, model)
+        return built
+
+    def can_build(self) -> bool:
+        return self.provider != "groq" or bool(os.environ.get("GROQ_API_KEY"))
+
+    def stats(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+            now = time.time()
+            used = sum(1 for built_at in self._built_at if now - built_at < 3600)
+        lookups = counts.get("hits", 0) + counts.get("misses", 0)
+        return {
+            **counts,
+            "hit_rate": counts.get("hits", 0) / lookups if lookups else 0.0,
+            "topics": len(self.popularity),
+            "top": {key: round(score, 2) for key, score, _, _ in self.popularity.top(self.top_k)},
+            "digests": self.digests.stats()["size"],
+            "budget_left": max(0, self.budget - used),
+        }
+
+    def _server_node(self, model: str):
+        # Imported here: the AI News node imports this module
+        from langgraphagenticai.LLMS.hedging import get_hedged_client
+        from langgraphagenticai.nodes.ai_news_node import AINewsNode
+
+        with self._lock:
+            node = self._nodes.get(model)
+            if node is None:
+                llm = get_hedged_client(self.provider, model, os.environ.get("GROQ_API_KEY", ""))
+                node = self._nodes[model] = AINewsNode(llm)
+            return node
+
+    def _build(self, key: str, query: str, model: str) -> int:
+        started = time.perf_counter()
+        try:
+            digest = self._server_node(model).build_digest(query)
+        except Exception as e:
+            self._count("errors")
+            PREFETCH_RUNS.inc(status="error")
+            logger.warning("news prefetch failed", extra={"topic": key, "error": str(e)})
+            return 0
+        seconds = time.perf_counter() - started
+        PREFETCH_SECONDS.observe(seconds)
+        if digest is None:
+            self._count("empty")
+            PREFETCH_RUNS.inc(status="empty")
+            return 0
+        self.digests.set(key, digest)
+        self._count("built")
+        PREFETCH_RUNS.inc(status="built")
+        logger.info("news digest prefetched", extra={"topic": key, "seconds": round(seconds, 2),
+                                                     "articles": len(digest["news_data"])})
+        return 1
+
+    def _spend(self) -> bool:
+        now = time.time()
+        with self._lock:
+            while self._built_at and now - self._built_at[0] >= 3600:
+                self._built_at.popleft()
+            if len(self._built_at) >= self.budget:
+                return False
+            self._built_at.append(now)
+            return True
+
+    def _skip(self, reason: str):
+        self._count(f"skipped_{reason}")
+        PREFETCH_RUNS.inc(status=f"skipped_{reason}")
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counts[name] += 1
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning("news prefetch round failed", extra={"error": str(e)})
+
+
+news_prefetcher = NewsPrefetcher()
+
+
+def prefetch_stats() -> dict:
+    return {"enabled": NEWS_PREFETCH_ENABLED, **news_prefetcher.stats()}
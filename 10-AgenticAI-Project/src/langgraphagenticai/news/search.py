@@ -0,0 +1,215 @@
+import asyncio
+import math
+import os
+import random
+import re
+import threading
+import weakref
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from langgraphagenticai.utils.text import normalize_query
+from langgraphagenticai.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Bounded pool shared by every session so a burst of AI News requests can't open unbounded sockets
+FANOUT_WORKERS = int(os.environ.get("NEWS_FANOUT_WORKERS", "8"))
+_fanout_executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="news-fanout")
+# asyncio semaphores belong to one event loop, so each loop gets its own
+_fanout_semaphores = weakref.WeakKeyDictionary()
+_fanout_semaphores_lock = threading.Lock()
+
+# Circuit breaker of the Tavily client used for news searches (the web search tool has its own)
+SEARCH_BREAKER = "tavily:client"
+
+# Query parameters that only track the click and never change the article
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ocid", "cmpid")
+
+# Templates used to expand the user query; the first one matches the original single query
+SUBQUERY_TEMPLATES = (
+    "AI artificial intelligence {query} news technology",
+    "{query} latest announcement",
+    "{query} research breakthrough",
+    "{query} industry business impact",
+)
+
+# MinHash permutations (a * x + b) mod p, seeded so signatures are stable across processes
+_MERSENNE_PRIME = (1 << 61) - 1
+_NUM_PERM = 64
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_NUM_PERM)
+]
+
+
+def expand_queries(user_query: str, max_queries: int = 4) -> list:
+    """
+    Expands the user query into several news sub-queries.
+    """
+    query = normalize_query(user_query) or "ai"
+    sub_queries = []
+    for template in SUBQUERY_TEMPLATES[:max_queries]:
+        sub_query = template.format(query=query)
+        if sub_query not in sub_queries:
+            sub_queries.append(sub_query)
+    return sub_queries
+
+
+def fan_out_search(search_fn, sub_queries: list) -> list:
+    """
+    Runs `search_fn(sub_query)` for every sub-query on the shared bounded pool and
+    returns the concatenated results. Failed sub-queries are skipped unless all fail.
+    """
+    # copy_context lets the searches report their time to the calling node's metrics
+    futures = [_fanout_executor.submit(copy_context().run, search_fn, sub_query) for sub_query in sub_queries]
+    results, errors = [], []
+    for future in futures:
+        try:
+            results.extend(future.result().get("results", []))
+        except Exception as e:
+            errors.append(e)
+
+    if errors and len(errors) == len(sub_queries):
+        raise errors[0]
+    if errors:
+        logger.warning("news sub-queries failed", extra={"failed": len(errors), "total": len(sub_queries), "error": str(errors[0])})
+    return results
+
+
+async def afan_out_search(asearch_fn, sub_queries: list) -> list:
+    """
+    Async variant of `fan_out_search`; concurrency is bounded by a semaphore shared by
+    the searches of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _fanout_semaphores_lock:
+        semaphore = _fanout_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _fanout_semaphores[loop] = asyncio.Semaphore(FANOUT_WORKERS)
+
+    async def bounded(sub_query):
+        async with semaphore:
+            return await asearch_fn(sub_query)
+
+    responses = await asyncio.gather(*(bounded(q) for q in sub_queries), return_exceptions=True)
+    results, errors = [], []
+    for response in responses:
+        if isinstance(response, BaseException):
+            errors.append(response)
+        else:
+            results.extend(response.get("results", []))
+
+    if errors and len(errors) == len(sub_queries):
+        raise errors[0]
+    if errors:
+        logger.warning("news sub-queries failed", extra={"failed": len(errors), "total": len(sub_queries), "error": str(errors[0])})
+    return results
+
+
+def canonical_url(url: str) -> str:
+    """
+    Canonicalizes an article URL: lower-cased host without `www.`, no fragment,
+    no tracking parameters, sorted query string and no trailing slash.
+    """
+    parts = urlsplit((url or "").strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, urlencode(sorted(query)), ""))
+
+
+def _shingles(text: str, k: int = 5) -> set:
+    words = re.findall(r"\w+", (text or "").lower())
+    if len(words) <= k:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+
+def minhash_signature(text: str) -> tuple:
+    """
+    Returns a MinHash signature of the word 5-shingles of `text`.
+    """
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in _shingles(text)]
+    if not hashes:
+        return ()
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def estimate_similarity(sig_a: tuple, sig_b: tuple) -> float:
+    """
+    Estimates the Jaccard similarity of two MinHash signatures.
+    """
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def _published_at(item: dict):
+    value = item.get("published_date")
+    if not value:
+        return None
+    try:
+        published = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            published = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
+def rank_score(item: dict, now: datetime = None, half_life_days: float = 2.0) -> float:
+    """
+    Combines Tavily's relevance score with an exponential recency decay.
+    """
+    now = now or datetime.now(timezone.utc)
+    relevance = float(item.get("score") or 0.0)
+    published = _published_at(item)
+    if published is None:
+        recency = 0.0
+    else:
+        age_days = max(0.0, (now - published).total_seconds() / 86400)
+        recency = math.pow(0.5, age_days / half_life_days)
+    return 0.7 * relevance + 0.3 * recency
+
+
+def merge_results(results: list, max_results: int = 15, similarity_threshold: float = 0.8) -> list:
+    """
+    Ranks merged sub-query results by score and recency, then drops exact duplicates
+    (same canonical URL) and near-duplicates (syndicated copies with similar content).
+    """
+    now = datetime.now(timezone.utc)
+    ranked = sorted(results, key=lambda item: rank_score(item, now), reverse=True)
+
+    kept, seen_urls, signatures = [], set(), []
+    for item in ranked:
+        url = canonical_url(item.get("url", ""))
+        if url in seen_urls:
+            continue
+
+        signature = minhash_signature(f"{item.get('title', '')} {item.get('content', '')}")
+        if any(estimate_similarity(signature, other) >= similarity_threshold for other in signatures):
+            continue
+
+        seen_urls.add(url)
+        signatures.append(signature)
+        kept.append(item)
+        if len(kept) >= max_results:
+            break
+    return kept
@@ -65,16 +65,88 @@
 #         return state
     
 
-from tavily import TavilyClient
+import json
+import os
+
+from tavily import TavilyClient, AsyncTavilyClient
 from langchain_core.prompts import ChatPromptTemplate
 
+from langgraph.constants import TAG_NOSTREAM
+
+from langgraphagenticai.news.search import (
+    SEARCH_BREAKER, expand_queries, fan_out_search, afan_out_search, merge_results, rank_score,
+)
+from langgraphagenticai.news.prefetch import NEWS_PREFETCH_ENABLED, news_prefetcher
+from langgraphagenticai.utils.prompt_packing import PackItem, PromptPacker, context_budget
+from langgraphagenticai.utils.tokens import count_tokens
+from langgraphagenticai.utils.ttl_cache import TTLCache
+from langgraphagenticai.utils.upstream import call_upstream, acall_upstream
+from langgraphagenticai.utils.blob_store import offload, resolve
+from langgraphagenticai.utils.circuit_breaker import CircuitOpenError, record_fallback
+from langgraphagenticai.utils.single_flight import get_single_flight
+from langgraphagenticai.utils.hashing import fingerprint
+from langgraphagenticai.utils.text import normalize_query
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.instrumentation import record_error
+
+logger = get_logger(__name__)
+
+# Shared by every session: news for the same query barely changes within minutes
+news_search_cache = TTLCache(
+    ttl=float(os.environ.get("NEWS_CACHE_TTL", "300")),
+    stale_ttl=float(os.environ.get("NEWS_CACHE_STALE_TTL", "1800")),
+    max_size=int(os.environ.get("NEWS_CACHE_MAX_SIZE", "256")),
+    persist_path=os.environ.get("NEWS_CACHE_PATH") or None,
+    name="news-search-cache",
+)
+
+# Articles kept after merging the sub-queries, and results asked for per sub-query.
+# 15 articles fit one summary call on every offered model; raise both to summarize more
+# (map-reduce then takes over on models whose context they don't fit)
+MAX_ARTICLES = int(os.environ.get("NEWS_MAX_ARTICLES", "15"))
+RESULTS_PER_QUERY = int(os.environ.get("NEWS_RESULTS_PER_QUERY", "8"))
+# Above this many article tokens, summarize_news switches from one call to map-reduce;
+# unset, it is the model's context budget (see utils/prompt_packing.py)
+SINGLE_SHOT_TOKEN_LIMIT = int(os.environ["NEWS_SINGLE_SHOT_TOKENS"]) if os.environ.get("NEWS_SINGLE_SHOT_TOKENS") else None
+# Token budget of each map batch and how many map calls run in parallel
+MAP_BATCH_TOKENS = int(os.environ.get("NEWS_MAP_BATCH_TOKENS", "1500"))
+MAP_CONCURRENCY = int(os.environ.get("NEWS_MAP_CONCURRENCY", "4"))
+MAX_REDUCE_ROUNDS = 3
+
+MAP_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You condense news articles about '{query}' into notes for a later summary.
+    For every article keep one bullet with its title, date (if available), the key facts in
+    1-2 sentences and its URL. Merge articles that report the same story. Output only the bullets."""),
+    ("user", "{articles}")
+])
+
+SEARCH_UNAVAILABLE = "News search is temporarily unavailable"
+
+# Identical queries in flight at the same time share one fetch and one summary
+fetch_flights = get_single_flight("ai-news-fetch")
+summary_flights = get_single_flight("ai-news-summary")
+
+
 class AINewsNode:
-    def __init__(self, llm):
+    def __init__(self, llm, coalesce_key=None):
         """
         Initialize the AINewsNode with API keys for Tavily and GROQ.
+        `coalesce_key(state)` returns the key under which concurrent identical requests
+        share one execution (None disables coalescing).
         """
         self.tavily = TavilyClient()
+        self._async_tavily = None
         self.llm = llm
+        self.coalesce_key = coalesce_key
+
+    @property
+    def async_tavily(self):
+        """
+        Async Tavily client, created on first use by the async graph.
+        """
+        if self._async_tavily is None:
+            self._async_tavily = AsyncTavilyClient()
+        return self._async_tavily
 
     def fetch_news(self, state: dict) -> dict:
         """
@@ -87,42 +159,42 @@ class AINewsNode:
             dict: Updated state with 'news_data' key containing fetched news.
         """
         try:
-            # Extract user query from messages
-            if isinstance(state['messages'][0], str):
-                user_query = state['messages'][0]
-            else:
-                user_query = state['messages'][0].content
-            
-            print(f"Fetching news for query: {user_query}")
-            
-            # Enhanced query for better AI news results
-            enhanced_query = f"AI artificial intelligence {user_query} news technology"
-            
-            response = self.tavily.search(
-                query=enhanced_query,
-                topic="news",
-                include_answer="advanced",
-                max_results=15,
-                days=7,  # Last 7 days for recent news
-                include_domains=None  # Let Tavily choose the best sources
-            )
+            user_query = self._extract_query(state)
+            if self._serve_digest(state, user_query):
+                return state
+            logger.info("fetching news", extra={"query": user_query})
+
+            # Fan out over several sub-queries concurrently, then merge, dedupe and rank
+            def fetch():
+                results = fan_out_search(self._cached_search, expand_queries(user_query))
+                return merge_results(results, max_results=MAX_ARTICLES)
+
+            news_results = fetch_flights.do(self._flight_key(state), fetch)
+            return self._store_news(state, user_query, list(news_results))
 
-            news_results = response.get('results', [])
-            print(f"Found {len(news_results)} news articles")
-            
-            # Store both in state for the next node
-            state['news_data'] = news_results
-            state['user_query'] = user_query
-            
-            return state
-            
         except Exception as e:
-            print(f"Error in fetch_news: {e}")
-            state['news_data'] = []
-            state['user_query'] = user_query if 'user_query' in locals() else "AI news"
-            state['error'] = f"Failed to fetch news: {str(e)}"
-            return state
-    
+            return self._store_fetch_error(state, locals().get('user_query'), e)
+
+    async def afetch_news(self, state: dict) -> dict:
+        """
+        Async variant of `fetch_news` using the async Tavily client.
+        """
+        try:
+            user_query = self._extract_query(state)
+            if self._serve_digest(state, user_query):
+                return state
+            logger.info("fetching news", extra={"query": user_query})
+
+            async def fetch():
+                results = await afan_out_search(self._acached_search, expand_queries(user_query))
+                return merge_results(results, max_results=MAX_ARTICLES)
+
+            news_results = await fetch_flights.ado(self._flight_key(state), fetch)
+            return self._store_news(state, user_query, list(news_results))
+
+        except Exception as e:
+            return self._store_fetch_error(state, locals().get('user_query'), e)
+
     def summarize_news(self, state: dict) -> dict:
         """
         Summarize the fetched news using an LLM.
@@ -134,90 +206,349 @@ class AINewsNode:
             dict: Updated state with 'summary' key containing the summarized news.
         """
         try:
-            news_items = state.get('news_data', [])
-            user_query = state.get('user_query', 'AI news')
-            
-            # Check if there was an error in fetching
-            if 'error' in state:
-                state['summary'] = f"❌ {state['error']}\n\nPlease check your TAVILY API key and try again."
+            if self._summary_short_circuit(state):
                 return state
-            
-            # Check if we have news items
-            if not news_items:
-                state['summary'] = f"🔍 No recent news found for: **{user_query}**\n\n" \
-                                 f"Try these suggestions:\n" \
-                                 f"• Use more specific terms (e.g., 'OpenAI GPT news')\n" \
-                                 f"• Try broader terms (e.g., 'AI technology news')\n" \
-                                 f"• Check for recent developments in the last week"
+
+            # Loaded from the blob store only here, where the articles are read
+            news_items = resolve(state.get('news_data')) or []
+            user_query = state.get('user_query', 'AI news')
+            response = summary_flights.do(
+                self._flight_key(state, news_items),
+                lambda: self._summarize(user_query, news_items),
+            )
+            return self._store_summary(state, user_query, news_items, response)
+
+        except Exception as e:
+            return self._store_summary_error(state, e)
+
+    async def asummarize_news(self, state: dict) -> dict:
+        """
+        Async variant of `summarize_news` using `ainvoke`.
+        """
+        try:
+            if self._summary_short_circuit(state):
                 return state
 
-            print(f"Summarizing {len(news_items)} news articles")
-
-            # Create a comprehensive prompt for better summarization
-            prompt_template = ChatPromptTemplate.from_messages([
-                ("system", f"""You are an expert AI news summarizer. Create a comprehensive summary of news articles about '{user_query}' in markdown format.
-
-                Structure your response as follows:
-                
-                # 🤖 AI News Summary: {user_query}
-                
-                ## 📋 Overview
-                [Brief 2-3 sentence overview of the main themes and developments]
-                
-                ## 🔥 Key Highlights
-                [List 5-7 most important points with bullet points. Include dates when available]
-                
-                ## 📰 Recent Articles
-                [For each major article, provide:
-                - **[Article Title]** - [Date if available]
-                  - Brief summary (2-3 sentences)
-                  - [Link to article](URL)
-                ]
-                
-                ## 🎯 Key Takeaways
-                [2-3 main insights or implications]
-                
-                Guidelines:
-                - Use engaging emojis for section headers
-                - Include dates in DD/MM/YYYY format when available
-                - Focus on the most recent and relevant information
-                - Make links clickable with proper markdown formatting
-                - Keep summaries concise but informative
-                """),
-                ("user", "News articles to summarize:\n\n{articles}")
-            ])
-
-            # Format articles for the prompt
-            articles_str = ""
-            for i, item in enumerate(news_items[:10], 1):  # Limit to top 10 articles
-                title = item.get('title', 'No title')
-                content = item.get('content', 'No content')[:500]  # Limit content length
-                url = item.get('url', 'No URL')
-                date = item.get('published_date', 'No date')
-                score = item.get('score', 0)
-                
-                articles_str += f"Article {i}:\n"
-                articles_str += f"Title: {title}\n"
-                articles_str += f"Content: {content}\n"
-                articles_str += f"URL: {url}\n"
-                articles_str += f"Date: {date}\n"
-                articles_str += f"Relevance Score: {score}\n\n"
-
-            # Generate summary
-            response = self.llm.invoke(prompt_template.format(articles=articles_str))
-            
-            if response and response.content:
-                state['summary'] = response.content
-                print("Summary generated successfully")
+            news_items = resolve(state.get('news_data')) or []
+            user_query = state.get('user_query', 'AI news')
+            response = await summary_flights.ado(
+                self._flight_key(state, news_items),
+                lambda: self._asummarize(user_query, news_items),
+            )
+            return self._store_summary(state, user_query, news_items, response)
+
+        except Exception as e:
+            return self._store_summary_error(state, e)
+
+    def build_digest(self, user_query: str):
+        """
+        Fetches and summarizes `user_query` outside a graph run, for the prefetcher.
+        Searches bypass (and refresh) the search cache so the digest has the latest news.
+        Returns None when no news was found.
+        """
+        results = fan_out_search(self._fresh_search, expand_queries(user_query))
+        news_items = merge_results(results, max_results=MAX_ARTICLES)
+        if not news_items:
+            return None
+        response = self._summarize(user_query, news_items)
+        if not (response and response.content):
+            return None
+        return {"query": user_query, "summary": response.content, "news_data": news_items}
+
+    def _summarize(self, user_query: str, news_items: list):
+        logger.info("summarizing news", extra={"articles": len(news_items)})
+
+        articles, partial = self._format_articles(news_items), False
+        for _ in range(MAX_REDUCE_ROUNDS):
+            batches = self._plan_batches(articles)
+            if batches is None:
+                break
+            # Map: summarize token-bounded batches in parallel
+            logger.info("map-reduce summary", extra={"items": len(articles), "batches": len(batches)})
+            responses = self.llm.batch(
+                [self._map_prompt(user_query, batch) for batch in batches],
+                config={"max_concurrency": MAP_CONCURRENCY, "tags": [TAG_NOSTREAM]},
+            )
+            articles, partial = [PackItem(text=r.content) for r in responses], True
+
+        # Reduce (or single shot): one final call streamed to the user
+        return self.llm.invoke(self._build_summary_prompt(user_query, articles, partial))
+
+    async def _asummarize(self, user_query: str, news_items: list):
+        logger.info("summarizing news", extra={"articles": len(news_items)})
+
+        articles, partial = self._format_articles(news_items), False
+        for _ in range(MAX_REDUCE_ROUNDS):
+            batches = self._plan_batches(articles)
+            if batches is None:
+                break
+            logger.info("map-reduce summary", extra={"items": len(articles), "batches": len(batches)})
+            responses = await self.llm.abatch(
+                [self._map_prompt(user_query, batch) for batch in batches],
+                config={"max_concurrency": MAP_CONCURRENCY, "tags": [TAG_NOSTREAM]},
+            )
+            articles, partial = [PackItem(text=r.content) for r in responses], True
+
+        return await self.llm.ainvoke(self._build_summary_prompt(user_query, articles, partial))
+
+    def _flight_key(self, state: dict, news_items: list = None):
+        """
+        Key shared by identical concurrent requests, scoped to this node's LLM client
+        (same model and API key). Summaries are also keyed by the articles they cover.
+        """
+        key = self.coalesce_key(state) if self.coalesce_key else None
+        if key is None:
+            return None
+        key = f"{id(self.llm)}:{key}"
+        if news_items is not None:
+            key += ":" + fingerprint("|".join(item.get('url', '') for item in news_items))
+        return key
+
+    def _model_name(self) -> str:
+        return getattr(self.llm, "model_name", None) or type(self.llm).__name__
+
+    def _digest_key(self, user_query: str) -> str:
+        # Digests are per model: the summary is that model's output
+        return f"{self._model_name()}:{normalize_query(user_query)}"
+
+    def _serve_digest(self, state: dict, user_query: str) -> bool:
+        """
+        Counts the request towards its topic's popularity and, when the prefetcher has
+        a fresh digest of the topic, fills in the news and summary from it.
+        """
+        if not NEWS_PREFETCH_ENABLED:
+            return False
+        key = self._digest_key(user_query)
+        # Only the model is kept: digests are built with the server's client, not this node's
+        news_prefetcher.record(key, user_query, self._model_name())
+        digest = news_prefetcher.lookup(key)
+        if digest is None:
+            return False
+        logger.info("serving prefetched digest", extra={"topic": key})
+        self._store_news(state, user_query, list(digest['news_data']))
+        state['summary'] = digest['summary']
+        state['from_digest'] = True
+        return True
+
+    def _extract_query(self, state: dict) -> str:
+        # Extract user query from the latest message (earlier turns are kept by the checkpointer)
+        if isinstance(state['messages'][-1], str):
+            return state['messages'][-1]
+        return state['messages'][-1].content
+
+    def _search_params(self, sub_query: str) -> dict:
+        # Sub-queries already carry the AI news context (see `expand_queries`)
+        return dict(
+            query=sub_query,
+            topic="news",
+            max_results=RESULTS_PER_QUERY,  # Merged results are capped after dedupe
+            days=7,  # Last 7 days for recent news
+            include_domains=None  # Let Tavily choose the best sources
+        )
+
+    def _cached_search(self, sub_query: str) -> dict:
+        params = self._search_params(sub_query)
+        key = self._cache_key(params)
+        # Cache misses go through the process-wide Tavily rate limiter and circuit breaker
+        try:
+            return news_search_cache.get_or_load(
+                key,
+                lambda: call_upstream("tavily", lambda: self.tavily.search(**params), breaker=SEARCH_BREAKER),
+            )
+        except CircuitOpenError as e:
+            return self._expired_search(key, e)
+
+    async def _acached_search(self, sub_query: str) -> dict:
+        params = self._search_params(sub_query)
+        key = self._cache_key(params)
+        try:
+            return await news_search_cache.aget_or_load(
+                key,
+                lambda: acall_upstream("tavily", lambda: self.async_tavily.search(**params), breaker=SEARCH_BREAKER),
+            )
+        except CircuitOpenError as e:
+            return self._expired_search(key, e)
+
+    def _fresh_search(self, sub_query: str) -> dict:
+        params = self._search_params(sub_query)
+        result = call_upstream("tavily", lambda: self.tavily.search(**params), breaker=SEARCH_BREAKER)
+        news_search_cache.set(self._cache_key(params), result)
+        return result
+
+    def _expired_search(self, key: str, error: CircuitOpenError) -> dict:
+        """
+        While Tavily's circuit is open, serves a cached result however old it is.
+        """
+        value, _ = news_search_cache.get(key)
+        if value is None:
+            raise error
+        record_fallback(SEARCH_BREAKER, "expired_cache")
+        return value
+
+    def _cache_key(self, params: dict) -> str:
+        # The normalized query and every search parameter identify a result set
+        return json.dumps(params, sort_keys=True)
+
+    def _store_news(self, state: dict, user_query: str, news_results: list) -> dict:
+        logger.info("news fetched", extra={"articles": len(news_results)})
+
+        # Store both in state for the next node; the articles go to the blob store and the
+        # state (and every checkpoint) only carries a handle to them
+        state['news_data'] = offload(news_results)
+        state['user_query'] = user_query
+        state['error'] = None  # Clear an error left by an earlier turn on this thread
+        state['from_digest'] = False
+        return state
+
+    def _store_fetch_error(self, state: dict, user_query, e: Exception) -> dict:
+        logger.warning("fetch_news failed", extra={"error": str(e)})
+        record_error(e)
+        state['news_data'] = []
+        state['user_query'] = user_query or "AI news"
+        state['from_digest'] = False
+        if isinstance(e, CircuitOpenError):
+            state['error'] = f"{SEARCH_UNAVAILABLE}, please try again in about {e.retry_in:.0f}s."
+        else:
+            state['error'] = f"Failed to fetch news: {str(e)}"
+        return state
+
+    def _summary_short_circuit(self, state: dict) -> bool:
+        """
+        Fills in the summary without calling the LLM when fetching failed or found nothing.
+        """
+        # The summary of a prefetched digest is already in place
+        if state.get('from_digest'):
+            return True
+
+        # A BlobRef is truthy: only empty results, which stay inline, need the check below
+        news_items = state.get('news_data', [])
+        user_query = state.get('user_query', 'AI news')
+
+        # Check if there was an error in fetching
+        if state.get('error'):
+            if state['error'].startswith(SEARCH_UNAVAILABLE):
+                state['summary'] = f"❌ {state['error']}"
             else:
-                state['summary'] = f"⚠️ Failed to generate summary for: **{user_query}**\n\n" \
-                                 f"Found {len(news_items)} articles but couldn't process them. " \
-                                 f"Please try a different query or check back later."
+                state['summary'] = f"❌ {state['error']}\n\nPlease check your TAVILY API key and try again."
+            return True
+
+        # Check if we have news items
+        if not news_items:
+            state['summary'] = f"🔍 No recent news found for: **{user_query}**\n\n" \
+                             f"Try these suggestions:\n" \
+                             f"• Use more specific terms (e.g., 'OpenAI GPT news')\n" \
+                             f"• Try broader terms (e.g., 'AI technology news')\n" \
+                             f"• Check for recent developments in the last week"
+            return True
+
+        return False
+
+    def _format_articles(self, news_items: list) -> list:
+        """
+        Formats each article as a PackItem scored by relevance and recency.
+        """
+        articles = []
+        for i, item in enumerate(news_items, 1):
+            title = item.get('title', 'No title')
+            content = item.get('content', 'No content')
+            url = item.get('url', 'No URL')
+            date = item.get('published_date', 'No date')
+            score = item.get('score', 0)
+
+            text = (
+                f"Article {i}:\n"
+                f"Title: {title}\n"
+                f"URL: {url}\n"
+                f"Date: {date}\n"
+                f"Relevance Score: {score}\n"
+                f"Content: {content}"
+            )
+            articles.append(PackItem(text=text, score=rank_score(item)))
+        return articles
+
+    def _plan_batches(self, articles: list):
+        """
+        Returns token-bounded batches for a map round, or None when the articles
+        fit in a single summary call (or can't be split any further).
+        """
+        sizes = [count_tokens(article.text) for article in articles]
+        if sum(sizes) <= self._single_shot_budget() or len(articles) < 2:
+            return None
+
+        batches, current, current_tokens = [], [], 0
+        for article, size in zip(articles, sizes):
+            if current and current_tokens + size > MAP_BATCH_TOKENS:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(article)
+            current_tokens += size
+        if current:
+            batches.append(current)
+        return batches if len(batches) > 1 else None
+
+    def _single_shot_budget(self) -> int:
+        # Article tokens one summary call can take on this node's model
+        return context_budget(getattr(self.llm, "model_name", None), max_tokens=SINGLE_SHOT_TOKEN_LIMIT)
+
+    def _map_prompt(self, user_query: str, batch: list):
+        return MAP_PROMPT.format(query=user_query, articles="\n\n".join(article.text for article in batch))
+
+    def _build_summary_prompt(self, user_query: str, articles: list, partial: bool = False):
+        # Create a comprehensive prompt for better summarization
+        prompt_template = ChatPromptTemplate.from_messages([
+            ("system", f"""You are an expert AI news summarizer. Create a comprehensive summary of news articles about '{user_query}' in markdown format.
+
+            Structure your response as follows:
             
-            return state
+            # 🤖 AI News Summary: {user_query}
             
-        except Exception as e:
-            print(f"Error in summarize_news: {e}")
-            state['summary'] = f"❌ Error generating summary: {str(e)}\n\n" \
-                             f"Please try again or contact support if the issue persists."
-            return state
\ No newline at end of file
+            ## 📋 Overview
+            [Brief 2-3 sentence overview of the main themes and developments]
+            
+            ## 🔥 Key Highlights
+            [List 5-7 most important points with bullet points. Include dates when available]
+            
+            ## 📰 Recent Articles
+            [For each major article, provide:
+            - **[Article Title]** - [Date if available]
+              - Brief summary (2-3 sentences)
+              - [Link to article](URL)
+            ]
+            
+            ## 🎯 Key Takeaways
+            [2-3 main insights or implications]
+            
+            Guidelines:
+            - Use engaging emojis for section headers
+            - Include dates in DD/MM/YYYY format when available
+            - Focus on the most recent and relevant information
+            - Make links clickable with proper markdown formatting
+            - Keep summaries concise but informative
+            """),
+            ("user", "{label}:\n\n{articles}")
+        ])
+
+        # Fill the model's context budget in relevance order, cutting at sentence boundaries
+        packed = PromptPacker(self._single_shot_budget()).pack(articles)
+        logger.debug("packed news prompt", extra={"packed": len(packed.items), "items": len(articles),
+                                                  "used_tokens": packed.used_tokens, "dropped_tokens": packed.dropped_tokens})
+
+        label = "Notes condensed from the news articles to summarize" if partial else "News articles to summarize"
+        return prompt_template.format(label=label, articles=packed.text)
+
+    def _store_summary(self, state: dict, user_query: str, news_items: list, response) -> dict:
+        if response and response.content:
+            state['summary'] = response.content
+            logger.info("summary generated", extra={"chars": len(response.content)})
+        else:
+            state['summary'] = f"⚠️ Failed to generate summary for: **{user_query}**\n\n" \
+                             f"Found {len(news_items)} articles but couldn't process them. " \
+                             f"Please try a different query or check back later."
+        return state
+
+    def _store_summary_error(self, state: dict, e: Exception) -> dict:
+        logger.warning("summarize_news failed", extra={"error": str(e)})
+        record_error(e)
+        state['summary'] = f"❌ Error generating summary: {str(e)}\n\n" \
+                         f"Please try again or contact support if the issue persists."
+        return state
@@ -1,4 +1,5 @@
 from langgraphagenticai.state.state import State
+from langgraphagenticai.state.history import HistoryCompactor
 
 class BasicChatbotNode:
     """
@@ -6,9 +7,19 @@ class BasicChatbotNode:
     """
     def __init__(self,model):
         self.llm=model
+        self.history=HistoryCompactor(model)
 
     def process(self,state:State)->dict:
         """
         Processes the input state and generates a chatbot response.
+        Long conversations are sent as a rolling summary plus the latest turns.
         """
-        return {"messages":[self.llm.invoke(state['messages'])]}
\ No newline at end of file
+        prompt,updates=self.history.compact(state)
+        return {"messages":[self.llm.invoke(prompt)],**updates}
+
+    async def aprocess(self,state:State)->dict:
+        """
+        Async variant of `process` using `ainvoke`.
+        """
+        prompt,updates=await self.history.acompact(state)
+        return {"messages":[await self.llm.ainvoke(prompt)],**updates}
@@ -0,0 +1,221 @@
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+from langchain_core.messages import HumanMessage
+from langgraph.constants import TAG_NOSTREAM
+
+from langgraphagenticai.state.state import State
+from langgraphagenticai.state.history import HistoryCompactor
+from langgraphagenticai.utils.instrumentation import record_error
+from langgraphagenticai.utils.latency import LatencyTracker
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+from langgraphagenticai.utils.prompt_packing import context_budget
+from langgraphagenticai.utils.tokens import count_tokens
+
+# Questions longer than this go straight to the large model
+CASCADE_MAX_QUERY_TOKENS = int(os.environ.get("CASCADE_MAX_QUERY_TOKENS", "300"))
+# Prompt tokens (history and search results) the small model is trusted with, capped by its context window
+CASCADE_MAX_CONTEXT_TOKENS = int(os.environ.get("CASCADE_MAX_CONTEXT_TOKENS", "4000"))
+
+# Answers that admit not knowing, or knowing only up to a cutoff, are not confident
+UNCERTAIN_ANSWER = re.compile(
+    r"\b(i'?m not sure|i am not sure|i don'?t know|i do not know|i'?m unable to|i am unable to|"
+    r"i can'?t (?:provide|answer|help)|i cannot (?:provide|answer|help)|"
+    r"i don'?t have (?:access|real-time|current|up-to-date)|as of my (?:knowledge|training|last)|"
+    r"my knowledge cutoff)",
+    re.IGNORECASE,
+)
+
+logger = get_logger(__name__)
+
+CASCADE_TURNS = metrics_registry.counter(
+    "agenticai_cascade_turns_total", "Chatbot With Web turns by the model tier that answered and why.", ("tier", "reason"))
+CASCADE_SECONDS = metrics_registry.histogram(
+    "agenticai_cascade_call_seconds", "Latency of one cascade model call.", ("tier",))
+
+_stats = Counter()
+_latency = LatencyTracker()
+_stats_lock = threading.Lock()
+
+
+def _record(tier: str, reason: str):
+    CASCADE_TURNS.inc(tier=tier, reason=reason)
+    with _stats_lock:
+        _stats["turns"] += 1
+        _stats[f"{tier}:{reason}"] += 1
+        if tier == "large" and reason not in ("complex_query", "long_context"):
+            _stats["escalated"] += 1
+
+
+def cascade_stats() -> dict:
+    """
+    Turns per tier and reason, the escalation rate (turns the small model tried but
+    handed to the large one) and the latency percentiles of each tier.
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    tried_small = sum(count for key, count in stats.items() if key.startswith("small:")) + stats.get("escalated", 0)
+    stats["escalation_rate"] = stats.get("escalated", 0) / tried_small if tried_small else 0.0
+    stats["latency"] = _latency.summary()
+    return stats
+
+
+def answered_by(message):
+    """
+    Returns {"tier": "small" | "large", "model": ...} for a message a cascade answered,
+    or None for any other message.
+    """
+    if message is None:
+        return None
+    return (message.response_metadata or {}).get("cascade")
+
+
+def _text(message) -> str:
+    return message.content if isinstance(message.content, str) else str(message.content)
+
+
+class CascadeChatbotNode:
+    """
+    Chatbot with tools that answers with a small, fast model first.
+
+    The small model decides whether to search and answers easy turns, including the
+    answer after search results arrive. A turn goes to the large (selected) model when:
+    - the question is long or contains code, or the prompt is too long for the small model;
+    - the small model's answer isn't confident: empty, cut off, admitting it doesn't know,
+      or a malformed tool call;
+    - the small model fails.
+    The small model's tokens aren't streamed, since its answer may be discarded;
+    escalated answers stream from the large model as before. Every response records the
+    tier and model that wrote it under `response_metadata["cascade"]` (see `answered_by`).
+    """
+    def __init__(self, model, small_model):
+        self.llm = model
+        self.small_llm = small_model
+        self.history = HistoryCompactor(model)
+        self.small_model_name = getattr(small_model, "model_name", None) or type(small_model).__name__
+        self.large_model_name = getattr(model, "model_name", None) or type(model).__name__
+        self.small_context_tokens = context_budget(self.small_model_name, max_tokens=CASCADE_MAX_CONTEXT_TOKENS)
+
+    def _complexity(self, prompt: list):
+        """
+        Returns why the prompt should skip the small model, or None.
+        """
+        query = next((_text(m) for m in reversed(prompt) if isinstance(m, HumanMessage)), "")
+        if count_tokens(query) > CASCADE_MAX_QUERY_TOKENS or "```" in query:
+            return "complex_query"
+        if sum(count_tokens(_text(m)) for m in prompt) > self.small_context_tokens:
+            return "long_context"
+        return None
+
+    def _doubt(self, response):
+        """
+        Returns why the small model's response can't be used, or None.
+        """
+        if getattr(response, "invalid_tool_calls", None):
+            return "invalid_tool_call"
+        if response.tool_calls:
+            return None
+        text = _text(response).strip()
+        if not text:
+            return "empty"
+        if (response.response_metadata or {}).get("finish_reason") == "length":
+            return "truncated"
+        if UNCERTAIN_ANSWER.search(text):
+            return "uncertain"
+        return None
+
+    def _timed(self, tier: str, started: float):
+        seconds = time.perf_counter() - started
+        CASCADE_SECONDS.observe(seconds, tier=tier)
+        _latency.record(tier, seconds)
+
+    def _small_failed(self, e: Exception):
+        record_error(e)
+        logger.warning("small model failed, escalating", extra={"model": self.small_model_name, "error": str(e)})
+
+    def _finish(self, tier: str, reason: str, prompt: list, response):
+        """
+        Records the turn and returns the response labelled with the tier that wrote it.
+        """
+        _record(tier, reason)
+        logger.info("cascade turn", extra={
+            "tier": tier,
+            "reason": reason,
+            "tool_calls": len(response.tool_calls),
+            "prompt_messages": len(prompt),
+        })
+        model = self.small_model_name if tier == "small" else self.large_model_name
+        metadata = {**(response.response_metadata or {}), "cascade": {"tier": tier, "model": model}}
+        return response.model_copy(update={"response_metadata": metadata})
+
+    def create_chatbot(self, tools):
+        """
+        Returns a chatbot node function.
+        """
+        llm_with_tools = self.llm.bind_tools(tools)
+        small_with_tools = self.small_llm.bind_tools(tools).with_config(tags=[TAG_NOSTREAM])
+
+        def chatbot_node(state: State):
+            """
+            Tries the small model, then escalates to the large one if a check fails.
+            """
+            prompt, updates = self.history.compact(state)
+            reason = self._complexity(prompt)
+            if reason is None:
+                started = time.perf_counter()
+                try:
+                    response = small_with_tools.invoke(prompt)
+                    reason = self._doubt(response)
+                except Exception as e:
+                    self._small_failed(e)
+                    reason = "small_error"
+                self._timed("small", started)
+                if reason is None:
+                    response = self._finish("small", "confident", prompt, response)
+                    return {"messages": [response], **updates}
+
+            started = time.perf_counter()
+            response = llm_with_tools.invoke(prompt)
+            self._timed("large", started)
+            response = self._finish("large", reason, prompt, response)
+            return {"messages": [response], **updates}
+
+        return chatbot_node
+
+    def create_async_chatbot(self, tools):
+        """
+        Returns an async chatbot node function for graphs run with `ainvoke`/`astream`.
+        """
+        llm_with_tools = self.llm.bind_tools(tools)
+        small_with_tools = self.small_llm.bind_tools(tools).with_config(tags=[TAG_NOSTREAM])
+
+        async def chatbot_node(state: State):
+            """
+            Async variant: tries the small model, then escalates to the large one if a check fails.
+            """
+            prompt, updates = await self.history.acompact(state)
+            reason = self._complexity(prompt)
+            if reason is None:
+                started = time.perf_counter()
+                try:
+                    response = await small_with_tools.ainvoke(prompt)
+                    reason = self._doubt(response)
+                except Exception as e:
+                    self._small_failed(e)
+                    reason = "small_error"
+                self._timed("small", started)
+                if reason is None:
+                    response = self._finish("small", "confident", prompt, response)
+                    return {"messages": [response], **updates}
+
+            started = time.perf_counter()
+            response = await llm_with_tools.ainvoke(prompt)
+            self._timed("large", started)
+            response = self._finish("large", reason, prompt, response)
+            return {"messages": [response], **updates}
+
+        return chatbot_node
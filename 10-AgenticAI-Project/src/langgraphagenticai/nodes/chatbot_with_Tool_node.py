@@ -1,4 +1,5 @@
 from langgraphagenticai.state.state import State
+from langgraphagenticai.state.history import HistoryCompactor
 
 class ChatbotWithToolNode:
     """
@@ -6,6 +7,7 @@ class ChatbotWithToolNode:
     """
     def __init__(self,model):
         self.llm = model
+        self.history = HistoryCompactor(model)
 
 
     def create_chatbot(self, tools):
@@ -18,7 +20,22 @@ class ChatbotWithToolNode:
             """
             Chatbot logic for processing the input state and returning a response.
             """
-            return {"messages": [llm_with_tools.invoke(state["messages"])]}
+            prompt, updates = self.history.compact(state)
+            return {"messages": [llm_with_tools.invoke(prompt)], **updates}
 
         return chatbot_node
 
+    def create_async_chatbot(self, tools):
+        """
+        Returns an async chatbot node function for graphs run with `ainvoke`/`astream`.
+        """
+        llm_with_tools = self.llm.bind_tools(tools)
+
+        async def chatbot_node(state: State):
+            """
+            Async chatbot logic for processing the input state and returning a response.
+            """
+            prompt, updates = await self.history.acompact(state)
+            return {"messages": [await llm_with_tools.ainvoke(prompt)], **updates}
+
+        return chatbot_node
@@ -1,24 +1,26 @@
+import os
+import threading
+
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import AIMessage
 from typing import Dict, Any
 
-class ConsultantBotNode:
-    def __init__(self, llm):
-        self.llm = llm
-    
-    def provide_consultation(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            # Extract user query
-            if isinstance(state['messages'][0], str):
-                user_query = state['messages'][0]
-            else:
-                user_query = state['messages'][0].content
-            
-            print(f"Providing consultation for: {user_query}")
-            
-            # Define enhanced assistant prompt for direct professional advice
-            consultation_prompt = ChatPromptTemplate.from_messages([
-                ("system", """You are a professional advisor and consultant with deep expertise across multiple domains including business, technology, health, personal development, education, arts, science, relationships, career, and more.
+from langgraphagenticai.utils.embeddings import get_embedder
+from langgraphagenticai.utils.semantic_cache import SemanticCache
+from langgraphagenticai.utils.single_flight import get_single_flight
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.instrumentation import record_error
+
+logger = get_logger(__name__)
+
+CONSULTATION_CACHE_THRESHOLD = float(os.environ.get("CONSULTATION_CACHE_THRESHOLD", "0.85"))
+CONSULTATION_CACHE_TTL = float(os.environ.get("CONSULTATION_CACHE_TTL", "86400"))
+CONSULTATION_CACHE_MAX_SIZE = int(os.environ.get("CONSULTATION_CACHE_MAX_SIZE", "2048"))
+CONSULTATION_CACHE_ENABLED = os.environ.get("CONSULTATION_CACHE", "1") != "0"
+
+# Enhanced assistant prompt for direct professional advice, built once at import
+CONSULTATION_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are a professional advisor and consultant with deep expertise across multiple domains including business, technology, health, personal development, education, arts, science, relationships, career, and more.
 
 Your role is to provide direct, comprehensive, and actionable professional advice immediately without asking follow-up questions. You should assume the user wants expert guidance based on their question as presented.
 
@@ -61,29 +63,139 @@ You: Starting a successful business requires careful planning and execution. Her
 The key to success is starting with thorough preparation and maintaining focus on solving real customer problems while managing cash flow carefully.
 
 Remember: Provide comprehensive, professional advice without asking questions."""),
-                ("user", "{query}")
-            ])
-            
+    ("user", "{query}")
+])
+
+
+# Identical questions in flight at the same time share one LLM call
+consultation_flights = get_single_flight("consultation")
+
+_consultation_caches = {}
+_consultation_caches_lock = threading.Lock()
+_embedder = None
+
+
+def get_consultation_cache(model_name: str) -> SemanticCache:
+    """
+    Returns the process-wide semantic cache of consultations for a model.
+    The embedder is shared by every model's cache.
+    """
+    global _embedder
+    with _consultation_caches_lock:
+        cache = _consultation_caches.get(model_name)
+        if cache is None:
+            if _embedder is None:
+                _embedder = get_embedder()
+            cache = SemanticCache(
+                embedder=_embedder,
+                threshold=CONSULTATION_CACHE_THRESHOLD,
+                ttl=CONSULTATION_CACHE_TTL,
+                max_size=CONSULTATION_CACHE_MAX_SIZE,
+                name=f"consultation-cache-{model_name}",
+            )
+            _consultation_caches[model_name] = cache
+        return cache
+
+
+def consultation_cache_stats() -> dict:
+    with _consultation_caches_lock:
+        caches = dict(_consultation_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+class ConsultantBotNode:
+    def __init__(self, llm, coalesce_key=None):
+        """
+        `coalesce_key(state)` returns the key under which concurrent identical questions
+        share one LLM call (None disables coalescing).
+        """
+        self.llm = llm
+        self.coalesce_key = coalesce_key
+        model_name = getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+        self.cache = get_consultation_cache(model_name) if CONSULTATION_CACHE_ENABLED else None
+    
+    def provide_consultation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            user_query = self._extract_query(state)
+            logger.info("providing consultation", extra={"query": user_query})
+
+            # Near-identical questions are answered from the semantic cache
+            vector = self.cache.embed(user_query) if self.cache else None
+            cached = self.cache.lookup(vector, user_query) if self.cache else None
+            if cached:
+                state['consultation'] = cached
+                return state
+
             # Generate consultation response
-            response = self.llm.invoke(consultation_prompt.format(query=user_query))
-            
-            if response and response.content:
-                state['consultation'] = response.content
-                print("Consultation generated successfully.")
-                print(f"Consultation length: {len(response.content)} characters")
-            else:
-                state['consultation'] = self._generate_fallback_response(user_query)
-            
-            return state
+            def generate():
+                response = self.llm.invoke(CONSULTATION_PROMPT.format(query=user_query))
+                self._cache_consultation(user_query, vector, response)
+                return response
+
+            response = consultation_flights.do(self._flight_key(state), generate)
+            return self._store_consultation(state, user_query, response)
         
         except Exception as e:
-            print(f"Error in provide_consultation: {e}")
-            state['consultation'] = (
-                f"❌ Consultation Error: {str(e)}\n\n"
-                "I'm sorry, but I ran into an issue while preparing your consultation. "
-                "Please try again or rephrase your question."
-            )
-            return state
+            return self._store_error(state, e)
+
+    async def aprovide_consultation(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of `provide_consultation` using `ainvoke`.
+        """
+        try:
+            user_query = self._extract_query(state)
+            logger.info("providing consultation", extra={"query": user_query})
+
+            vector = await self.cache.aembed(user_query) if self.cache else None
+            cached = self.cache.lookup(vector, user_query) if self.cache else None
+            if cached:
+                state['consultation'] = cached
+                return state
+
+            async def generate():
+                response = await self.llm.ainvoke(CONSULTATION_PROMPT.format(query=user_query))
+                self._cache_consultation(user_query, vector, response)
+                return response
+
+            response = await consultation_flights.ado(self._flight_key(state), generate)
+            return self._store_consultation(state, user_query, response)
+
+        except Exception as e:
+            return self._store_error(state, e)
+
+    def _extract_query(self, state: Dict[str, Any]) -> str:
+        # Extract user query from the latest message (earlier turns are kept by the checkpointer)
+        if isinstance(state['messages'][-1], str):
+            return state['messages'][-1]
+        return state['messages'][-1].content
+
+    def _flight_key(self, state: Dict[str, Any]):
+        # Scoped to this node's LLM client, so only callers on the same model and key share answers
+        key = self.coalesce_key(state) if self.coalesce_key else None
+        return f"{id(self.llm)}:{key}" if key is not None else None
+
+    def _cache_consultation(self, user_query: str, vector, response):
+        # Fallback and error responses are never cached
+        if self.cache and response and response.content:
+            self.cache.add(user_query, vector, response.content)
+
+    def _store_consultation(self, state: Dict[str, Any], user_query: str, response) -> Dict[str, Any]:
+        if response and response.content:
+            state['consultation'] = response.content
+            logger.info("consultation generated", extra={"chars": len(response.content)})
+        else:
+            state['consultation'] = self._generate_fallback_response(user_query)
+        return state
+
+    def _store_error(self, state: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+        logger.warning("provide_consultation failed", extra={"error": str(e)})
+        record_error(e)
+        state['consultation'] = (
+            f"❌ Consultation Error: {str(e)}\n\n"
+            "I'm sorry, but I ran into an issue while preparing your consultation. "
+            "Please try again or rephrase your question."
+        )
+        return state
     
     def _generate_fallback_response(self, user_query: str) -> str:
         return (
@@ -0,0 +1,164 @@
+import json
+import os
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from langgraph.constants import TAG_NOSTREAM
+
+from langgraphagenticai.utils.prompt_packing import context_budget
+from langgraphagenticai.utils.tokens import count_tokens, truncate_to_tokens
+from langgraphagenticai.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+HISTORY_MAX_TURNS = int(os.environ.get("HISTORY_MAX_TURNS", "12"))
+HISTORY_KEEP_TURNS = int(os.environ.get("HISTORY_KEEP_TURNS", "6"))
+# Unset: half of what the model's context window leaves for the prompt
+HISTORY_TOKEN_BUDGET = int(os.environ["HISTORY_TOKEN_BUDGET"]) if os.environ.get("HISTORY_TOKEN_BUDGET") else None
+HISTORY_SUMMARY_TOKENS = int(os.environ.get("HISTORY_SUMMARY_TOKENS", "400"))
+
+# Per-message overhead of the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_PROMPT = """Update the running summary of a conversation between a user and an AI assistant.
+Keep facts, names, numbers, decisions, user preferences and open questions; drop small talk.
+Write at most {max_words} words.
+
+Current summary:
+{summary}
+
+New messages to fold in:
+{messages}
+
+Updated summary:"""
+
+
+def message_tokens(message) -> int:
+    """
+    Approximate prompt tokens of one message, including its tool calls.
+    """
+    content = message.content if isinstance(message.content, str) else json.dumps(message.content, default=str)
+    tokens = count_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tokens += count_tokens(json.dumps(tool_call.get("args", {}), default=str))
+    return tokens
+
+
+def split_turns(messages: list, start: int = 0) -> list:
+    """
+    Returns the start index of every turn in `messages[start:]`. A turn begins at a user
+    message, so an AI tool call and its tool results always stay in the same turn.
+    """
+    starts = [i for i in range(start, len(messages)) if isinstance(messages[i], HumanMessage)]
+    if not starts or starts[0] != start:
+        starts.insert(0, start)
+    return starts
+
+
+class HistoryCompactor:
+    """
+    Pre-model hook that bounds the prompt built from `State.messages`.
+
+    The full history stays in the state (and the checkpointer); only the prompt is compacted.
+    The latest turns are sent verbatim and everything before them is replaced by a rolling
+    summary stored in the state as `history_summary`, covering `messages[:history_summary_upto]`.
+    When a turn starts with the verbatim window over `max_turns` or `token_budget`, the oldest
+    turns are folded into the summary until at most `keep_turns` turns and a quarter of the
+    budget remain, so the summary is recomputed only every few turns and the prompt size
+    stays roughly constant however long the conversation gets.
+
+    Calls later in a turn (e.g. after tool results) fold only when the window no longer fits
+    the model's context, so a turn pays for at most one summary before its answer.
+    """
+    def __init__(self, llm, max_turns: int = HISTORY_MAX_TURNS, keep_turns: int = HISTORY_KEEP_TURNS,
+                 token_budget: int = HISTORY_TOKEN_BUDGET, summary_tokens: int = HISTORY_SUMMARY_TOKENS):
+        # Summaries are internal; keep their tokens out of the streamed answer
+        self.llm = llm.with_config(tags=[TAG_NOSTREAM])
+        self.max_turns = max_turns
+        self.keep_turns = max(1, min(keep_turns, max_turns))
+        context_tokens = context_budget(getattr(llm, "model_name", None))
+        self.token_budget = token_budget if token_budget is not None else context_tokens // 2
+        self.context_tokens = max(context_tokens, self.token_budget)
+        self.summary_tokens = summary_tokens
+
+    def compact(self, state: dict):
+        """
+        Returns `(prompt_messages, state_updates)` for the model call.
+        """
+        messages = state["messages"]
+        summary, upto = state.get("history_summary"), state.get("history_summary_upto") or 0
+
+        cut = self._fold_point(messages, upto)
+        if cut > upto:
+            summary = self._summarize(summary, messages[upto:cut])
+            upto = cut
+            return self._prompt(summary, messages[upto:]), self._updates(summary, upto)
+        return self._prompt(summary, messages[upto:]), {}
+
+    async def acompact(self, state: dict):
+        """
+        Async variant of `compact`.
+        """
+        messages = state["messages"]
+        summary, upto = state.get("history_summary"), state.get("history_summary_upto") or 0
+
+        cut = self._fold_point(messages, upto)
+        if cut > upto:
+            summary = await self._asummarize(summary, messages[upto:cut])
+            upto = cut
+            return self._prompt(summary, messages[upto:]), self._updates(summary, upto)
+        return self._prompt(summary, messages[upto:]), {}
+
+    def _fold_point(self, messages: list, upto: int) -> int:
+        """
+        Returns the index up to which messages must be folded into the summary
+        (`upto` when the verbatim window is still within its limits).
+        """
+        turns = split_turns(messages, upto)
+        ends = turns[1:] + [len(messages)]
+        turn_tokens = [sum(message_tokens(m) for m in messages[start:end]) for start, end in zip(turns, ends)]
+        if isinstance(messages[-1], HumanMessage):
+            if len(turns) <= self.max_turns and sum(turn_tokens) <= self.token_budget:
+                return upto
+        elif sum(turn_tokens) <= self.context_tokens:
+            # Mid-turn: the fold waits for the next turn unless the prompt wouldn't fit
+            return upto
+
+        # Keep the last `keep_turns` turns, dropping more while they exceed a quarter of the
+        # budget, so the next few turns fit without another summary. The current turn is
+        # always kept.
+        first = max(0, len(turns) - self.keep_turns)
+        tokens = sum(turn_tokens[first:])
+        while first < len(turns) - 1 and tokens > self.token_budget // 4:
+            tokens -= turn_tokens[first]
+            first += 1
+        return turns[first]
+
+    def _summary_prompt(self, summary, messages: list) -> str:
+        lines = []
+        for message in messages:
+            content = message.content if isinstance(message.content, str) else str(message.content)
+            if content:
+                lines.append(f"{message.type}: {content}")
+        return SUMMARY_PROMPT.format(
+            max_words=int(self.summary_tokens * 0.75),
+            summary=summary or "(empty)",
+            messages=truncate_to_tokens("\n".join(lines), self.context_tokens),
+        )
+
+    def _summarize(self, summary, messages: list) -> str:
+        logger.info("folding history", extra={"messages": len(messages)})
+        response = self.llm.invoke(self._summary_prompt(summary, messages))
+        return truncate_to_tokens(response.content, self.summary_tokens)
+
+    async def _asummarize(self, summary, messages: list) -> str:
+        logger.info("folding history", extra={"messages": len(messages)})
+        response = await self.llm.ainvoke(self._summary_prompt(summary, messages))
+        return truncate_to_tokens(response.content, self.summary_tokens)
+
+    def _prompt(self, summary, messages: list) -> list:
+        if not summary:
+            return list(messages)
+        return [SystemMessage(content=f"Summary of the earlier conversation:\n{summary}")] + list(messages)
+
+    def _updates(self, summary: str, upto: int) -> dict:
+        return {"history_summary": summary, "history_summary_upto": upto}
@@ -1,6 +1,8 @@
 from typing_extensions import TypedDict, List
 from langgraph.graph.message import add_messages
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Union
+
+from langgraphagenticai.utils.blob_store import BlobRef
 
 
 class State(TypedDict):
@@ -8,12 +10,17 @@ class State(TypedDict):
     Represents the structure of the state used in graph, maintaining conversation history.
     """
     messages: Annotated[List, add_messages]
+
+    # Rolling summary of messages[:history_summary_upto], see state/history.py
+    history_summary: Optional[str]
+    history_summary_upto: Optional[int]
     
     # Additional fields for AI News functionality
-    news_data: Optional[List[dict]]  # For storing fetched news articles
+    news_data: Optional[Union[List[dict], BlobRef]]  # Fetched news articles, usually a blob store handle
     user_query: Optional[str]        # For storing the user's query
     summary: Optional[str]           # For storing the generated summary
     error: Optional[str]             # For storing any error messages
+    from_digest: Optional[bool]      # Set when the summary came from a prefetched digest
     
     # Additional field for Consultant Bot functionality
     consultation: Optional[str]      # For storing consultation responses
@@ -0,0 +1,181 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextvars import copy_context
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+
+from langgraphagenticai.utils.instrumentation import record_error
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+
+logger = get_logger(__name__)
+
+# Seconds each tool may run before the turn continues without it; others use TOOL_TIMEOUT
+TOOL_TIMEOUTS = {
+    "tavily_search_results_json": 10.0,
+}
+DEFAULT_TOOL_TIMEOUT = float(os.environ.get("TOOL_TIMEOUT", "15"))
+TOOL_WORKERS = int(os.environ.get("TOOL_WORKERS", "16"))
+# Timed-out sync calls can't be stopped and keep their worker thread until they return.
+# While this many are still running, new sync calls fail fast instead of queueing behind them
+TOOL_MAX_ABANDONED = int(os.environ.get("TOOL_MAX_ABANDONED", str(max(1, TOOL_WORKERS // 2))))
+
+ABANDONED_TOOL_CALLS = metrics_registry.gauge(
+    "agenticai_tool_calls_abandoned", "Timed-out sync tool calls still occupying a worker thread.")
+
+# Bounded pool shared by every session for the sync graph
+_tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="tool-call")
+_abandoned = {"running": 0, "total": 0, "rejected": 0}
+_abandoned_lock = threading.Lock()
+
+
+def _abandon(future):
+    """
+    Counts a timed-out call until its thread returns.
+    """
+    with _abandoned_lock:
+        _abandoned["running"] += 1
+        _abandoned["total"] += 1
+        ABANDONED_TOOL_CALLS.set(_abandoned["running"])
+
+    def done(_):
+        with _abandoned_lock:
+            _abandoned["running"] -= 1
+            ABANDONED_TOOL_CALLS.set(_abandoned["running"])
+
+    future.add_done_callback(done)
+
+
+def _pool_saturated() -> bool:
+    with _abandoned_lock:
+        if _abandoned["running"] < TOOL_MAX_ABANDONED:
+            return False
+        _abandoned["rejected"] += 1
+        return True
+
+
+def tool_call_stats() -> dict:
+    """
+    Returns the timed-out sync tool calls still running, and the calls rejected because of them.
+    """
+    with _abandoned_lock:
+        return {"abandoned_running": _abandoned["running"], "abandoned_total": _abandoned["total"],
+                "rejected": _abandoned["rejected"], "max_abandoned": TOOL_MAX_ABANDONED}
+
+
+class ParallelToolNode:
+    """
+    Runs every tool call of the last AI message concurrently, each with its own timeout.
+    Results come back in call order; a call that fails or times out yields an error
+    ToolMessage so the model can answer with the partial results instead of the
+    whole turn waiting on the slowest search.
+    """
+    def __init__(self, tools, timeouts: dict = None, default_timeout: float = DEFAULT_TOOL_TIMEOUT):
+        self.tools_by_name = {tool.name: tool for tool in tools}
+        self.timeouts = {**TOOL_TIMEOUTS, **(timeouts or {})}
+        self.default_timeout = default_timeout
+
+    def invoke(self, state: dict, config: RunnableConfig = None) -> dict:
+        tool_calls = self._tool_calls(state)
+        if tool_calls and _pool_saturated():
+            return {"messages": [self._saturated_message(call) for call in tool_calls]}
+        started = time.monotonic()
+        # copy_context keeps the graph's callbacks/streaming config in the worker threads
+        futures = [
+            _tool_executor.submit(copy_context().run, self._run_tool, call, config)
+            for call in tool_calls
+        ]
+
+        messages = []
+        for call, future in zip(tool_calls, futures):
+            timeout = self._timeout(call)
+            remaining = max(0.0, started + timeout - time.monotonic())
+            try:
+                messages.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                # Running threads can't be interrupted; the result is simply discarded
+                if not future.cancel():
+                    _abandon(future)
+                messages.append(self._timeout_message(call, timeout))
+            except Exception as e:
+                messages.append(self._error_message(call, e))
+        return {"messages": messages}
+
+    async def ainvoke(self, state: dict, config: RunnableConfig = None) -> dict:
+        tool_calls = self._tool_calls(state)
+
+        async def run(call):
+            timeout = self._timeout(call)
+            try:
+                return await asyncio.wait_for(self._arun_tool(call, config), timeout=timeout)
+            except asyncio.TimeoutError:
+                return self._timeout_message(call, timeout)
+            except Exception as e:
+                return self._error_message(call, e)
+
+        # gather keeps call order; wait_for cancels calls that exceed their timeout
+        messages = await asyncio.gather(*(run(call) for call in tool_calls))
+        return {"messages": list(messages)}
+
+    def as_runnable(self) -> RunnableLambda:
+        """
+        Returns the node as a runnable usable from both sync and async graphs.
+        """
+        return RunnableLambda(self.invoke, afunc=self.ainvoke, name="tools")
+
+    def _tool_calls(self, state: dict) -> list:
+        messages = state["messages"] if isinstance(state, dict) else state
+        for message in reversed(messages):
+            if isinstance(message, AIMessage):
+                return list(message.tool_calls)
+        return []
+
+    def _timeout(self, call: dict) -> float:
+        return self.timeouts.get(call["name"], self.default_timeout)
+
+    def _run_tool(self, call: dict, config):
+        tool = self._get_tool(call)
+        return tool.invoke({**call, "type": "tool_call"}, config)
+
+    async def _arun_tool(self, call: dict, config):
+        tool = self._get_tool(call)
+        return await tool.ainvoke({**call, "type": "tool_call"}, config)
+
+    def _get_tool(self, call: dict):
+        if call["name"] not in self.tools_by_name:
+            raise ValueError(f"Tool '{call['name']}' is not available. Choose from: {list(self.tools_by_name)}")
+        return self.tools_by_name[call["name"]]
+
+    def _timeout_message(self, call: dict, timeout: float) -> ToolMessage:
+        logger.warning("tool call timed out", extra={"tool": call["name"], "timeout": timeout})
+        return ToolMessage(
+            content=f"Tool '{call['name']}' did not respond within {timeout:g}s; no result is available. "
+                    "Answer with the other results or your own knowledge.",
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+        )
+
+    def _saturated_message(self, call: dict) -> ToolMessage:
+        logger.warning("tool call rejected", extra={"tool": call["name"], "abandoned": TOOL_MAX_ABANDONED})
+        return ToolMessage(
+            content=f"Tool '{call['name']}' is overloaded; no result is available. "
+                    "Answer with your own knowledge.",
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+        )
+
+    def _error_message(self, call: dict, e: Exception) -> ToolMessage:
+        logger.warning("tool call failed", extra={"tool": call["name"], "error": str(e)})
+        record_error(e)
+        return ToolMessage(
+            content=f"Tool '{call['name']}' failed: {e}. Answer with the other results or your own knowledge.",
+            name=call["name"],
+            tool_call_id=call["id"],
+            status="error",
+        )
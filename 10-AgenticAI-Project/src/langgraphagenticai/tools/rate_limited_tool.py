@@ -0,0 +1,72 @@
+import re
+
+from langchain_core.tools import BaseTool
+
+from langgraphagenticai.tools.tool_cache import is_error_result
+from langgraphagenticai.utils.upstream import UpstreamThrottled, call_upstream, acall_upstream
+
+# Upstream provider behind each tool; tools not listed here are not rate limited
+TOOL_PROVIDERS = {
+    "tavily_search_results_json": "tavily",
+}
+
+# TavilySearchResults returns errors as their repr instead of raising
+_THROTTLED_CONTENT = re.compile(r"^\w*(Error|Exception)\(.*(429|rate limit|usage limit)", re.IGNORECASE | re.DOTALL)
+
+
+class RateLimitedTool(BaseTool):
+    """
+    Wraps a tool so every call goes through its provider's process-wide limiter
+    (see utils/upstream.py); rate-limited calls are retried after the limiter backs off.
+    Errors the tool returns as content are raised, so the breaker counts them as failures.
+    Each tool has its own circuit breaker ("<provider>:<tool name>").
+    """
+    tool: BaseTool
+    provider: str
+    response_format: str = "content_and_artifact"
+
+    @classmethod
+    def wrap(cls, tool: BaseTool, provider: str) -> "RateLimitedTool":
+        return cls(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            metadata=tool.metadata,
+            tool=tool,
+            provider=provider,
+        )
+
+    def _tool_call(self, kwargs: dict) -> dict:
+        return {"type": "tool_call", "name": self.name, "args": kwargs, "id": "rate-limited-tool-call"}
+
+    def _unpack(self, message):
+        content, artifact = message.content, getattr(message, "artifact", None)
+        if isinstance(content, str) and _THROTTLED_CONTENT.match(content[:300]):
+            raise UpstreamThrottled(content)
+        if getattr(message, "status", "success") == "error" or is_error_result(content, artifact):
+            raise RuntimeError(content)
+        return content, artifact
+
+    @property
+    def breaker(self) -> str:
+        return f"{self.provider}:{self.name}"
+
+    def _run(self, run_manager=None, **kwargs):
+        return call_upstream(
+            self.provider, lambda: self._unpack(self.tool.invoke(self._tool_call(kwargs))), breaker=self.breaker)
+
+    async def _arun(self, run_manager=None, **kwargs):
+        async def call():
+            return self._unpack(await self.tool.ainvoke(self._tool_call(kwargs)))
+
+        return await acall_upstream(self.provider, call, breaker=self.breaker)
+
+
+def with_rate_limit(tools: list) -> list:
+    """
+    Wraps every tool that calls a rate-limited provider in a RateLimitedTool.
+    """
+    return [
+        RateLimitedTool.wrap(tool, TOOL_PROVIDERS[tool.name]) if tool.name in TOOL_PROVIDERS else tool
+        for tool in tools
+    ]
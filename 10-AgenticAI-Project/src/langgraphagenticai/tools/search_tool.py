@@ -1,5 +1,7 @@
 from langchain_community.tools.tavily_search import TavilySearchResults
-from langgraph.prebuilt import ToolNode
+from langgraphagenticai.tools.parallel_tool_node import ParallelToolNode
+from langgraphagenticai.tools.tool_cache import with_tool_cache
+from langgraphagenticai.tools.rate_limited_tool import with_rate_limit
 
 def get_tools():
     """
@@ -8,9 +10,15 @@ def get_tools():
     tools=[TavilySearchResults(max_results=2)]
     return tools
 
-def create_tool_node(tools):
+def create_tool_node(tools, cache=True):
     """
     creates and returns a tool node for the graph
+    Tool calls run in parallel with per-tool timeouts (see tools/parallel_tool_node.py) and
+    results of cacheable tools are memoized (see tools/tool_cache.py) unless `cache` is False.
+    Calls that miss the cache go through the provider's rate limiter (see tools/rate_limited_tool.py).
     """
-    return ToolNode(tools=tools)
+    tools = with_rate_limit(tools)
+    if cache:
+        tools = with_tool_cache(tools)
+    return ParallelToolNode(tools).as_runnable()
 
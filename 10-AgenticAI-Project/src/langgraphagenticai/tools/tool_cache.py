@@ -0,0 +1,159 @@
+import json
+import os
+import re
+import threading
+from typing import Any
+
+from langchain_core.tools import BaseTool
+
+from langgraphagenticai.utils.circuit_breaker import CircuitOpenError, record_fallback
+from langgraphagenticai.utils.ttl_cache import TTLCache
+
+# Seconds a result stays cached, per tool name; others use TOOL_CACHE_TTL
+TOOL_CACHE_TTLS = {
+    "tavily_search_results_json": 600,
+}
+DEFAULT_TOOL_CACHE_TTL = float(os.environ.get("TOOL_CACHE_TTL", "300"))
+TOOL_CACHE_MAX_SIZE = int(os.environ.get("TOOL_CACHE_MAX_SIZE", "512"))
+# Optional directory for on-disk caches (one JSON file per tool)
+TOOL_CACHE_DIR = os.environ.get("TOOL_CACHE_DIR") or None
+
+# Some tools (e.g. TavilySearchResults) return a failure as the repr of the exception
+_ERROR_CONTENT = re.compile(r"^\w*(Error|Exception|Timeout)\(", re.IGNORECASE)
+
+_tool_caches = {}
+_tool_caches_lock = threading.Lock()
+
+
+def get_tool_cache(tool_name: str) -> TTLCache:
+    """
+    Returns the process-wide cache for a tool, shared by every graph and session.
+    """
+    with _tool_caches_lock:
+        cache = _tool_caches.get(tool_name)
+        if cache is None:
+            persist_path = None
+            if TOOL_CACHE_DIR:
+                os.makedirs(TOOL_CACHE_DIR, exist_ok=True)
+                safe_name = re.sub(r"[^\w.-]", "_", tool_name)
+                persist_path = os.path.join(TOOL_CACHE_DIR, f"{safe_name}.json")
+            cache = TTLCache(
+                ttl=TOOL_CACHE_TTLS.get(tool_name, DEFAULT_TOOL_CACHE_TTL),
+                max_size=TOOL_CACHE_MAX_SIZE,
+                persist_path=persist_path,
+                name=f"tool-cache-{tool_name}",
+            )
+            _tool_caches[tool_name] = cache
+        return cache
+
+
+def tool_cache_stats() -> dict:
+    """
+    Returns hit/miss metrics per cached tool.
+    """
+    with _tool_caches_lock:
+        caches = dict(_tool_caches)
+    return {name: cache.stats() for name, cache in caches.items()}
+
+
+def canonicalize_args(args: dict) -> str:
+    """
+    Serializes tool arguments with sorted keys and whitespace-normalized strings.
+    """
+    def normalize(value):
+        if isinstance(value, str):
+            return re.sub(r"\s+", " ", value).strip()
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return value
+
+    return json.dumps(normalize(args), sort_keys=True, default=str)
+
+
+def is_error_result(content, artifact=None) -> bool:
+    """
+    True when a tool returned an exception repr (and no artifact) instead of raising.
+    """
+    return isinstance(content, str) and not artifact and bool(_ERROR_CONTENT.match(content))
+
+
+def is_cacheable(tool: BaseTool) -> bool:
+    """
+    Tools opt out of caching by setting `metadata={"side_effects": True}`.
+    """
+    return not (tool.metadata or {}).get("side_effects", False)
+
+
+class CachedTool(BaseTool):
+    """
+    Wraps a tool so identical calls (same tool name and canonicalized arguments)
+    are answered from a TTL + LRU cache instead of hitting the network again.
+    Only successful results are cached; errors, including exception reprs returned as
+    content, are raised.
+    While the tool's circuit breaker is open, expired entries are served rather than failing.
+    """
+    tool: BaseTool
+    cache: Any
+    response_format: str = "content_and_artifact"
+
+    @classmethod
+    def wrap(cls, tool: BaseTool) -> "CachedTool":
+        return cls(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            tool=tool,
+            cache=get_tool_cache(tool.name),
+        )
+
+    def _key(self, kwargs: dict) -> str:
+        return f"{self.name}:{canonicalize_args(kwargs)}"
+
+    def _tool_call(self, kwargs: dict) -> dict:
+        # Invoking with a tool call keeps the artifact of content_and_artifact tools
+        return {"type": "tool_call", "name": self.name, "args": kwargs, "id": "cached-tool-call"}
+
+    def _unpack(self, message) -> list:
+        # Failures are raised, never cached
+        content, artifact = message.content, getattr(message, "artifact", None)
+        if getattr(message, "status", "success") == "error" or is_error_result(content, artifact):
+            raise RuntimeError(content)
+        return [content, artifact]
+
+    def _expired(self, key: str, error: CircuitOpenError):
+        value, _ = self.cache.get(key)
+        if value is None:
+            raise error
+        record_fallback(error.name, "expired_cache")
+        return value
+
+    def _run(self, run_manager=None, **kwargs):
+        def load():
+            return self._unpack(self.tool.invoke(self._tool_call(kwargs)))
+
+        key = self._key(kwargs)
+        try:
+            content, artifact = self.cache.get_or_load(key, load)
+        except CircuitOpenError as e:
+            content, artifact = self._expired(key, e)
+        return content, artifact
+
+    async def _arun(self, run_manager=None, **kwargs):
+        async def aload():
+            return self._unpack(await self.tool.ainvoke(self._tool_call(kwargs)))
+
+        key = self._key(kwargs)
+        try:
+            content, artifact = await self.cache.aget_or_load(key, aload)
+        except CircuitOpenError as e:
+            content, artifact = self._expired(key, e)
+        return content, artifact
+
+
+def with_tool_cache(tools: list) -> list:
+    """
+    Wraps every cacheable tool in a CachedTool; side-effecting tools are returned unchanged.
+    """
+    return [CachedTool.wrap(tool) if is_cacheable(tool) else tool for tool in tools]
@@ -1,170 +1,194 @@
+import time
+
 import streamlit as st
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, ToolMessage
+
+from langgraphagenticai.graph.usecases import STREAMING_NODES, RESULT_KEYS
+from langgraphagenticai.nodes.cascade_chatbot_node import answered_by
+from langgraphagenticai.utils.latency import LatencyTracker
+from langgraphagenticai.utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Time-to-first-token per use case, shared across sessions
+ttft_tracker = LatencyTracker()
+
 
 class DisplayResultStreamlit:
-    def __init__(self, usecase, graph, user_message):
+    def __init__(self, usecase, graph, user_message, config=None):
         self.usecase = usecase
         self.graph = graph
         self.user_message = user_message
+        # Run config; carries the session's thread_id when the graph has a checkpointer
+        self.config = config
 
     def display_result_on_ui(self):
         usecase = self.usecase
-        graph = self.graph
         user_message = self.user_message
 
-        if usecase == "Basic Chatbot":
-            for event in graph.stream({'messages': ("user", user_message)}):
-                for value in event.values():
-                    with st.chat_message("user"):
-                        st.write(user_message)
-                    with st.chat_message("assistant"):
-                        st.write(value["messages"][-1].content)
-
-        elif usecase == "Chatbot With Web":
-            initial_state = {"messages": [user_message]}
-            res = graph.invoke(initial_state)
-
-            for message in res.get('messages', []):
-                if isinstance(message, HumanMessage):
-                    with st.chat_message("user"):
-                        st.write(message.content)
-                elif isinstance(message, ToolMessage):
-                    with st.chat_message("ai"):
-                        st.write("🔧 Tool Call Start")
-                        st.write(message.content)
-                        st.write("🔧 Tool Call End")
-                elif isinstance(message, AIMessage) and message.content:
-                    with st.chat_message("assistant"):
-                        st.write(message.content)
-
-        elif usecase == "AI News":
-            # Display user message
-            with st.chat_message("user"):
-                st.write(user_message)
-
-            with st.spinner("Fetching and summarizing news... ⏳"):
-                try:
-                    # Invoke the graph with proper state format
-                    initial_state = {"messages": [HumanMessage(content=user_message)]}
-                    result = graph.invoke(initial_state)
-                    
-                    # Debug: Print result structure (remove in production)
-                    print(f"AI News Result Type: {type(result)}")
-                    print(f"AI News Result Keys: {result.keys() if isinstance(result, dict) else 'Not a dict'}")
-                    
-                    # Extract summary content
-                    summary_content = None
-                    
-                    if isinstance(result, dict):
-                        # First priority: Check for 'summary' key (most likely)
-                        if "summary" in result and result["summary"]:
-                            summary_content = result["summary"]
-                            print("Found summary in 'summary' key")
-                        
-                        # Second priority: Check all keys for string content
-                        elif not summary_content:
-                            for key, value in result.items():
-                                if isinstance(value, str) and len(value) > 100:
-                                    summary_content = value
-                                    print(f"Found summary in '{key}' key")
-                                    break
-                        
-                        # Third priority: Check messages for AIMessage (last resort)
-                        if not summary_content and "messages" in result and isinstance(result["messages"], list):
-                            for msg in result["messages"]:
-                                if isinstance(msg, AIMessage) and msg.content and len(msg.content) > 100:
-                                    summary_content = msg.content
-                                    print("Found summary in AIMessage")
-                                    break
-                    
-                    # Display the result
-                    if summary_content and summary_content.strip():
-                        with st.chat_message("assistant"):
-                            st.markdown(summary_content, unsafe_allow_html=True)
-                    else:
-                        with st.chat_message("assistant"):
-                            st.warning("🔍 No news summary was generated. This could be due to:")
-                            st.write("• No recent news found for your query")
-                            st.write("• TAVILY API rate limits")
-                            st.write("• Temporary service issues")
-                            st.write("\n💡 **Try:**")
-                            st.write("• A more specific query (e.g., 'OpenAI GPT-4 news')")
-                            st.write("• A broader query (e.g., 'AI technology news')")
-                            st.write("• Waiting a moment and trying again")
-                            
-                            # Show debug info for troubleshooting
-                            if isinstance(result, dict):
-                                st.write(f"\n🔧 **Debug Info:** Available keys: {list(result.keys())}")
-
-                except Exception as e:
-                    with st.chat_message("assistant"):
-                        st.error(f"❌ **Error occurred:** {str(e)}")
-                        st.write("**Troubleshooting steps:**")
-                        st.write("1. Check your TAVILY API key")
-                        st.write("2. Verify your internet connection")
-                        st.write("3. Try a simpler query")
-                        st.write("4. Wait a moment and try again")
-                    
-                    # Print full error for debugging
-                    print(f"AI News Error: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-        elif usecase == "Consultant Bot":
-            # Display user message
-            with st.chat_message("user"):
-                st.write(user_message)
-
-            with st.spinner("Preparing your consultation... 🤔"):
-                try:
-                    # Invoke the graph with proper state format
-                    initial_state = {"messages": [HumanMessage(content=user_message)]}
-                    result = graph.invoke(initial_state)
-                    
-                    # Debug: Print result structure
-                    print(f"Consultant Bot Result Type: {type(result)}")
-                    print(f"Consultant Bot Result Keys: {result.keys() if isinstance(result, dict) else 'Not a dict'}")
-                    
-                    # Extract consultation content
-                    consultation_content = None
-                    
-                    if isinstance(result, dict):
-                        if "consultation" in result and result["consultation"]:
-                            consultation_content = result["consultation"]
-                            print("Found consultation in 'consultation' key")
-                        else:
-                            # Fallback: check other keys for substantial content
-                            for key, value in result.items():
-                                if isinstance(value, str) and len(value) > 100:
-                                    consultation_content = value
-                                    print(f"Found consultation in '{key}' key")
-                                    break
-                    
-                    # Display the consultation
-                    if consultation_content and consultation_content.strip():
-                        with st.chat_message("assistant"):
-                            st.markdown(consultation_content, unsafe_allow_html=True)
-                    else:
-                        with st.chat_message("assistant"):
-                            st.warning("🤔 Unable to generate consultation at this time.")
-                            st.write("**Please try:**")
-                            st.write("• Rephrasing your question more specifically")
-                            st.write("• Providing more context about your situation")
-                            st.write("• Breaking down complex questions into smaller parts")
-                            st.write("• Specifying your industry or domain")
-                            
-                            if isinstance(result, dict):
-                                st.write(f"\n🔧 **Debug Info:** Available keys: {list(result.keys())}")
-
-                except Exception as e:
+        self._render_history()
+
+        with st.chat_message("user"):
+            st.write(user_message)
+
+        try:
+            streamed_text, final_values, last_ai_message = self._stream_to_ui()
+        except Exception as e:
+            self._render_error(e)
+            logger.exception("graph run failed", extra={"usecase": usecase})
+            return
+
+        if usecase in RESULT_KEYS:
+            result_content = final_values.get(RESULT_KEYS[usecase])
+            # The node returned without calling the LLM (errors, empty search results)
+            if not streamed_text and result_content and result_content.strip():
+                with st.chat_message("assistant"):
+                    st.markdown(result_content, unsafe_allow_html=True)
+            elif not streamed_text:
+                self._render_empty_result(final_values)
+        elif not streamed_text and last_ai_message is not None and last_ai_message.content:
+            with st.chat_message("assistant"):
+                st.write(last_ai_message.content)
+        self._render_cascade_tier(last_ai_message)
+
+    def _render_cascade_tier(self, message):
+        # With a model cascade, say which model wrote the answer
+        cascade = answered_by(message)
+        if cascade is not None:
+            st.caption(f"Answered by {cascade['model']} ({cascade['tier']} model)")
+
+    def _stream_to_ui(self):
+        """
+        Streams the graph with LangGraph's `messages` and `updates` modes, writing LLM tokens
+        into the assistant bubble as they arrive and showing tool calls as they start and finish.
+        """
+        stream_node = STREAMING_NODES.get(self.usecase)
+        initial_state = {"messages": [HumanMessage(content=self.user_message)]}
+
+        placeholder = None
+        buffer = ""
+        streamed_text = ""
+        final_values = {}
+        last_ai_message = None
+        tool_status = {}
+        first_token_at = None
+        started_at = time.perf_counter()
+
+        for mode, chunk in self.graph.stream(initial_state, self.config, stream_mode=["messages", "updates"]):
+            if mode == "messages":
+                message, metadata = chunk
+                if metadata.get("langgraph_node") != stream_node:
+                    continue
+                if not isinstance(message, AIMessageChunk) or not isinstance(message.content, str):
+                    continue
+                if not message.content:
+                    continue
+
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                    ttft_tracker.record(self.usecase, first_token_at - started_at)
+                    logger.info("first token", extra={"usecase": self.usecase, "ttft_ms": round((first_token_at - started_at) * 1000, 1)})
+
+                if placeholder is None:
                     with st.chat_message("assistant"):
-                        st.error(f"❌ **Consultation Error:** {str(e)}")
-                        st.write("**Troubleshooting steps:**")
-                        st.write("1. Check your internet connection")
-                        st.write("2. Try a simpler question")
-                        st.write("3. Ensure your query is clear and specific")
-                        st.write("4. Wait a moment and try again")
-                    
-                    print(f"Consultant Bot Error: {e}")
-                    import traceback
-                    traceback.print_exc()
\ No newline at end of file
+                        placeholder = st.empty()
+                    buffer = ""
+                buffer += message.content
+                streamed_text += message.content
+                placeholder.markdown(buffer + "▌")
+                continue
+
+            for node_name, update in chunk.items():
+                if not isinstance(update, dict):
+                    continue
+                final_values.update({k: v for k, v in update.items() if k != "messages"})
+
+                for message in update.get("messages") or []:
+                    if isinstance(message, AIMessage) and message.tool_calls:
+                        # Close the current bubble; the answer after the tools gets its own
+                        if placeholder is not None:
+                            placeholder.markdown(buffer)
+                            placeholder = None
+                        for tool_call in message.tool_calls:
+                            with st.chat_message("ai"):
+                                status = st.status(f"🔧 Tool Call Start: {tool_call['name']}", expanded=False)
+                                status.write(tool_call.get("args", {}))
+                            tool_status[tool_call["id"]] = status
+                    elif isinstance(message, ToolMessage):
+                        status = tool_status.pop(message.tool_call_id, None)
+                        if status is None:
+                            with st.chat_message("ai"):
+                                status = st.status(f"🔧 {message.name}")
+                        status.write(message.content)
+                        status.update(label=f"🔧 Tool Call End: {message.name}", state="complete")
+                    elif isinstance(message, AIMessage):
+                        last_ai_message = message
+
+        if placeholder is not None:
+            placeholder.markdown(buffer)
+
+        return streamed_text, final_values, last_ai_message
+
+    def _render_history(self):
+        """
+        Re-renders the earlier turns of this thread from the checkpointer.
+        Only the chat use cases answer through `messages`, so only they have a history to show.
+        """
+        if not self.config or self.usecase in RESULT_KEYS or self.graph.checkpointer is None:
+            return
+        try:
+            messages = self.graph.get_state(self.config).values.get("messages", [])
+        except Exception as e:
+            logger.warning("could not load conversation history", extra={"error": str(e)})
+            return
+
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                with st.chat_message("user"):
+                    st.write(message.content)
+            elif isinstance(message, AIMessage) and message.content and not message.tool_calls:
+                with st.chat_message("assistant"):
+                    st.write(message.content)
+                self._render_cascade_tier(message)
+
+    def _render_empty_result(self, final_values):
+        if self.usecase == "AI News":
+            with st.chat_message("assistant"):
+                st.warning("🔍 No news summary was generated. This could be due to:")
+                st.write("• No recent news found for your query")
+                st.write("• TAVILY API rate limits")
+                st.write("• Temporary service issues")
+                st.write("\n💡 **Try:**")
+                st.write("• A more specific query (e.g., 'OpenAI GPT-4 news')")
+                st.write("• A broader query (e.g., 'AI technology news')")
+                st.write("• Waiting a moment and trying again")
+                st.write(f"\n🔧 **Debug Info:** Available keys: {list(final_values.keys())}")
+
+        elif self.usecase == "Consultant Bot":
+            with st.chat_message("assistant"):
+                st.warning("🤔 Unable to generate consultation at this time.")
+                st.write("**Please try:**")
+                st.write("• Rephrasing your question more specifically")
+                st.write("• Providing more context about your situation")
+                st.write("• Breaking down complex questions into smaller parts")
+                st.write("• Specifying your industry or domain")
+                st.write(f"\n🔧 **Debug Info:** Available keys: {list(final_values.keys())}")
+
+    def _render_error(self, e):
+        with st.chat_message("assistant"):
+            if self.usecase == "AI News":
+                st.error(f"❌ **Error occurred:** {str(e)}")
+                st.write("**Troubleshooting steps:**")
+                st.write("1. Check your TAVILY API key")
+                st.write("2. Verify your internet connection")
+                st.write("3. Try a simpler query")
+                st.write("4. Wait a moment and try again")
+            elif self.usecase == "Consultant Bot":
+                st.error(f"❌ **Consultation Error:** {str(e)}")
+                st.write("**Troubleshooting steps:**")
+                st.write("1. Check your internet connection")
+                st.write("2. Try a simpler question")
+                st.write("3. Ensure your query is clear and specific")
+                st.write("4. Wait a moment and try again")
+            else:
+                st.error(f"❌ **Error occurred:** {str(e)}")
@@ -14,5 +14,11 @@ class Config:
     def get_groq_model_options(self):
         return self.config["DEFAULT"].get("GROQ_MODEL_OPTIONS").split(",")
     
+    def get_groq_hedge_model(self):
+        return self.config["DEFAULT"].get("GROQ_HEDGE_MODEL", "").strip()
+
+    def get_groq_cascade_model(self):
+        return self.config["DEFAULT"].get("GROQ_CASCADE_MODEL", "").strip()
+
     def get_page_title(self):
         return self.config["DEFAULT"].get("PAGE_TITLE")
\ No newline at end of file
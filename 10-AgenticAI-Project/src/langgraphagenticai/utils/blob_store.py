@@ -0,0 +1,240 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TypedDict
+
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+
+# Set STATE_BLOBS=0 to keep large values in the graph state
+STATE_BLOBS_ENABLED = os.environ.get("STATE_BLOBS", "1") != "0"
+# `memory` (per process) or `disk` (files under BLOB_STORE_DIR, read with mmap; shared by
+# every worker and kept across restarts like the checkpoints that point to them)
+BLOB_STORE = os.environ.get("BLOB_STORE", "memory")
+BLOB_STORE_DIR = os.environ.get("BLOB_STORE_DIR", "./.blobs")
+# Values smaller than this (JSON-encoded) stay in the state
+BLOB_MIN_BYTES = int(os.environ.get("BLOB_MIN_BYTES", "4096"))
+# Size of the memory store; the least recently used blobs are dropped beyond it
+BLOB_STORE_MAX_BYTES = int(os.environ.get("BLOB_STORE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+logger = get_logger(__name__)
+
+BLOB_OPERATIONS = metrics_registry.counter(
+    "agenticai_blob_operations_total", "Blob store operations (stored, deduplicated, loaded, missing).", ("op",))
+BLOB_BYTES = metrics_registry.counter(
+    "agenticai_blob_bytes_total", "Bytes written to and read from the blob store.", ("op",))
+
+
+class BlobRef(TypedDict):
+    """
+    Handle kept in the graph state in place of a large value: the SHA-256 of its JSON
+    encoding and its size in bytes. A plain dict, so every checkpoint serializer keeps it.
+    """
+    blob_sha256: str
+    size: int
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, dict) and len(value) == 2 and "blob_sha256" in value and "size" in value
+
+
+def encode(value) -> bytes:
+    # Sorted keys: equal values get the same digest
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class BlobNotFoundError(KeyError):
+    """
+    Raised when a BlobRef points to a blob the store no longer has (e.g. evicted from memory).
+    """
+    def __init__(self, digest: str, hint: str = ""):
+        super().__init__(digest)
+        self.digest = digest
+        self.hint = hint
+
+    def __str__(self):
+        return f"Blob {self.digest} is not in the blob store" + (f": {self.hint}" if self.hint else "")
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed store of JSON values. Equal values are stored once, so the same
+    articles fetched by many sessions share one blob. Subclasses store the bytes.
+    """
+    # Why a blob may be missing, reported by BlobNotFoundError
+    missing_hint = ""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stored = 0
+        self.deduplicated = 0
+        self.loaded = 0
+
+    def put(self, value, data: bytes = None) -> BlobRef:
+        """
+        Stores `value` (already encoded as `data`, if given) and returns its handle.
+        """
+        data = data if data is not None else encode(value)
+        ref = BlobRef(blob_sha256=hashlib.sha256(data).hexdigest(), size=len(data))
+        if self._write(ref["blob_sha256"], data):
+            self._count("stored", data=len(data))
+        else:
+            self._count("deduplicated")
+        return ref
+
+    def get(self, ref: BlobRef):
+        data = self._read(ref["blob_sha256"])
+        if data is None:
+            BLOB_OPERATIONS.inc(op="missing")
+            raise BlobNotFoundError(ref["blob_sha256"], self.missing_hint)
+        self._count("loaded", data=len(data))
+        return json.loads(data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"stored": self.stored, "deduplicated": self.deduplicated, "loaded": self.loaded}
+
+    def _count(self, op: str, data: int = 0):
+        with self._lock:
+            setattr(self, op, getattr(self, op) + 1)
+        BLOB_OPERATIONS.inc(op=op)
+        if data:
+            BLOB_BYTES.inc(data, op="written" if op == "stored" else "read")
+
+    @abstractmethod
+    def _write(self, digest: str, data: bytes) -> bool:
+        """
+        Stores `data` unless the digest is already there; returns True if it was written.
+        """
+
+    @abstractmethod
+    def _read(self, digest: str):
+        """
+        Returns the bytes stored under `digest`, or None.
+        """
+
+
+class MemoryBlobStore(BlobStore):
+    """
+    Blobs kept as bytes in this process, evicted in LRU order beyond `max_bytes`.
+    """
+    missing_hint = ("memory blobs are lost when the process restarts and evicted beyond "
+                    "BLOB_STORE_MAX_BYTES; use BLOB_STORE=disk to resume checkpoints that refer to them")
+
+    def __init__(self, max_bytes: int = BLOB_STORE_MAX_BYTES):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._blobs = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            return {**stats, "blobs": len(self._blobs), "bytes": self._bytes, "evictions": self.evictions}
+
+    def _write(self, digest: str, data: bytes) -> bool:
+        with self._lock:
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+                return False
+            self._blobs[digest] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._blobs) > 1:
+                _, evicted = self._blobs.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+            return True
+
+    def _read(self, digest: str):
+        with self._lock:
+            data = self._blobs.get(digest)
+            if data is not None:
+                self._blobs.move_to_end(digest)
+            return data
+
+
+class DiskBlobStore(BlobStore):
+    """
+    One file per blob under `directory`, written atomically and read through mmap,
+    so processes reading the same blob share the OS page cache. Blobs are not removed.
+    """
+    missing_hint = "its file is missing from BLOB_STORE_DIR"
+
+    def __init__(self, directory: str = BLOB_STORE_DIR):
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _write(self, digest: str, data: bytes) -> bool:
+        path = self._path(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+
+    def _read(self, digest: str):
+        try:
+            with open(self._path(digest), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return m[:]
+        except FileNotFoundError:
+            return None
+
+
+_blob_store = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """
+    Returns the process-wide blob store selected by BLOB_STORE.
+    """
+    global _blob_store
+    with _blob_store_lock:
+        if _blob_store is None:
+            _blob_store = DiskBlobStore(BLOB_STORE_DIR) if BLOB_STORE == "disk" else MemoryBlobStore()
+            logger.info("blob store ready", extra={"store": type(_blob_store).__name__})
+        return _blob_store
+
+
+def offload(value, min_bytes: int = BLOB_MIN_BYTES):
+    """
+    Returns a BlobRef to `value` when its JSON encoding is at least `min_bytes` long,
+    else `value` itself. Use in nodes that write a large state field.
+    """
+    if not STATE_BLOBS_ENABLED or value is None or is_blob_ref(value):
+        return value
+    data = encode(value)
+    if len(data) < min_bytes:
+        return value
+    return get_blob_store().put(value, data)
+
+
+def resolve(value):
+    """
+    Loads the value behind a BlobRef; any other value is returned unchanged.
+    Use in nodes that read a field that may have been offloaded.
+    """
+    if is_blob_ref(value):
+        return get_blob_store().get(value)
+    return value
+
+
+def blob_store_stats() -> dict:
+    return get_blob_store().stats()
@@ -0,0 +1,223 @@
+import os
+import threading
+import time
+from collections import deque
+
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+
+# Set CIRCUIT_BREAKERS=0 to always call the upstreams
+CIRCUIT_BREAKERS_ENABLED = os.environ.get("CIRCUIT_BREAKERS", "1") != "0"
+CIRCUIT_WINDOW = float(os.environ.get("CIRCUIT_WINDOW", "60"))
+CIRCUIT_MIN_CALLS = int(os.environ.get("CIRCUIT_MIN_CALLS", "10"))
+CIRCUIT_FAILURE_RATE = float(os.environ.get("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_SLOW_CALL_RATE = float(os.environ.get("CIRCUIT_SLOW_CALL_RATE", "0.8"))
+CIRCUIT_OPEN_SECONDS = float(os.environ.get("CIRCUIT_OPEN_SECONDS", "30"))
+CIRCUIT_MAX_OPEN_SECONDS = float(os.environ.get("CIRCUIT_MAX_OPEN_SECONDS", "300"))
+CIRCUIT_HALF_OPEN_CALLS = int(os.environ.get("CIRCUIT_HALF_OPEN_CALLS", "2"))
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+# Values of the state gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+logger = get_logger(__name__)
+
+CIRCUIT_STATE = metrics_registry.gauge(
+    "agenticai_circuit_state", "Circuit breaker state: 0 closed, 1 half-open, 2 open.", ("breaker",))
+CIRCUIT_TRANSITIONS = metrics_registry.counter(
+    "agenticai_circuit_transitions_total", "Circuit breaker state changes.", ("breaker", "state"))
+CIRCUIT_REJECTED = metrics_registry.counter(
+    "agenticai_circuit_rejected_total", "Upstream calls failed fast because the circuit was open.", ("breaker",))
+CIRCUIT_FALLBACKS = metrics_registry.counter(
+    "agenticai_circuit_fallbacks_total", "Degraded results served instead of a rejected call.", ("breaker", "kind"))
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an upstream whose circuit is open.
+    """
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} is unavailable (circuit open, retrying in {retry_in:.0f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker over the calls to one upstream in the last `window` seconds.
+
+    - closed: calls pass. With at least `min_calls` calls in the window, the circuit opens
+      when the share of failed calls reaches `failure_rate`, or the share of calls slower
+      than `slow_call_seconds` reaches `slow_call_rate`.
+    - open: calls fail at once with CircuitOpenError for `open_seconds`.
+    - half-open: up to `half_open_calls` probe calls pass. The circuit closes once they all
+      succeed and reopens, for twice as long (up to `max_open_seconds`), if one fails.
+    """
+    def __init__(self, name: str, window: float = CIRCUIT_WINDOW, min_calls: int = CIRCUIT_MIN_CALLS,
+                 failure_rate: float = CIRCUIT_FAILURE_RATE, slow_call_seconds: float = 10.0,
+                 slow_call_rate: float = CIRCUIT_SLOW_CALL_RATE, open_seconds: float = CIRCUIT_OPEN_SECONDS,
+                 max_open_seconds: float = CIRCUIT_MAX_OPEN_SECONDS, half_open_calls: int = CIRCUIT_HALF_OPEN_CALLS):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self.open_seconds = open_seconds
+        self.opened_at = 0.0
+        self._calls = deque()  # (finished at, failed, slow)
+        self._failures = 0
+        self._slow_calls = 0
+        self._probes = 0
+        self._probe_successes = 0
+        self._half_open_at = 0.0
+        self._lock = threading.Lock()
+        self.rejected = 0
+        CIRCUIT_STATE.set(STATE_VALUES[CLOSED], breaker=name)
+
+    def allow(self) -> bool:
+        """
+        Raises CircuitOpenError when the call must fail fast; otherwise returns True if
+        the call is a half-open probe (pass it back to `record`).
+        """
+        if not CIRCUIT_BREAKERS_ENABLED:
+            return False
+        with self._lock:
+            if self.state == CLOSED:
+                return False
+            now = time.monotonic()
+            if self.state == OPEN and now - self.opened_at >= self.open_seconds:
+                self._transition(HALF_OPEN)
+                self._probes = self._probe_successes = 0
+                self._half_open_at = now
+            if self.state == HALF_OPEN and now - self._half_open_at > self.open_seconds:
+                # Probes that never reported back (e.g. cancelled while queued) free their slots
+                self._probes = 0
+                self._half_open_at = now
+            if self.state == HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            retry_in = max(0.0, self.opened_at + self.open_seconds - now)
+        CIRCUIT_REJECTED.inc(breaker=self.name)
+        raise CircuitOpenError(self.name, retry_in)
+
+    def record(self, ok: bool, seconds: float, probe: bool = False):
+        """
+        Records the outcome of a call that `allow` let through.
+        """
+        if not CIRCUIT_BREAKERS_ENABLED:
+            return
+        now = time.monotonic()
+        slow = seconds >= self.slow_call_seconds
+        with self._lock:
+            self._calls.append((now, not ok, slow))
+            self._failures += not ok
+            self._slow_calls += slow
+            while self._calls and now - self._calls[0][0] > self.window:
+                _, failed, was_slow = self._calls.popleft()
+                self._failures -= failed
+                self._slow_calls -= was_slow
+
+            if self.state == HALF_OPEN and probe:
+                self._probes -= 1
+                if not ok or slow:
+                    self.open_seconds = min(self.max_open_seconds, self.open_seconds * 2)
+                    self._open(now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_calls:
+                    self.open_seconds = self.base_open_seconds
+                    # Calls from before the outage no longer describe the upstream
+                    self._calls.clear()
+                    self._failures = self._slow_calls = 0
+                    self._transition(CLOSED)
+                return
+
+            calls = len(self._calls)
+            if self.state == CLOSED and calls >= self.min_calls and (
+                    self._failures / calls >= self.failure_rate or self._slow_calls / calls >= self.slow_call_rate):
+                self._open(now)
+
+    def cancel(self, probe: bool):
+        """
+        Frees the probe slot of a call that was cancelled before it had an outcome.
+        """
+        if not probe:
+            return
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def is_open(self) -> bool:
+        """
+        True while calls are being rejected (an open circuit before its half-open probe).
+        """
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self.opened_at < self.open_seconds
+
+    def stats(self) -> dict:
+        with self._lock:
+            calls = len(self._calls)
+            return {
+                "state": self.state,
+                "calls": calls,
+                "failure_rate": self._failures / calls if calls else 0.0,
+                "slow_call_rate": self._slow_calls / calls if calls else 0.0,
+                "rejected": self.rejected,
+                "open_seconds": self.open_seconds,
+            }
+
+    def _open(self, now: float):
+        self.opened_at = now
+        self._transition(OPEN)
+
+    def _transition(self, state: str):
+        # Called with the lock held
+        self.state = state
+        CIRCUIT_STATE.set(STATE_VALUES[state], breaker=self.name)
+        CIRCUIT_TRANSITIONS.inc(breaker=self.name, state=state)
+        logger.warning("circuit breaker state changed", extra={"breaker": self.name, "state": state})
+
+
+def record_fallback(name: str, kind: str):
+    """
+    Counts a degraded result (e.g. an expired cache entry or a fallback model) served
+    because the circuit `name` was open.
+    """
+    CIRCUIT_FALLBACKS.inc(breaker=name, kind=kind)
+    logger.info("serving degraded result", extra={"breaker": name, "kind": kind})
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, **settings) -> CircuitBreaker:
+    """
+    Returns the process-wide breaker `name`; `settings` apply when it is created.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, **settings)
+        return breaker
+
+
+def circuit_open(name: str) -> bool:
+    """
+    True when the breaker `name` exists and is rejecting calls.
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+    return breaker is not None and breaker.is_open()
+
+
+def breaker_stats() -> dict:
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
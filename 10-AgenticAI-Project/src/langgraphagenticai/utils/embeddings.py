@@ -0,0 +1,65 @@
+import os
+import re
+import zlib
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# "hashing" (offline, no model download) or "huggingface:<model name>" for a local sentence-transformers model
+SEMANTIC_CACHE_EMBEDDER = os.environ.get("SEMANTIC_CACHE_EMBEDDER", "hashing")
+
+_WORD = re.compile(r"\w+")
+
+# Function words carry little meaning in short questions; dropping them lets
+# "how do I start a business" and "how can I start a business" embed the same
+STOPWORDS = frozenset("""
+a an the and or but if of to in on at for with about from by as into is are was were be been
+do does did can could should would will shall may might must i me my we our you your it its
+this that these those what which who whom how why when where there here please tell some any
+""".split())
+
+
+class HashingEmbedder(Embeddings):
+    """
+    Offline embedder based on the hashing trick: content words, word bigrams and character
+    trigrams are hashed into `dim` buckets and the vector is L2-normalized.
+    Good enough to match paraphrases that share most of their wording, with no model
+    download and microsecond latency.
+    """
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+
+    def embed_query(self, text: str) -> list:
+        return self.embed_array(text).tolist()
+
+    def embed_documents(self, texts: list) -> list:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_array(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        words = [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS] or _WORD.findall(text.lower())
+        features = [(f"w:{w}", 1.0) for w in words]
+        features += [(f"b:{a} {b}", 1.0) for a, b in zip(words, words[1:])]
+        for word in words:
+            padded = f" {word} "
+            features += [(f"c:{padded[i:i + 3]}", 0.5) for i in range(len(padded) - 2)]
+
+        for feature, weight in features:
+            digest = zlib.crc32(feature.encode("utf-8"))
+            # The top bit picks the sign so collisions cancel out instead of piling up
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vector[digest % self.dim] += sign * weight
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+def get_embedder(spec: str = SEMANTIC_CACHE_EMBEDDER) -> Embeddings:
+    """
+    Builds the embedder named by `spec`.
+    """
+    if spec.startswith("huggingface:"):
+        # Optional dependency: only needed when a local sentence-transformers model is configured
+        from langchain_community.embeddings import HuggingFaceEmbeddings
+        return HuggingFaceEmbeddings(model_name=spec.split(":", 1)[1])
+    return HashingEmbedder()
@@ -0,0 +1,11 @@
+import hashlib
+
+
+def fingerprint(value, length: int = 16) -> str:
+    """
+    Returns a short, stable SHA-256 fingerprint of a value.
+    Used to key caches on secrets (API keys) without keeping them in plain text.
+    """
+    if value is None:
+        value = ""
+    return hashlib.sha256(str(value).encode("utf-8")).hexdigest()[:length]
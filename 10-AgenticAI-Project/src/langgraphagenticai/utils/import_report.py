@@ -0,0 +1,187 @@
+import builtins
+import importlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+
+# Only the standard library is imported above: the module also runs as the profiled
+# child process (see `measure`), where anything imported early would go uncounted.
+
+FIRST_PARTY = "langgraphagenticai"
+
+
+def _is_first_party(name: str) -> bool:
+    return name == FIRST_PARTY or name.startswith(FIRST_PARTY + ".")
+
+
+def subsystem(name: str) -> str:
+    """
+    Groups a first-party module by its subpackage (e.g. langgraphagenticai.nodes).
+    """
+    return ".".join(name.split(".")[:2])
+
+
+def profile_imports(code: str) -> list:
+    """
+    Executes `code` and records every import it triggers, like `python -X importtime`.
+
+    -X importtime loses the nesting of imports made through `importlib.import_module`,
+    which langchain's lazy `__getattr__` imports use, so they could not be attributed.
+    Here `__import__` and `importlib.import_module` are wrapped instead, and each record
+    keeps the first-party module that imported it (directly or through other packages).
+    Returns dicts with name, owner, self_ms and cumulative_ms.
+    """
+    records = []
+    stack = []  # [name, owner, child seconds] of the imports in progress
+
+    def new_module(name, globals_=None, fromlist=(), level=0):
+        if level:
+            package = (globals_ or {}).get("__package__") or ""
+            name = importlib.util.resolve_name("." * level + name, package)
+        if name not in sys.modules:
+            return name
+        for attr in fromlist or ():
+            submodule = f"{name}.{attr}"
+            if attr != "*" and submodule not in sys.modules:
+                return submodule
+        return None
+
+    def timed(name, load, importer):
+        if _is_first_party(name):
+            owner = name
+        elif importer and _is_first_party(importer):
+            owner = importer
+        else:
+            owner = stack[-1][1] if stack else None
+        frame = [name, owner, 0.0]
+        stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return load()
+        finally:
+            elapsed = time.perf_counter() - started
+            stack.pop()
+            if stack:
+                stack[-1][2] += elapsed
+            records.append({
+                "name": name,
+                "owner": owner,
+                "self_ms": (elapsed - frame[2]) * 1000,
+                "cumulative_ms": elapsed * 1000,
+            })
+
+    original_import = builtins.__import__
+    original_import_module = importlib.import_module
+
+    def profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+        target = new_module(name, globals, fromlist, level)
+        if target is None:
+            return original_import(name, globals, locals, fromlist, level)
+        importer = (globals or {}).get("__name__")
+        return timed(target, lambda: original_import(name, globals, locals, fromlist, level), importer)
+
+    def profiled_import_module(name, package=None):
+        target = importlib.util.resolve_name(name, package) if name.startswith(".") else name
+        if target in sys.modules:
+            return original_import_module(name, package)
+        importer = sys._getframe(1).f_globals.get("__name__")
+        return timed(target, lambda: original_import_module(name, package), importer)
+
+    builtins.__import__ = profiled_import
+    importlib.import_module = profiled_import_module
+    try:
+        exec(compile(code, "<import-report>", "exec"), {"__name__": "__import_report__"})
+    finally:
+        builtins.__import__ = original_import
+        importlib.import_module = original_import_module
+    return records
+
+
+def summarize(records: list) -> dict:
+    """
+    Returns the total import time and two breakdowns, in milliseconds:
+    - `subsystems`: each first-party subpackage with the third-party and standard library
+      modules it imported (a module is charged to the first-party module that imported it first);
+    - `packages`: self time per top-level package.
+    """
+    subsystems, packages = Counter(), Counter()
+    for record in records:
+        owner = record["owner"]
+        subsystems[subsystem(owner) if owner else "(direct)"] += record["self_ms"]
+        packages[record["name"].split(".")[0]] += record["self_ms"]
+
+    def rounded(counter):
+        return {key: round(ms, 1) for key, ms in counter.most_common()}
+
+    return {
+        "total_ms": round(sum(record["self_ms"] for record in records), 1),
+        "modules": len(records),
+        "subsystems": rounded(subsystems),
+        "packages": rounded(packages),
+    }
+
+
+def measure(code: str, setup: str = "", cwd: str = None, env: dict = None) -> dict:
+    """
+    Runs `setup` and then `code` in a fresh interpreter and summarizes the imports made
+    by `code` only (e.g. setup imports the app, code selects a use case).
+    """
+    result = subprocess.run(
+        # run_path keeps the working directory (not this module's) at the front of sys.path
+        [sys.executable, "-c", "import runpy, sys; runpy.run_path(sys.argv[1], run_name='__main__')",
+         os.path.abspath(__file__), setup, code],
+        cwd=cwd,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr[-2000:]}")
+    return summarize(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def best_of(reports: list) -> dict:
+    """
+    Combines repeated measurements, keeping the fastest time per entry (the least noisy).
+    """
+    combined = {
+        "total_ms": min(report["total_ms"] for report in reports),
+        "modules": reports[0]["modules"],
+    }
+    for section in ("subsystems", "packages"):
+        keys = {key for report in reports for key in report[section]}
+        values = {key: min(report[section].get(key, 0.0) for report in reports) for key in keys}
+        combined[section] = dict(sorted(values.items(), key=lambda item: -item[1]))
+    return combined
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.2, min_ms: float = 5.0) -> list:
+    """
+    Rows for the total and every subsystem; `regression` is set when an entry grew by
+    more than `tolerance` and by at least `min_ms`.
+    """
+    entries = [("total", baseline.get("total_ms", 0.0), current["total_ms"])]
+    for key in sorted(set(current["subsystems"]) | set(baseline.get("subsystems", {}))):
+        entries.append((key, baseline.get("subsystems", {}).get(key, 0.0), current["subsystems"].get(key, 0.0)))
+
+    rows = []
+    for key, old, new in entries:
+        growth = new - old
+        rows.append({
+            "entry": key,
+            "baseline_ms": old,
+            "current_ms": new,
+            "change": round(growth / old, 4) if old else None,
+            "regression": growth >= min_ms and (not old or growth / old > tolerance),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    ## Child process of `measure`: argv is [-c, this file, setup code, measured code]
+    exec(compile(sys.argv[2], "<import-report-setup>", "exec"), {"__name__": "__import_report__"})
+    print(json.dumps(profile_imports(sys.argv[3])))
@@ -0,0 +1,248 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable, RunnableLambda
+from langgraph.errors import GraphBubbleUp
+
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.metrics import metrics_registry
+from langgraphagenticai.utils.tokens import count_tokens
+
+# Set INSTRUMENT_NODES=0 to compile graphs without the per-node wrappers
+INSTRUMENT_NODES = os.environ.get("INSTRUMENT_NODES", "1") != "0"
+
+logger = get_logger(__name__)
+
+NODE_SECONDS = metrics_registry.histogram(
+    "agenticai_node_duration_seconds", "Wall time of one graph node run.", ("usecase", "node"))
+NODE_LLM_SECONDS = metrics_registry.histogram(
+    "agenticai_node_llm_seconds", "Time a node run spent in LLM calls, summed over concurrent calls.", ("usecase", "node"))
+NODE_TOOL_SECONDS = metrics_registry.histogram(
+    "agenticai_node_tool_seconds", "Time a node run spent in tool and search calls, summed over concurrent calls.", ("usecase", "node"))
+NODE_TOKENS = metrics_registry.counter(
+    "agenticai_node_tokens_total", "LLM tokens used by graph nodes.", ("usecase", "node", "type"))
+NODE_RUNS = metrics_registry.counter(
+    "agenticai_node_runs_total", "Graph node runs by outcome.", ("usecase", "node", "status"))
+NODE_ERRORS = metrics_registry.counter(
+    "agenticai_node_errors_total", "Exceptions raised or handled inside graph nodes.", ("usecase", "node", "error"))
+LLM_SECONDS = metrics_registry.histogram(
+    "agenticai_llm_call_seconds", "Latency of one LLM call.", ("model", "status"))
+UPSTREAM_SECONDS = metrics_registry.histogram(
+    "agenticai_upstream_call_seconds", "Latency of one rate-limited upstream call (e.g. Tavily).", ("provider", "status"))
+
+
+class NodeScope:
+    """
+    Counters for one node run. LLM calls, tool calls and handled errors inside the run
+    add to the scope of the node that is running (tracked with a context variable).
+    """
+    __slots__ = ("usecase", "node", "llm_seconds", "llm_calls", "tool_seconds", "tool_calls",
+                 "prompt_tokens", "completion_tokens", "errors", "_lock")
+
+    def __init__(self, usecase: str, node: str):
+        self.usecase = usecase
+        self.node = node
+        self.llm_seconds = 0.0
+        self.llm_calls = 0
+        self.tool_seconds = 0.0
+        self.tool_calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.errors = []
+        # Map-reduce summaries and parallel tool calls report from worker threads
+        self._lock = threading.Lock()
+
+    def add_llm(self, seconds: float, prompt_tokens: int, completion_tokens: int):
+        with self._lock:
+            self.llm_seconds += seconds
+            self.llm_calls += 1
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def add_tool(self, seconds: float):
+        with self._lock:
+            self.tool_seconds += seconds
+            self.tool_calls += 1
+
+    def add_error(self, error: str):
+        with self._lock:
+            self.errors.append(error)
+
+
+_current_scope = contextvars.ContextVar("agenticai_node_scope", default=None)
+
+
+def record_error(e: Exception):
+    """
+    Counts an exception a node caught and turned into an error state or message.
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.add_error(type(e).__name__)
+
+
+def record_upstream_call(provider: str, seconds: float, ok: bool = True):
+    UPSTREAM_SECONDS.observe(seconds, provider=provider, status="ok" if ok else "error")
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.add_tool(seconds)
+
+
+def _finish(scope: NodeScope, started: float, error: Exception = None):
+    wall = time.perf_counter() - started
+    labels = {"usecase": scope.usecase, "node": scope.node}
+    # Interrupts and Command jumps are control flow, not failures
+    failed = error is not None and not isinstance(error, GraphBubbleUp)
+    errors = scope.errors + ([type(error).__name__] if failed else [])
+
+    NODE_SECONDS.observe(wall, **labels)
+    if scope.llm_calls:
+        NODE_LLM_SECONDS.observe(scope.llm_seconds, **labels)
+        NODE_TOKENS.inc(scope.prompt_tokens, type="prompt", **labels)
+        NODE_TOKENS.inc(scope.completion_tokens, type="completion", **labels)
+    if scope.tool_calls:
+        NODE_TOOL_SECONDS.observe(scope.tool_seconds, **labels)
+    for name in errors:
+        NODE_ERRORS.inc(error=name, **labels)
+    status = "error" if errors else "ok"
+    NODE_RUNS.inc(status=status, **labels)
+
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("node finished", extra={
+        "usecase": scope.usecase,
+        "node": scope.node,
+        "status": status,
+        "wall_ms": round(wall * 1000, 1),
+        "llm_ms": round(scope.llm_seconds * 1000, 1),
+        "llm_calls": scope.llm_calls,
+        "tool_ms": round(scope.tool_seconds * 1000, 1),
+        "tool_calls": scope.tool_calls,
+        "prompt_tokens": scope.prompt_tokens,
+        "completion_tokens": scope.completion_tokens,
+        "errors": errors,
+    })
+
+
+def instrument_node(usecase: str, name: str, node):
+    """
+    Wraps a graph node (function, coroutine function or runnable) so every run records
+    its wall, LLM and tool time, tokens and errors under (usecase, name).
+    The wrapper keeps the node's signature, so LangGraph passes it the same arguments.
+    """
+    if not INSTRUMENT_NODES:
+        return node
+
+    def run(call):
+        scope = NodeScope(usecase, name)
+        token = _current_scope.set(scope)
+        started = time.perf_counter()
+        try:
+            result = call()
+        except Exception as e:
+            _finish(scope, started, e)
+            raise
+        finally:
+            _current_scope.reset(token)
+        _finish(scope, started)
+        return result
+
+    async def arun(acall):
+        scope = NodeScope(usecase, name)
+        token = _current_scope.set(scope)
+        started = time.perf_counter()
+        try:
+            result = await acall()
+        except Exception as e:
+            _finish(scope, started, e)
+            raise
+        finally:
+            _current_scope.reset(token)
+        _finish(scope, started)
+        return result
+
+    if isinstance(node, Runnable):
+        def invoke(state, config):
+            return run(lambda: node.invoke(state, config))
+
+        async def ainvoke(state, config):
+            return await arun(lambda: node.ainvoke(state, config))
+
+        return RunnableLambda(invoke, afunc=ainvoke, name=name)
+
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(*args, **kwargs):
+            return await arun(lambda: node(*args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(*args, **kwargs):
+        return run(lambda: node(*args, **kwargs))
+    return wrapper
+
+
+def _token_usage(response, prompt_texts: list) -> tuple:
+    """
+    Returns (prompt, completion) tokens of an LLMResult as reported by the provider,
+    or counted locally when it didn't report usage (e.g. some streamed completions).
+    """
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    if usage:
+        return usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0)
+    completion = sum(count_tokens(generation.text) for generations in response.generations for generation in generations)
+    return sum(count_tokens(text) for text in prompt_texts), completion
+
+
+class LLMMetricsHandler(BaseCallbackHandler):
+    """
+    Callback handler attached to the pooled LLM clients; times every call and adds its
+    duration and token usage to the node that made it.
+    """
+    # Run in the caller's context (not an executor) so the node scope is visible
+    run_inline = True
+
+    def __init__(self, model: str):
+        self.model = model
+        self._started = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        texts = [m.content if isinstance(m.content, str) else str(m.content) for batch in messages for m in batch]
+        self._started[run_id] = (time.perf_counter(), _current_scope.get(), texts)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._started[run_id] = (time.perf_counter(), _current_scope.get(), prompts)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        started_at, scope, prompt_texts = started
+        seconds = time.perf_counter() - started_at
+        LLM_SECONDS.observe(seconds, model=self.model, status="ok")
+        if scope is not None:
+            scope.add_llm(seconds, *_token_usage(response, prompt_texts))
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        started_at, scope, _ = started
+        seconds = time.perf_counter() - started_at
+        # Hedged calls that lost the race are cancelled, not failed
+        cancelled = isinstance(error, (asyncio.CancelledError, GeneratorExit))
+        LLM_SECONDS.observe(seconds, model=self.model, status="cancelled" if cancelled else "error")
+        if scope is not None:
+            scope.add_llm(seconds, 0, 0)
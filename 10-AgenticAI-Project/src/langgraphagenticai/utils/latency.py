@@ -0,0 +1,52 @@
+import threading
+from collections import defaultdict, deque
+
+
+class LatencyTracker:
+    """
+    Keeps a bounded window of latency samples (in seconds) per key and reports percentiles.
+    """
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float):
+        with self._lock:
+            self._samples[key].append(seconds)
+
+    def percentile(self, key: str, q: float, default=None):
+        """
+        Returns the q-th percentile (0-100) for the key, or `default` when there are no samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+        if not samples:
+            return default
+        index = min(len(samples) - 1, max(0, round(q / 100 * (len(samples) - 1))))
+        return samples[index]
+
+    def count(self, key: str) -> int:
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def summary(self) -> dict:
+        """
+        Returns count, mean, p50, p95 and p99 per key.
+        """
+        with self._lock:
+            keys = list(self._samples)
+        result = {}
+        for key in keys:
+            with self._lock:
+                samples = list(self._samples[key])
+            if not samples:
+                continue
+            result[key] = {
+                "count": len(samples),
+                "mean": sum(samples) / len(samples),
+                "p50": self.percentile(key, 50),
+                "p95": self.percentile(key, 95),
+                "p99": self.percentile(key, 99),
+            }
+        return result
@@ -0,0 +1,60 @@
+import json
+import logging
+import os
+import sys
+import time
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+# "json" for one JSON object per line (log shippers), "text" for humans
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        fields = " ".join(f"{k}={v}" for k, v in vars(record).items() if k not in _RECORD_ATTRIBUTES)
+        line = f"{time.strftime('%H:%M:%S', time.localtime(record.created))} {record.levelname} {record.name}: {record.getMessage()}"
+        if fields:
+            line += f" {fields}"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def _configure_root():
+    root = logging.getLogger("langgraphagenticai")
+    if root.handlers:
+        return root
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+    root.addHandler(handler)
+    root.setLevel(LOG_LEVEL)
+    root.propagate = False
+    return root
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Returns a logger under the package's structured handler. Pass fields with
+    `extra={...}`; they become top-level keys of the JSON line.
+    """
+    _configure_root()
+    if not name.startswith("langgraphagenticai"):
+        name = f"langgraphagenticai.{name}"
+    return logging.getLogger(name)
@@ -0,0 +1,113 @@
+import re
+from dataclasses import dataclass, field
+
+from langgraphagenticai.utils.tokens import count_tokens, truncate_to_tokens
+
+# Context windows of the models offered in uiconfigfile.ini
+MODEL_CONTEXT_TOKENS = {
+    "llama3-8b-8192": 8192,
+    "llama3-70b-8192": 8192,
+    "meta-llama/llama-4-scout-17b-16e-instruct": 131072,
+    "qwen/qwen3-32b": 131072,
+    "deepseek-r1-distill-llama-70b": 131072,
+}
+DEFAULT_CONTEXT_TOKENS = 8192
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def context_budget(model_name: str, reserved_tokens: int = 2048, max_tokens: int = None) -> int:
+    """
+    Returns the tokens available for packed context on `model_name`, keeping
+    `reserved_tokens` free for the instructions and the completion.
+    """
+    budget = MODEL_CONTEXT_TOKENS.get(model_name, DEFAULT_CONTEXT_TOKENS) - reserved_tokens
+    if max_tokens is not None:
+        budget = min(budget, max_tokens)
+    return max(budget, 0)
+
+
+@dataclass
+class PackItem:
+    text: str
+    score: float = 0.0
+
+
+@dataclass
+class PackResult:
+    text: str
+    items: list = field(default_factory=list)
+    used_tokens: int = 0
+    dropped_tokens: int = 0
+    truncated: int = 0
+    dropped: int = 0
+
+
+class PromptPacker:
+    """
+    Packs context items into a token budget in one pass.
+    Items are ranked by score (ties keep their input order); an item that doesn't fit is
+    truncated at a sentence boundary if at least `min_item_tokens` remain, otherwise dropped.
+    """
+    def __init__(self, budget_tokens: int, separator: str = "\n\n", min_item_tokens: int = 48):
+        self.budget_tokens = budget_tokens
+        self.separator = separator
+        self.min_item_tokens = min_item_tokens
+        self._separator_tokens = count_tokens(separator)
+
+    def pack(self, items: list) -> PackResult:
+        ranked = sorted(items, key=lambda item: item.score, reverse=True)
+        result = PackResult(text="")
+        parts = []
+
+        for item in ranked:
+            tokens = count_tokens(item.text)
+            overhead = self._separator_tokens if parts else 0
+            remaining = self.budget_tokens - result.used_tokens - overhead
+
+            if tokens <= remaining:
+                parts.append(item.text)
+                result.items.append(item)
+                result.used_tokens += tokens + overhead
+                continue
+
+            if remaining >= self.min_item_tokens:
+                text = truncate_at_sentence(item.text, remaining)
+                text_tokens = count_tokens(text)
+                if text and text_tokens <= remaining:
+                    parts.append(text)
+                    result.items.append(PackItem(text=text, score=item.score))
+                    result.used_tokens += text_tokens + overhead
+                    result.dropped_tokens += tokens - text_tokens
+                    result.truncated += 1
+                    continue
+
+            result.dropped_tokens += tokens
+            result.dropped += 1
+
+        result.text = self.separator.join(parts)
+        return result
+
+
+def truncate_at_sentence(text: str, max_tokens: int) -> str:
+    """
+    Returns the longest prefix of `text` that ends at a sentence boundary and fits in
+    `max_tokens`; when even the first sentence is too long it is cut at the token limit.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # Token counts grow with the prefix, so binary search the sentence boundaries
+    boundaries = [match.start() for match in _SENTENCE_END.finditer(text)]
+    low, high, best = 0, len(boundaries) - 1, None
+    while low <= high:
+        middle = (low + high) // 2
+        if count_tokens(text[:boundaries[middle]]) <= max_tokens:
+            best = boundaries[middle]
+            low = middle + 1
+        else:
+            high = middle - 1
+
+    if best is not None:
+        return text[:best]
+    return truncate_to_tokens(text, max_tokens)
@@ -0,0 +1,239 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+from langgraphagenticai.utils.latency import LatencyTracker
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket refilled at `per_minute / 60` tokens per second.
+    A reservation may drive the level negative; the caller then waits until the bucket
+    has refilled past zero, so reservations are served strictly in the order they were made.
+    """
+    def __init__(self, per_minute: float, burst: float = None):
+        self.rate = per_minute / 60.0
+        self.capacity = burst or per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        Takes `amount` tokens and returns the seconds to wait before using them.
+        """
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+        wait = -self.level / self.rate if self.level < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def adjust(self, amount: float, now: float):
+        """
+        Corrects an earlier reservation by `amount` tokens (positive takes more).
+        """
+        self._refill(now)
+        self.level -= amount
+
+    def sync(self, remaining: float, now: float):
+        """
+        Lowers the level to what the provider reports as remaining.
+        """
+        self._refill(now)
+        self.level = min(self.level, remaining)
+
+    def pause(self, seconds: float, now: float):
+        """
+        Blocks new reservations for `seconds` (e.g. a Retry-After) and empties the bucket.
+        """
+        self._refill(now)
+        self.level = min(self.level, 0.0)
+        self.paused_until = max(self.paused_until, now + seconds)
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class Ticket:
+    """
+    One caller's place in the limiter queue; returned by `acquire` and passed back to `release`.
+    """
+    def __init__(self, tokens: float):
+        self.tokens = tokens
+        self.enqueued_at = time.monotonic()
+        self.started_at = None
+        self.delay = 0.0
+        self.granted = False
+        self.released = False
+        self._event = None
+        self._future = None
+        self._loop = None
+
+    def _notify(self):
+        if self._event is not None:
+            self._event.set()
+        elif self._future is not None:
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self._future.done():
+            self._future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """
+    Process-wide limiter for one upstream, shared by threads and event loops.
+
+    - Requests-per-minute and tokens-per-minute token buckets.
+    - A concurrency limit adjusted by AIMD: +1 per `limit` successful calls, halved on a
+      429 (at most once per `decrease_cooldown` seconds) and cut by 10% when a call is
+      slower than `latency_target`.
+    - Callers are admitted strictly first-come first-served.
+    """
+    def __init__(self, name: str, rpm: float = None, tpm: float = None, max_concurrency: int = 16,
+                 min_concurrency: int = 1, latency_target: float = None, decrease_cooldown: float = 1.0):
+        self.name = name
+        self.requests = TokenBucket(rpm) if rpm else None
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.latency_target = latency_target
+        self.decrease_cooldown = decrease_cooldown
+        self.limit = float(max(min_concurrency, max_concurrency // 2))
+        self._in_flight = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+        self._last_decrease = 0.0
+        self.wait_times = LatencyTracker()
+        self.calls = 0
+        self.throttled = 0
+        self.errors = 0
+
+    def acquire(self, tokens: float = 0) -> Ticket:
+        """
+        Blocks until the caller may send a request estimated at `tokens` tokens.
+        """
+        ticket = Ticket(tokens)
+        ticket._event = threading.Event()
+        self._enqueue(ticket)
+        ticket._event.wait()
+        if ticket.delay > 0:
+            time.sleep(ticket.delay)
+        return self._started(ticket)
+
+    async def aacquire(self, tokens: float = 0) -> Ticket:
+        """
+        Async variant of `acquire`; waits without blocking the event loop.
+        """
+        ticket = Ticket(tokens)
+        ticket._loop = asyncio.get_running_loop()
+        ticket._future = ticket._loop.create_future()
+        self._enqueue(ticket)
+        try:
+            await ticket._future
+            if ticket.delay > 0:
+                await asyncio.sleep(ticket.delay)
+        except asyncio.CancelledError:
+            self._abandon(ticket)
+            raise
+        return self._started(ticket)
+
+    def release(self, ticket: Ticket, throttled: bool = False, failed: bool = False, latency: float = None,
+                retry_after: float = None, remaining_requests: float = None, remaining_tokens: float = None,
+                used_tokens: float = None):
+        """
+        Frees the caller's slot and feeds the outcome of the call back into the limits.
+        """
+        now = time.monotonic()
+        if latency is None and ticket.started_at is not None:
+            latency = now - ticket.started_at
+
+        with self._lock:
+            if ticket.released:
+                return
+            ticket.released = True
+            self._in_flight -= 1
+            self.calls += 1
+
+            if throttled:
+                self.throttled += 1
+                self._decrease(0.5, now)
+                pause = retry_after if retry_after is not None else 1.0
+                for bucket in (self.requests, self.tokens):
+                    if bucket:
+                        bucket.pause(pause, now)
+            elif failed:
+                self.errors += 1
+            elif self.latency_target and latency is not None and latency > self.latency_target:
+                self._decrease(0.9, now)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+
+            if self.requests and remaining_requests is not None:
+                self.requests.sync(remaining_requests, now)
+            if self.tokens and remaining_tokens is not None:
+                self.tokens.sync(remaining_tokens, now)
+            elif self.tokens and used_tokens is not None:
+                self.tokens.adjust(used_tokens - ticket.tokens, now)
+
+            granted = self._grant()
+        for waiter in granted:
+            waiter._notify()
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "concurrency_limit": round(self.limit, 2),
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "calls": self.calls,
+                "throttled": self.throttled,
+                "errors": self.errors,
+            }
+        stats["wait_p50_ms"] = self.wait_times.percentile("wait", 50, 0.0) * 1000
+        stats["wait_p95_ms"] = self.wait_times.percentile("wait", 95, 0.0) * 1000
+        return stats
+
+    def _enqueue(self, ticket: Ticket):
+        with self._lock:
+            self._waiters.append(ticket)
+            granted = self._grant()
+        for waiter in granted:
+            waiter._notify()
+
+    def _grant(self) -> list:
+        # Called with the lock held; admits waiters in FIFO order while slots are free
+        granted = []
+        now = time.monotonic()
+        while self._waiters and self._in_flight < int(self.limit):
+            ticket = self._waiters.popleft()
+            self._in_flight += 1
+            ticket.granted = True
+            # Reserving at admission keeps the rate buckets in queue order as well
+            delays = [0.0]
+            if self.requests:
+                delays.append(self.requests.reserve(1, now))
+            if self.tokens and ticket.tokens:
+                delays.append(self.tokens.reserve(ticket.tokens, now))
+            ticket.delay = max(delays)
+            granted.append(ticket)
+        return granted
+
+    def _abandon(self, ticket: Ticket):
+        with self._lock:
+            if not ticket.granted:
+                self._waiters.remove(ticket)
+                return
+        self.release(ticket, failed=True)
+
+    def _started(self, ticket: Ticket) -> Ticket:
+        ticket.started_at = time.monotonic()
+        self.wait_times.record("wait", ticket.started_at - ticket.enqueued_at)
+        return ticket
+
+    def _decrease(self, factor: float, now: float):
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_concurrency, self.limit * factor)
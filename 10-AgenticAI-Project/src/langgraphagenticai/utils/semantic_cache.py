@@ -0,0 +1,134 @@
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from langgraphagenticai.utils.embeddings import HashingEmbedder
+from langgraphagenticai.utils.latency import LatencyTracker
+from langgraphagenticai.utils.log import get_logger
+from langgraphagenticai.utils.text import key_terms, normalize_query
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """
+    Response cache looked up by meaning instead of exact text.
+
+    Queries are embedded and kept as rows of a preallocated, L2-normalized matrix, so a
+    lookup is one matrix-vector product. The nearest entry is a hit when its cosine
+    similarity is at least `threshold`, it is younger than `ttl` and, when the query is
+    given, it has the same negations and numbers (`key_terms`), which embeddings barely
+    tell apart. When all `max_size` slots are taken, the least recently used entry is
+    overwritten.
+
+    `embedder` is any LangChain `Embeddings`; `HashingEmbedder` works offline.
+    """
+    def __init__(self, embedder=None, threshold: float = 0.9, ttl: float = 3600,
+                 max_size: int = 1024, name: str = "semantic-cache"):
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_size = max_size
+        self.name = name
+        self._vectors = None  # allocated on the first insert, once the dimension is known
+        self._values = [None] * max_size
+        self._stored_at = np.full(max_size, -np.inf)
+        self._slots = OrderedDict()  # slot -> query, in LRU order
+        self._lock = threading.RLock()
+        self.latency = LatencyTracker()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def embed(self, query: str) -> np.ndarray:
+        started = time.perf_counter()
+        text = normalize_query(query)
+        if isinstance(self.embedder, HashingEmbedder):
+            vector = self.embedder.embed_array(text)
+        else:
+            vector = self._normalize(self.embedder.embed_query(text))
+        self.latency.record("embed", time.perf_counter() - started)
+        return vector
+
+    async def aembed(self, query: str) -> np.ndarray:
+        if isinstance(self.embedder, HashingEmbedder):
+            return self.embed(query)
+        started = time.perf_counter()
+        vector = self._normalize(await self.embedder.aembed_query(normalize_query(query)))
+        self.latency.record("embed", time.perf_counter() - started)
+        return vector
+
+    def lookup(self, vector: np.ndarray, query: str = None):
+        """
+        Returns the cached value nearest to `vector`, or None on a miss.
+        With `query`, entries whose key terms differ from it are skipped.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            value, similarity = None, 0.0
+            if self._slots:
+                scores = self._vectors @ vector
+                # Empty and expired slots can never match
+                scores[self._stored_at < time.time() - self.ttl] = -np.inf
+                candidates = np.flatnonzero(scores >= self.threshold)
+                terms = key_terms(query) if query is not None else None
+                for slot in candidates[np.argsort(-scores[candidates])]:
+                    slot = int(slot)
+                    if terms is not None and key_terms(self._slots[slot]) != terms:
+                        continue
+                    value, similarity = self._values[slot], float(scores[slot])
+                    self._slots.move_to_end(slot)
+                    break
+
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        self.latency.record("lookup", time.perf_counter() - started)
+        if value is not None:
+            logger.debug("semantic cache hit", extra={"cache": self.name, "similarity": round(float(similarity), 3)})
+        return value
+
+    def add(self, query: str, vector: np.ndarray, value):
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_size, len(vector)), dtype=np.float32)
+
+            if len(self._slots) < self.max_size:
+                slot = len(self._slots)
+            else:
+                slot, _ = self._slots.popitem(last=False)
+                self.evictions += 1
+
+            self._vectors[slot] = vector
+            self._values[slot] = value
+            self._stored_at[slot] = time.time()
+            self._slots[slot] = query
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            stats = {
+                "size": len(self._slots),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+        for key in ("embed", "lookup"):
+            stats[f"{key}_p50_ms"] = self.latency.percentile(key, 50, 0.0) * 1000
+            stats[f"{key}_p95_ms"] = self.latency.percentile(key, 95, 0.0) * 1000
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._slots.clear()
+            self._values = [None] * self.max_size
+            self._stored_at[:] = -np.inf
+
+    def _normalize(self, embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
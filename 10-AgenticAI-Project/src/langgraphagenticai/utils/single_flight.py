@@ -0,0 +1,116 @@
+import asyncio
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key (the leader) runs the function; callers arriving while it
+    is in flight wait and receive the same result, or the same exception. Nothing is
+    cached: once the call finishes, the next caller runs it again.
+
+    Sync callers are shared across threads; async callers are shared within an event loop,
+    and the shared work runs as a task so a cancelled leader doesn't fail its followers.
+    A key of None disables coalescing for that call.
+    """
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._calls = {}
+        self._tasks = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        if key is None:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def ado(self, key, afn):
+        """
+        Async variant of `do`; `afn` returns an awaitable.
+        """
+        if key is None:
+            return await afn()
+
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = asyncio.ensure_future(afn())
+                self._tasks[task_key] = task
+                task.add_done_callback(lambda _: self._forget(task_key))
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.executions + self.coalesced
+            return {
+                "in_flight": len(self._calls) + len(self._tasks),
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "coalesce_rate": self.coalesced / total if total else 0.0,
+            }
+
+    def _forget(self, task_key):
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+
+_groups = {}
+_groups_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Returns the process-wide group for `name`, shared by every graph and session.
+    """
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name)
+            _groups[name] = group
+        return group
+
+
+def single_flight_stats() -> dict:
+    with _groups_lock:
+        groups = dict(_groups)
+    return {name: group.stats() for name, group in groups.items()}
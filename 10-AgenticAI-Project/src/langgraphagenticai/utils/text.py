@@ -0,0 +1,25 @@
+import re
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalizes a user query for use as a cache or popularity key:
+    lower-cased, surrounding punctuation stripped and whitespace collapsed.
+    """
+    query = (query or "").lower().strip()
+    query = re.sub(r"\s+", " ", query)
+    return query.strip(" .,!?;:'\"")
+
+
+_NEGATION = re.compile(r"\b(?:not|no|never|nor|none|nothing|neither|without|cannot)\b|n't\b")
+_NUMBER = re.compile(r"\d+(?:[.,]\d+)*")
+
+
+def key_terms(query: str) -> tuple:
+    """
+    Returns the terms that flip the meaning of a query while barely moving its
+    embedding: the number of negations and the numbers it mentions. Two queries
+    with different key terms must not share a cached answer.
+    """
+    query = (query or "").lower().replace("’", "'")
+    return len(_NEGATION.findall(query)), tuple(sorted(_NUMBER.findall(query)))
@@ -0,0 +1,41 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """
+    Returns a tiktoken encoding when one is available locally, else None.
+    """
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Counts tokens with tiktoken's cl100k_base encoding as an approximation for the
+    Groq-hosted models, falling back to ~4 characters per token without tiktoken.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cuts `text` to at most `max_tokens` tokens.
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
@@ -0,0 +1,241 @@
+import asyncio
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from langgraphagenticai.utils.log import get_logger
+
+# Seconds between writes of a persisted cache; the sets made in between are saved together
+CACHE_SAVE_INTERVAL = float(os.environ.get("CACHE_SAVE_INTERVAL", "5"))
+
+logger = get_logger(__name__)
+
+
+class TTLCache:
+    """
+    LRU cache with a time-to-live and a stale-while-revalidate window.
+
+    - Entries younger than `ttl` are served as-is.
+    - Entries younger than `ttl + stale_ttl` are served immediately while a background
+      refresh replaces them.
+    - Older entries are treated as misses and loaded in the caller.
+
+    Values must be JSON serializable when `persist_path` is set; the cache is then
+    reloaded from that file on start-up so it survives restarts. Changes are written
+    by a background thread at most every `save_interval` seconds and at exit.
+    """
+    def __init__(self, ttl: float, stale_ttl: float = 0, max_size: int = 256,
+                 persist_path: str = None, name: str = "cache", save_interval: float = CACHE_SAVE_INTERVAL):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_size = max_size
+        self.persist_path = persist_path
+        self.save_interval = save_interval
+        self.name = name
+        self._entries = OrderedDict()  # key -> (stored_at, value)
+        self._lock = threading.RLock()
+        self._refreshing = set()
+        self._background_tasks = set()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"{name}-refresh")
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+        self.evictions = 0
+        self._dirty = threading.Event()
+        self._save_lock = threading.Lock()
+        self._saver = None
+
+        if persist_path:
+            self._load()
+            atexit.register(self.flush)
+
+    def get(self, key: str):
+        """
+        Returns (value, age in seconds) or (None, None) when the key is missing.
+        Expired entries are returned as well; callers decide what to do with them.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(key)
+            stored_at, value = entry
+            return value, time.time() - stored_at
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        if self.persist_path:
+            self._schedule_save()
+
+    def get_or_load(self, key: str, loader):
+        """
+        Returns the cached value for `key`, calling `loader()` on a miss and
+        refreshing stale entries on a background thread.
+        """
+        value, state = self._lookup(key)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            self._refresh_in_background(key, loader)
+            return value
+
+        value = loader()
+        self.set(key, value)
+        return value
+
+    async def aget_or_load(self, key: str, aloader):
+        """
+        Async variant of `get_or_load`; `aloader()` must return an awaitable and
+        stale entries are refreshed in a background task.
+        """
+        value, state = self._lookup(key)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            self._arefresh_in_background(key, aloader)
+            return value
+
+        value = await aloader()
+        self.set(key, value)
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "refresh_errors": self.refresh_errors,
+                "hit_rate": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self.persist_path:
+            self._dirty.set()
+            self.flush()
+
+    def flush(self):
+        """
+        Writes unsaved changes to `persist_path` now.
+        """
+        with self._save_lock:
+            if not self.persist_path or not self._dirty.is_set():
+                return
+            self._dirty.clear()
+            self._save()
+
+    def _lookup(self, key: str):
+        value, age = self.get(key)
+        with self._lock:
+            if age is not None and age < self.ttl:
+                self.hits += 1
+                return value, "fresh"
+            if age is not None and age < self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                return value, "stale"
+            self.misses += 1
+            return None, "miss"
+
+    def _claim_refresh(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _refresh_in_background(self, key: str, loader):
+        if not self._claim_refresh(key):
+            return
+
+        def refresh():
+            try:
+                self.set(key, loader())
+            except Exception as e:
+                with self._lock:
+                    self.refresh_errors += 1
+                logger.warning("background refresh failed", extra={"cache": self.name, "error": str(e)})
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+    def _arefresh_in_background(self, key: str, aloader):
+        if not self._claim_refresh(key):
+            return
+
+        async def refresh():
+            try:
+                self.set(key, await aloader())
+            except Exception as e:
+                with self._lock:
+                    self.refresh_errors += 1
+                logger.warning("background refresh failed", extra={"cache": self.name, "error": str(e)})
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        # Keep a reference so the task isn't garbage collected before it finishes
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _schedule_save(self):
+        self._dirty.set()
+        if self._saver is None:
+            with self._lock:
+                if self._saver is None:
+                    self._saver = threading.Thread(target=self._save_loop, name=f"{self.name}-save", daemon=True)
+                    self._saver.start()
+
+    def _save_loop(self):
+        while True:
+            self._dirty.wait()
+            # Let the sets of the next interval pile up, then write them at once
+            time.sleep(self.save_interval)
+            self.flush()
+
+    def _load(self):
+        if not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("could not load cache", extra={"cache": self.name, "path": self.persist_path, "error": str(e)})
+            return
+
+        now = time.time()
+        with self._lock:
+            for key, stored_at, value in data.get("entries", []):
+                if now - stored_at < self.ttl + self.stale_ttl:
+                    self._entries[key] = (stored_at, value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _save(self):
+        with self._lock:
+            data = {"entries": [[key, stored_at, value] for key, (stored_at, value) in self._entries.items()]}
+        tmp_path = f"{self.persist_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            # Atomic swap so a crash never leaves a half-written cache file
+            os.replace(tmp_path, self.persist_path)
+        except (OSError, TypeError) as e:
+            logger.warning("could not persist cache", extra={"cache": self.name, "error": str(e)})
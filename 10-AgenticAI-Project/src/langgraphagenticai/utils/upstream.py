@@ -0,0 +1,337 @@
+import asyncio
+import json
+import os
+import threading
+import time
+
+import httpx
+
+from langgraphagenticai.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker
+from langgraphagenticai.utils.hashing import fingerprint
+from langgraphagenticai.utils.instrumentation import record_upstream_call
+from langgraphagenticai.utils.rate_limit import AdaptiveLimiter
+from langgraphagenticai.utils.tokens import count_tokens
+
+# Limits per upstream provider. Groq defaults match its free tier; raise them for paid keys.
+UPSTREAM_LIMITS = {
+    "groq": dict(
+        rpm=float(os.environ.get("GROQ_RPM", "30")),
+        tpm=float(os.environ.get("GROQ_TPM", "6000")),
+        max_concurrency=int(os.environ.get("GROQ_MAX_CONCURRENCY", "8")),
+        latency_target=float(os.environ.get("GROQ_LATENCY_TARGET", "20")),
+    ),
+    "tavily": dict(
+        rpm=float(os.environ.get("TAVILY_RPM", "100")),
+        max_concurrency=int(os.environ.get("TAVILY_MAX_CONCURRENCY", "8")),
+        latency_target=float(os.environ.get("TAVILY_LATENCY_TARGET", "8")),
+    ),
+}
+
+# Hosts whose HTTP calls are rate limited by the pooled LLM clients' transport
+UPSTREAM_HOSTS = {
+    "api.groq.com": "groq",
+}
+
+# Completion tokens assumed when a request doesn't set max_tokens
+DEFAULT_COMPLETION_TOKENS = 512
+THROTTLE_RETRIES = int(os.environ.get("UPSTREAM_THROTTLE_RETRIES", "2"))
+
+
+class UpstreamThrottled(Exception):
+    """
+    Raised by call sites that detect a rate-limit response their client didn't raise for.
+    """
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str, api_key: str = "") -> AdaptiveLimiter:
+    """
+    Returns the process-wide limiter for a provider and API key (limits apply per key).
+    """
+    key = (provider, fingerprint(api_key) if api_key else "")
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveLimiter(f"{provider}:{key[1]}", **UPSTREAM_LIMITS.get(provider, {}))
+            _limiters[key] = limiter
+        return limiter
+
+
+def upstream_breaker(name: str) -> CircuitBreaker:
+    """
+    Returns the circuit breaker `name` ("<provider>" or "<provider>:<client or model>").
+    Calls slower than the provider's latency target count as slow calls.
+    """
+    provider = name.split(":", 1)[0]
+    return get_breaker(name, slow_call_seconds=UPSTREAM_LIMITS.get(provider, {}).get("latency_target", 10.0))
+
+
+def limiter_stats() -> dict:
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {limiter.name: limiter.stats() for limiter in limiters.values()}
+
+
+def is_throttle_error(e: Exception) -> bool:
+    """
+    True for provider rate-limit errors (HTTP 429 from Groq, Tavily or httpx).
+    """
+    status = getattr(e, "status_code", None) or getattr(getattr(e, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    return isinstance(e, UpstreamThrottled) or type(e).__name__ in ("UsageLimitExceededError", "RateLimitError")
+
+
+def call_upstream(provider: str, fn, tokens: float = 0, retries: int = THROTTLE_RETRIES, breaker: str = None):
+    """
+    Calls `fn()` through the provider's limiter; rate-limited calls are retried
+    after the limiter has backed off instead of failing the request.
+    The circuit breaker `breaker` (default: the provider) fails the call with
+    CircuitOpenError, before it waits for the limiter, while the upstream is down.
+    """
+    circuit = upstream_breaker(breaker or provider)
+    limiter = get_limiter(provider)
+    for attempt in range(retries + 1):
+        probe = circuit.allow()
+        ticket = limiter.acquire(tokens)
+        try:
+            result = fn()
+        except Exception as e:
+            throttled = is_throttle_error(e)
+            seconds = time.monotonic() - ticket.started_at
+            limiter.release(ticket, throttled=throttled, failed=not throttled)
+            # A throttling upstream is up; the limiter backs off from it
+            circuit.record(throttled, seconds, probe)
+            record_upstream_call(provider, seconds, ok=False)
+            if throttled and attempt < retries:
+                continue
+            raise
+        seconds = time.monotonic() - ticket.started_at
+        limiter.release(ticket)
+        circuit.record(True, seconds, probe)
+        record_upstream_call(provider, seconds)
+        return result
+
+
+async def acall_upstream(provider: str, afn, tokens: float = 0, retries: int = THROTTLE_RETRIES,
+                         breaker: str = None):
+    """
+    Async variant of `call_upstream`; `afn` returns an awaitable.
+    """
+    circuit = upstream_breaker(breaker or provider)
+    limiter = get_limiter(provider)
+    for attempt in range(retries + 1):
+        probe = circuit.allow()
+        ticket = await limiter.aacquire(tokens)
+        try:
+            result = await afn()
+        except asyncio.CancelledError:
+            # Cancelled by a caller's timeout (e.g. the tool node): counts as a failed call
+            seconds = time.monotonic() - ticket.started_at
+            limiter.release(ticket, failed=True)
+            circuit.record(False, seconds, probe)
+            record_upstream_call(provider, seconds, ok=False)
+            raise
+        except Exception as e:
+            throttled = is_throttle_error(e)
+            seconds = time.monotonic() - ticket.started_at
+            limiter.release(ticket, throttled=throttled, failed=not throttled)
+            circuit.record(throttled, seconds, probe)
+            record_upstream_call(provider, seconds, ok=False)
+            if throttled and attempt < retries:
+                continue
+            raise
+        seconds = time.monotonic() - ticket.started_at
+        limiter.release(ticket)
+        circuit.record(True, seconds, probe)
+        record_upstream_call(provider, seconds)
+        return result
+
+
+def _json_body(request: httpx.Request):
+    try:
+        return json.loads(request.content or b"{}")
+    except (ValueError, httpx.RequestNotRead):
+        return None
+
+
+def estimate_request_tokens(request: httpx.Request, body: dict = None) -> int:
+    """
+    Estimates the tokens an OpenAI-style chat completion request counts against TPM:
+    prompt tokens plus the requested (or a default) completion length.
+    """
+    body = body if body is not None else _json_body(request)
+    if not isinstance(body, dict):
+        return DEFAULT_COMPLETION_TOKENS
+    prompt = 0
+    for message in body.get("messages", []):
+        content = message.get("content")
+        prompt += count_tokens(content if isinstance(content, str) else json.dumps(content or ""))
+    completion = body.get("max_completion_tokens") or body.get("max_tokens") or DEFAULT_COMPLETION_TOKENS
+    return prompt + completion
+
+
+def _limiter_for(request: httpx.Request):
+    provider = UPSTREAM_HOSTS.get(request.url.host)
+    # Only generation calls count; model listings and warm-up requests pass through
+    if provider is None or request.method != "POST":
+        return None
+    api_key = request.headers.get("authorization", "").removeprefix("Bearer ")
+    return get_limiter(provider, api_key)
+
+
+def _breaker_for(request: httpx.Request, body) -> CircuitBreaker:
+    # One breaker per model: a degraded model doesn't fail the others
+    model = body.get("model", "") if isinstance(body, dict) else ""
+    return upstream_breaker(f"{UPSTREAM_HOSTS[request.url.host]}:{model}")
+
+
+def _circuit_open_response(request: httpx.Request, e: CircuitOpenError) -> httpx.Response:
+    """
+    503 answered locally for an open circuit. `x-should-retry: false` stops the provider
+    SDK from retrying, so the caller gets the error at once.
+    """
+    return httpx.Response(
+        status_code=503,
+        headers={"content-type": "application/json", "x-should-retry": "false",
+                 "retry-after": str(round(e.retry_in))},
+        json={"error": {"message": str(e), "type": "circuit_open"}},
+        request=request,
+    )
+
+
+def _release_kwargs(response: httpx.Response, latency: float) -> dict:
+    def header(name):
+        value = response.headers.get(name)
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    return dict(
+        throttled=response.status_code == 429,
+        failed=response.status_code >= 500,
+        latency=latency,
+        retry_after=header("retry-after"),
+        remaining_requests=header("x-ratelimit-remaining-requests"),
+        remaining_tokens=header("x-ratelimit-remaining-tokens"),
+    )
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self):
+        try:
+            self._stream.close()
+        finally:
+            self._on_close()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
+
+
+class RateLimitedTransport(httpx.BaseTransport):
+    """
+    httpx transport that sends every generation request through the provider's limiter.
+    The slot is held until the response body is closed, so streamed completions count as
+    in flight until their last token; latency is measured to the response headers.
+    """
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = _limiter_for(request)
+        if limiter is None:
+            return self._transport.handle_request(request)
+
+        body = _json_body(request)
+        circuit = _breaker_for(request, body)
+        try:
+            probe = circuit.allow()
+        except CircuitOpenError as e:
+            return _circuit_open_response(request, e)
+
+        ticket = limiter.acquire(estimate_request_tokens(request, body))
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            limiter.release(ticket, failed=True)
+            circuit.record(False, time.monotonic() - ticket.started_at, probe)
+            raise
+        release = _release_kwargs(response, time.monotonic() - ticket.started_at)
+        circuit.record(not release["failed"], release["latency"], probe)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, lambda: limiter.release(ticket, **release)),
+            extensions=response.extensions,
+        )
+
+    def close(self):
+        self._transport.close()
+
+
+class AsyncRateLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Async variant of `RateLimitedTransport`.
+    """
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = _limiter_for(request)
+        if limiter is None:
+            return await self._transport.handle_async_request(request)
+
+        body = _json_body(request)
+        circuit = _breaker_for(request, body)
+        try:
+            probe = circuit.allow()
+        except CircuitOpenError as e:
+            return _circuit_open_response(request, e)
+
+        ticket = await limiter.aacquire(estimate_request_tokens(request, body))
+        try:
+            response = await self._transport.handle_async_request(request)
+        except asyncio.CancelledError:
+            # A hedged call that lost the race says nothing about the upstream
+            limiter.release(ticket)
+            circuit.cancel(probe)
+            raise
+        except BaseException:
+            limiter.release(ticket, failed=True)
+            circuit.record(False, time.monotonic() - ticket.started_at, probe)
+            raise
+        release = _release_kwargs(response, time.monotonic() - ticket.started_at)
+        circuit.record(not release["failed"], release["latency"], probe)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_AsyncReleasingStream(response.stream, lambda: limiter.release(ticket, **release)),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
@@ -0,0 +1,16 @@
+import os
+import sys
+
+## Tests run offline: no Groq or Tavily keys, no network, no background prefetching.
+## From the project root:  python -m pytest src/tests
+os.environ.setdefault("API_LLM_PROVIDER", "stub")
+os.environ.setdefault("TAVILY_API_KEY", "test")
+os.environ.setdefault("NEWS_PREFETCH", "0")
+os.environ.setdefault("COALESCE_REQUESTS", "0")
+os.environ.setdefault("TAVILY_RPM", "1000000")
+os.environ.setdefault("TAVILY_MAX_CONCURRENCY", "1024")
+os.environ.setdefault("STUB_LLM_TTFT", "0")
+os.environ.setdefault("STUB_LLM_TOKEN_INTERVAL", "0")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
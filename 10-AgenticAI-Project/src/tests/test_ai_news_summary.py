@@ -0,0 +1,30 @@
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+from langgraphagenticai.nodes.ai_news_node import AINewsNode
+
+
+def articles(count: int, words: int = 80) -> list:
+    return [
+        {"title": f"Story {i}", "url": f"https://example.com/{i}", "published_date": "2026-10-01",
+         "score": 0.9, "content": " ".join(f"word{i}x{j}." for j in range(words))}
+        for i in range(count)
+    ]
+
+
+def node(model_name: str) -> AINewsNode:
+    return AINewsNode(StubChatModel(model_name=model_name))
+
+
+def test_articles_that_fit_the_model_are_summarized_in_one_call():
+    small = node("llama3-8b-8192")
+    assert small._plan_batches(small._format_articles(articles(15))) is None
+
+
+def test_articles_beyond_the_context_budget_are_map_reduced():
+    small = node("llama3-8b-8192")
+    batches = small._plan_batches(small._format_articles(articles(50)))
+    assert batches is not None and len(batches) > 1
+    assert sum(len(batch) for batch in batches) == 50
+
+    # A long-context model takes the same articles in one call
+    large = node("qwen/qwen3-32b")
+    assert large._plan_batches(large._format_articles(articles(50))) is None
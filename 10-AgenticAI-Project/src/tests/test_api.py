@@ -0,0 +1,46 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+from langgraphagenticai.graph import checkpointer
+
+
+@pytest.fixture
+def client():
+    return TestClient(api.app)
+
+
+def test_unknown_models_are_rejected(client):
+    before = api.graph_registry.stats()["misses"]
+    for path, body in (
+        ("/v1/basic-chatbot/invoke", {"message": "hi", "model": "not-a-model"}),
+        ("/v1/basic-chatbot/batch", {"items": [{"id": "1", "message": "hi"}], "model": "not-a-model"}),
+    ):
+        response = client.post(path, json=body)
+        assert response.status_code == 422
+        assert "not-a-model" in response.json()["detail"]
+    assert api.graph_registry.stats()["misses"] == before
+
+
+def test_configured_models_are_accepted(client):
+    assert api.resolve_model(None) == api.API_MODEL
+    assert api.resolve_model(api.API_MODELS[-1]) == api.API_MODELS[-1]
+
+
+def test_shutdown_does_not_create_the_checkpointer(monkeypatch):
+    monkeypatch.setattr(api, "get_checkpointer", lambda: pytest.fail("checkpointer created at shutdown"))
+    with TestClient(api.app) as client:
+        assert client.get("/health").status_code == 200
+
+
+def test_metrics_do_not_create_the_checkpointer(monkeypatch):
+    monkeypatch.setattr(api, "get_checkpointer", lambda: pytest.fail("checkpointer created by /metrics"))
+    monkeypatch.setattr(checkpointer, "_checkpointer", None)
+    with TestClient(api.app) as client:
+        assert client.get("/metrics").json()["checkpointer"] is None
+
+
+def test_answers_without_a_cascade_have_no_tier(client):
+    response = client.post("/v1/basic-chatbot/invoke", json={"message": "hi"})
+    assert response.status_code == 200
+    assert response.json()["answered_by"] is None
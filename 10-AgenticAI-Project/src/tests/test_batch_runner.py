@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+from langchain_core.messages import AIMessage
+
+from langgraphagenticai.batch.runner import BatchReport, ProgressFile, run_jsonl
+
+
+class FlakyGraph:
+    """Answers every message except those in `failing`, which raise."""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.seen = []
+
+    async def ainvoke(self, state):
+        message = state["messages"][-1].content
+        self.seen.append(message)
+        if message in self.failing:
+            raise RuntimeError(f"failed on {message}")
+        return {"messages": [AIMessage(content=f"answer to {message}")]}
+
+
+def write_items(path, count: int):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            f.write(json.dumps({"id": f"item-{i}", "message": f"m{i}"}) + "\n")
+
+
+def read_results(path) -> list:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def run(graph, input_path, output_path):
+    return asyncio.run(run_jsonl(graph, "Basic Chatbot", str(input_path), str(output_path), max_concurrency=4))
+
+
+def test_a_rerun_retries_only_failed_and_unfinished_items(tmp_path):
+    input_path, output_path = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_items(input_path, 10)
+    # A crash after two items: their ids were recorded, nothing else ran
+    with open(f"{output_path}.progress", "w", encoding="utf-8") as f:
+        f.write("item-0\nitem-1\n")
+
+    report = run(FlakyGraph(failing={"m3"}), input_path, output_path)
+    assert (report.skipped, report.succeeded, report.failed) == (2, 7, 1)
+
+    graph = FlakyGraph()
+    report = run(graph, input_path, output_path)
+    assert graph.seen == ["m3"]
+    assert (report.skipped, report.succeeded, report.failed) == (9, 1, 0)
+    assert ProgressFile(f"{output_path}.progress").done_ids == {f"item-{i}" for i in range(10)}
+
+    answered = {r["id"] for r in read_results(output_path) if "answer" in r}
+    assert answered == {f"item-{i}" for i in range(2, 10)}
+
+
+def test_summary_reports_latency_percentiles():
+    report = BatchReport(succeeded=100, elapsed=2.0)
+    for ms in range(1, 101):
+        report.latency.record("item", ms / 1000)
+    summary = report.summary()
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (51.0, 95.0, 99.0)
+    assert summary["throughput_per_s"] == 50.0
+
+    empty = BatchReport().summary()
+    assert (empty["p50_ms"], empty["throughput_per_s"]) == (0.0, 0.0)
@@ -0,0 +1,25 @@
+import pytest
+
+from langgraphagenticai.utils.blob_store import BlobNotFoundError, BlobStore, DiskBlobStore, MemoryBlobStore
+
+
+def test_blob_store_subclasses_must_store_bytes():
+    with pytest.raises(TypeError):
+        BlobStore()
+
+
+@pytest.mark.parametrize("kind", ["memory", "disk"])
+def test_equal_values_are_stored_once(kind, tmp_path):
+    store = MemoryBlobStore() if kind == "memory" else DiskBlobStore(str(tmp_path))
+    articles = [{"url": "https://example.com", "content": "x" * 100}]
+    assert store.put(articles) == store.put(list(articles))
+    assert store.get(store.put(articles)) == articles
+    assert (store.stats()["stored"], store.stats()["deduplicated"]) == (1, 2)
+
+
+def test_missing_blobs_fail_with_a_clear_error():
+    store = MemoryBlobStore(max_bytes=1)
+    first = store.put({"a": 1})
+    store.put({"b": 2})
+    with pytest.raises(BlobNotFoundError, match="BLOB_STORE=disk"):
+        store.get(first)
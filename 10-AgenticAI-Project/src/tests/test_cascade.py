@@ -0,0 +1,29 @@
+from langchain_core.messages import HumanMessage
+
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+from langgraphagenticai.nodes.cascade_chatbot_node import CascadeChatbotNode, answered_by
+from langgraphagenticai.ui.uiconfigfile import Config
+
+
+def stub(model_name: str) -> StubChatModel:
+    return StubChatModel(model_name=model_name, ttft=0, tokens=3, token_interval=0)
+
+
+def answer(node, text: str):
+    chatbot = node.create_chatbot([])
+    [message] = chatbot({"messages": [HumanMessage(content=text)]})["messages"]
+    return message
+
+
+def test_answers_record_the_tier_that_wrote_them():
+    node = CascadeChatbotNode(stub("large"), stub("small"))
+    assert answered_by(answer(node, "what is the capital of France?")) == {"tier": "small", "model": "small"}
+
+    # The stub echoes the question, so its answer admits not knowing and is escalated
+    escalated = answer(node, "I don't know where to start")
+    assert answered_by(escalated) == {"tier": "large", "model": "large"}
+
+
+def test_the_cascade_is_off_by_default():
+    assert Config().get_groq_cascade_model() == ""
+    assert answered_by(stub("large").invoke("hi")) is None
@@ -0,0 +1,165 @@
+import asyncio
+import sqlite3
+import threading
+
+from langchain_core.messages import HumanMessage
+
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+from langgraphagenticai.graph.checkpointer import WriteBehindSqliteSaver
+from langgraphagenticai.graph.graph_builder import GraphBuilder
+
+
+def chat_graph(saver):
+    model = StubChatModel(model_name="stub", ttft=0, tokens=3, token_interval=0)
+    return GraphBuilder(model).setup_graph("Basic Chatbot", checkpointer=saver)
+
+
+def turn(graph, thread_id: str, text: str) -> list:
+    config = {"configurable": {"thread_id": thread_id}}
+    return graph.invoke({"messages": [HumanMessage(content=text)]}, config)["messages"]
+
+
+def messages(graph, thread_id: str) -> list:
+    return graph.get_state({"configurable": {"thread_id": thread_id}}).values.get("messages", [])
+
+
+def log_rows(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM checkpoint_log").fetchone()[0]
+
+
+def test_threads_resume_after_a_restart(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    saver = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    graph = chat_graph(saver)
+    turn(graph, "t1", "hello")
+    turn(graph, "t1", "again")
+    saver.flush()
+
+    restarted = chat_graph(WriteBehindSqliteSaver(path, flush_interval=0.01))
+    assert [m.content for m in messages(restarted, "t1")][::2] == ["hello", "again"]
+    assert len(turn(restarted, "t1", "third")) == 6
+
+
+def test_threads_with_queued_writes_are_not_evicted(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    # Writes stay queued for a second, longer than the turns below take
+    saver = WriteBehindSqliteSaver(path, flush_interval=1.0, max_threads=1)
+    graph = chat_graph(saver)
+    turn(graph, "a", "first thread")
+    turn(graph, "b", "second thread")
+    assert saver.pending
+    assert saver.stats()["threads_in_memory"] == 2
+
+    saver.flush()
+    assert saver.stats()["threads_in_memory"] == 1
+    # "a" was evicted once its writes were committed and is reloaded from SQLite
+    assert [m.content for m in messages(graph, "a")][0] == "first thread"
+    assert len(messages(graph, "a")) == 2
+
+
+def test_log_is_compacted_to_the_latest_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    saver = WriteBehindSqliteSaver(path, flush_interval=0.01, compact_after=10)
+    graph = chat_graph(saver)
+    for i in range(6):
+        turn(graph, "t1", f"message {i}")
+        saver.flush()
+
+    assert saver.stats()["compactions"] > 0
+    assert log_rows(path) < 10
+
+    restarted = chat_graph(WriteBehindSqliteSaver(path, flush_interval=0.01))
+    assert [m.content for m in messages(restarted, "t1")][::2] == [f"message {i}" for i in range(6)]
+    assert len(turn(restarted, "t1", "after compaction")) == 14
+
+
+def test_async_reads_load_cold_threads_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    saver = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    turn(chat_graph(saver), "t1", "hello")
+    saver.flush()
+
+    restarted = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    load_thread, loaded_on = restarted._load_thread, []
+
+    def recording_load(thread_id):
+        loaded_on.append(threading.get_ident())
+        return load_thread(thread_id)
+
+    restarted._load_thread = recording_load
+
+    async def resume():
+        graph = chat_graph(restarted)
+        config = {"configurable": {"thread_id": "t1"}}
+        state = await graph.ainvoke({"messages": [HumanMessage(content="again")]}, config)
+        return threading.get_ident(), state["messages"]
+
+    loop_thread, state = asyncio.run(resume())
+    assert [m.content for m in state][::2] == ["hello", "again"]
+    assert loaded_on and loop_thread not in loaded_on
+
+
+def test_deleted_threads_are_not_reloaded_before_the_delete_commits(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    saver = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    turn(chat_graph(saver), "t1", "hello")
+    saver.flush()
+
+    # A long flush interval keeps the DELETE queued while the thread is read
+    restarted = WriteBehindSqliteSaver(path, flush_interval=0.5)
+    graph = chat_graph(restarted)
+    assert messages(graph, "t1")
+    restarted.delete_thread("t1")
+    assert messages(graph, "t1") == []
+    assert log_rows(path) > 0
+
+    restarted.flush()
+    assert log_rows(path) == 0
+    assert messages(graph, "t1") == []
+
+
+def test_workers_sharing_the_database_continue_each_others_threads(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    first = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    second = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    worker_1, worker_2 = chat_graph(first), chat_graph(second)
+
+    turn(worker_1, "t1", "one")
+    first.flush()
+    turn(worker_2, "t1", "two")
+    second.flush()
+    turn(worker_1, "t1", "three")
+    first.flush()
+    assert [m.content for m in messages(worker_2, "t1")][::2] == ["one", "two", "three"]
+    assert first.stats()["refreshes"] >= 1
+
+    second.delete_thread("t1")
+    second.flush()
+    assert messages(worker_1, "t1") == []
+
+
+def test_threads_compacted_by_another_worker_stay_consistent(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    first = WriteBehindSqliteSaver(path, flush_interval=0.01)
+    second = WriteBehindSqliteSaver(path, flush_interval=0.01, compact_after=10)
+    worker_1, worker_2 = chat_graph(first), chat_graph(second)
+
+    turn(worker_1, "t1", "q0")
+    first.flush()
+    for i in range(1, 6):
+        turn(worker_2, "t1", f"q{i}")
+    second.flush()
+    assert second.compactions >= 1
+
+    assert [m.content for m in messages(worker_1, "t1")][::2] == [f"q{i}" for i in range(6)]
+    assert len(turn(worker_1, "t1", "q6")) == 14
+
+
+def test_a_single_process_database_skips_the_freshness_check(tmp_path):
+    saver = WriteBehindSqliteSaver(str(tmp_path / "checkpoints.sqlite"), flush_interval=0.01, shared=False)
+    graph = chat_graph(saver)
+    turn(graph, "t1", "hello")
+    saver.flush()
+    turn(graph, "t1", "again")
+    assert saver.stats()["refreshes"] == 0
@@ -0,0 +1,26 @@
+from langgraph.checkpoint.memory import MemorySaver
+
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+from langgraphagenticai.graph.graph_registry import GraphRegistry, checkpointer_token
+
+
+def test_graphs_are_reused_and_evicted_in_lru_order():
+    registry = GraphRegistry(max_size=2)
+    model = StubChatModel(model_name="stub")
+    first = registry.get_graph("Basic Chatbot", model, "a")
+    registry.get_graph("Basic Chatbot", model, "b")
+    assert registry.get_graph("Basic Chatbot", model, "a") is first
+    registry.get_graph("Basic Chatbot", model, "c")
+
+    stats = registry.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 3, 1)
+    # "b" was the least recently used graph
+    assert registry.get_graph("Basic Chatbot", model, "a") is first
+    assert registry.stats()["misses"] == 3
+
+
+def test_checkpointer_tokens_are_stable_and_distinct():
+    first, second = MemorySaver(), MemorySaver()
+    assert checkpointer_token(first) == checkpointer_token(first)
+    assert checkpointer_token(first) != checkpointer_token(second)
+    assert checkpointer_token(None) is None
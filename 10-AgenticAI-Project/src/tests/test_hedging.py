@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from langgraphagenticai.LLMS import hedging
+from langgraphagenticai.LLMS.hedging import HedgeBudget, HedgedChatModel, get_hedged_client
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+
+HEDGE_AFTER = 0.05
+
+
+class CountingStub(StubChatModel):
+    """Stub that records every chunk it produced, to see when a losing stream stops."""
+    produced: list
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        for chunk in super()._stream(messages, stop, run_manager, **kwargs):
+            self.produced.append(chunk.text)
+            yield chunk
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        async for chunk in super()._astream(messages, stop, run_manager, **kwargs):
+            self.produced.append(chunk.text)
+            yield chunk
+
+
+class FailingStub(StubChatModel):
+    """Stub that fails after `ttft` seconds."""
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.ttft)
+        raise RuntimeError("primary failed")
+        yield
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.ttft)
+        raise RuntimeError("primary failed")
+        yield
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.ttft)
+        raise RuntimeError("primary failed")
+
+
+@pytest.fixture(autouse=True)
+def fast_hedges(monkeypatch):
+    monkeypatch.setattr(hedging, "hedge_delay", lambda model, kind: HEDGE_AFTER)
+    monkeypatch.setattr(hedging, "hedge_budget", HedgeBudget(ratio=1, burst=5))
+
+
+def stub(ttft: float, tokens: int = 2, cls=StubChatModel, **fields):
+    return cls(model_name="stub", ttft=ttft, tokens=tokens, token_interval=0.01, **fields)
+
+
+def hedged(name: str, primary, hedge) -> HedgedChatModel:
+    return HedgedChatModel(primary=primary, hedge=hedge, model_name=name, hedge_model_name="fast")
+
+
+def stats(name: str) -> dict:
+    return hedging.hedging_stats().get(name, {})
+
+
+def test_a_slow_sync_call_is_answered_by_the_hedge_and_the_loser_stops():
+    primary = stub(ttft=0.3, tokens=20, cls=CountingStub, produced=[])
+    model = hedged("sync-slow", primary, stub(ttft=0))
+    answer = model.invoke("hi").content
+    assert answer.endswith("token1")
+    assert stats("sync-slow")["hedge_won"] == 1
+
+    time.sleep(0.5)
+    # Closed at its first chunk instead of generating all 20
+    assert 1 <= len(primary.produced) < 20
+
+
+def test_the_primary_keeps_the_answer_when_it_is_first():
+    model = hedged("sync-primary-first", stub(ttft=0.15, tokens=5), stub(ttft=0.6))
+    assert model.invoke("hi").content.endswith("token4")
+    assert stats("sync-primary-first")["hedged"] == 1
+    assert "hedge_won" not in stats("sync-primary-first")
+
+    fast = hedged("sync-fast", stub(ttft=0), stub(ttft=0))
+    fast.invoke("hi")
+    assert "hedged" not in stats("sync-fast")
+
+
+def test_a_failed_primary_hands_over_to_the_running_hedge():
+    model = hedged("sync-failing", stub(ttft=0.1, cls=FailingStub), stub(ttft=0.2))
+    assert model.invoke("hi").content.endswith("token1")
+
+    alone = hedged("sync-failing-alone", stub(ttft=0, cls=FailingStub), stub(ttft=0))
+    with pytest.raises(RuntimeError, match="primary failed"):
+        alone.invoke("hi")
+
+
+def test_the_primary_runs_outside_the_hedge_pool(monkeypatch):
+    class ThreadRecordingStub(StubChatModel):
+        threads: list
+
+        def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+            self.threads.append(threading.current_thread().name)
+            yield from super()._stream(messages, stop, run_manager, **kwargs)
+
+    # Every hedge thread is busy: the slow call is answered by the primary alone
+    monkeypatch.setattr(hedging, "_hedge_slots", threading.BoundedSemaphore(1))
+    hedging._hedge_slots.acquire()
+    primary = stub(ttft=0.1, cls=ThreadRecordingStub, threads=[])
+    model = hedged("sync-busy", primary, stub(ttft=0))
+    assert model.invoke("hi").content.endswith("token1")
+    assert primary.threads == ["llm-primary"]
+    assert stats("sync-busy")["skipped_busy"] == 1
+
+
+def test_async_hedges_win_and_cancel_the_slow_stream():
+    primary = stub(ttft=0.3, tokens=20, cls=CountingStub, produced=[])
+    model = hedged("async-slow", primary, stub(ttft=0))
+
+    async def scenario():
+        chunks = [chunk.content async for chunk in model.astream("hi")]
+        await asyncio.sleep(0.4)
+        return "".join(chunks)
+
+    assert asyncio.run(scenario()).endswith("token1")
+    assert primary.produced == []
+    assert stats("async-slow")["hedge_won"] == 1
+
+
+def test_async_failed_primary_hands_over_to_the_running_hedge():
+    model = hedged("async-failing", stub(ttft=0.1, cls=FailingStub), stub(ttft=0.2))
+    assert asyncio.run(model.ainvoke("hi")).content.endswith("token1")
+
+
+def test_hedges_stop_when_the_budget_is_spent(monkeypatch):
+    budget = HedgeBudget(ratio=0.5, burst=1)
+    assert budget.try_spend() and not budget.try_spend()
+    budget.deposit()
+    assert not budget.available()
+    budget.deposit()
+    assert budget.try_spend()
+
+    monkeypatch.setattr(hedging, "hedge_budget", HedgeBudget(ratio=0, burst=1))
+    model = hedged("sync-budget", stub(ttft=0.1), stub(ttft=0))
+    model.invoke("hi")
+    model.invoke("hi")
+    assert stats("sync-budget")["hedged"] == 1
+    # With the budget spent no hedge can be sent, so the call isn't raced at all
+    assert stats("sync-budget")["requests"] == 2
+
+
+def test_hedged_clients_are_reused():
+    first = get_hedged_client("stub", "reused", "key")
+    assert get_hedged_client("stub", "reused", "key") is first
+    assert get_hedged_client("stub", "reused", "other-key") is not first
+    assert first.hedge is None
@@ -0,0 +1,74 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from langgraphagenticai.LLMS.stub_llm import StubChatModel
+from langgraphagenticai.state.history import HistoryCompactor, split_turns
+
+
+def stub(model_name: str = "stub") -> StubChatModel:
+    return StubChatModel(model_name=model_name, ttft=0, tokens=3, token_interval=0)
+
+
+def web_turn(question: str, result_words: int) -> list:
+    """One Chatbot With Web turn: question, tool call, search results, answer."""
+    call = {"name": "tavily_search_results_json", "args": {"query": question}, "id": f"call_{question}"}
+    return [
+        HumanMessage(content=question),
+        AIMessage(content="", tool_calls=[call]),
+        ToolMessage(content="result " * result_words, tool_call_id=call["id"]),
+        AIMessage(content="answer"),
+    ]
+
+
+def test_turns_start_at_user_messages_and_keep_tool_calls():
+    messages = [AIMessage(content="greeting")] + web_turn("a", 10) + web_turn("b", 10)
+    assert split_turns(messages) == [0, 1, 5]
+    assert split_turns(messages, 1) == [1, 5]
+    assert split_turns(messages, 2) == [2, 5]
+
+
+def test_budget_is_derived_from_the_model_context():
+    assert HistoryCompactor(stub("llama3-8b-8192")).token_budget == (8192 - 2048) // 2
+    assert HistoryCompactor(stub("llama3-8b-8192"), token_budget=1000).token_budget == 1000
+
+
+def test_folds_once_per_few_turns_not_after_every_search():
+    compactor = HistoryCompactor(stub("llama3-8b-8192"))
+    history, folds, upto = [], 0, 0
+    for i in range(8):
+        # ~1.5k tokens per turn, mostly search results
+        turn = web_turn(f"q{i}", 900)
+        for end in range(1, len(turn)):
+            # The model is called at the start of the turn and after the tool results
+            if isinstance(turn[end - 1], AIMessage):
+                continue
+            cut = compactor._fold_point(history + turn[:end], upto)
+            if cut > upto:
+                folds += 1
+                upto = cut
+                # Everything before the current turn is folded; the turn itself stays
+                assert cut == len(history)
+                assert isinstance(turn[end - 1], HumanMessage)
+        history += turn
+    assert 2 <= folds <= 4
+
+
+def test_mid_turn_folds_only_when_the_prompt_would_not_fit():
+    compactor = HistoryCompactor(stub("llama3-8b-8192"))
+    history = web_turn("a", 900) + web_turn("b", 900)
+    current = web_turn("c", 900)[:3]
+    assert compactor._fold_point(history + current, 0) == 0
+
+    huge = web_turn("c", 5000)[:3]
+    assert compactor._fold_point(history + huge, 0) == len(history)
+
+
+def test_compact_stores_the_summary_and_prompts_with_it():
+    compactor = HistoryCompactor(stub(), max_turns=2, keep_turns=1)
+    messages = web_turn("a", 10) + web_turn("b", 10) + [HumanMessage(content="c")]
+    prompt, updates = compactor.compact({"messages": messages})
+    assert updates["history_summary_upto"] == 8
+    assert updates["history_summary"].startswith("Stub answer")
+    assert prompt[0].type == "system" and prompt[1:] == messages[8:]
+
+    state = {"messages": messages, **updates}
+    assert compactor.compact(state) == (prompt, {})
@@ -0,0 +1,34 @@
+import pytest
+
+from langgraphagenticai.benchmarks.fakes import FakeTavily, install_fake_tavily
+from langgraphagenticai.news.prefetch import NewsPrefetcher
+
+
+@pytest.fixture
+def fake_tavily():
+    fake = FakeTavily(latency=0)
+    restore = install_fake_tavily(fake)
+    yield fake
+    restore()
+
+
+def test_digests_are_built_with_a_server_owned_client(fake_tavily):
+    prefetcher = NewsPrefetcher(provider="stub", min_requests=0.5)
+    prefetcher.popularity.record("stub:llama", "llama", "stub")
+    # The tracker keeps the model name, not the requesting node or its client
+    assert prefetcher.popularity.top(1)[0][2:] == ("llama", "stub")
+
+    assert prefetcher.run_once() == 1
+    digest = prefetcher.lookup("stub:llama")
+    assert digest["query"] == "llama" and digest["summary"] and digest["news_data"]
+
+
+def test_nothing_is_prefetched_without_a_server_key(fake_tavily, monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    prefetcher = NewsPrefetcher(provider="groq", min_requests=0.5)
+    prefetcher.record("llama3-8b-8192:llama", "llama", "llama3-8b-8192")
+
+    assert prefetcher._thread is None
+    assert prefetcher.run_once() == 0
+    assert prefetcher.stats()["skipped_no_server_key"] == 1
+    assert fake_tavily.calls == 0
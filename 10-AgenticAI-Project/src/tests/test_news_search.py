@@ -0,0 +1,20 @@
+import asyncio
+
+from langgraphagenticai.news import search
+
+
+def test_afan_out_search_works_across_event_loops(monkeypatch):
+    monkeypatch.setattr(search, "FANOUT_WORKERS", 2)
+    running = []
+
+    async def asearch(sub_query):
+        running.append(sub_query)
+        assert len(running) <= 2
+        await asyncio.sleep(0.01)
+        running.remove(sub_query)
+        return {"results": [{"url": sub_query}]}
+
+    # Each asyncio.run() is a new loop; a semaphore bound to the first one would fail here
+    for _ in range(2):
+        results = asyncio.run(search.afan_out_search(asearch, ["a", "b", "c", "d"]))
+        assert [item["url"] for item in results] == ["a", "b", "c", "d"]
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from langgraphagenticai.tools import parallel_tool_node
+from langgraphagenticai.tools.parallel_tool_node import ParallelToolNode, tool_call_stats
+
+release = threading.Event()
+
+
+@tool
+def echo(text: str) -> str:
+    """Returns the text after a short delay."""
+    time.sleep(0.05)
+    return text
+
+
+@tool
+def stuck(text: str) -> str:
+    """Blocks until the test releases it."""
+    release.wait(5)
+    return text
+
+
+@tool
+def broken(text: str) -> str:
+    """Always fails."""
+    raise ValueError("broken tool")
+
+
+@pytest.fixture(autouse=True)
+def release_stuck_calls():
+    release.clear()
+    yield
+    release.set()
+
+
+def state(*names) -> dict:
+    calls = [{"name": name, "args": {"text": f"{name}-{i}"}, "id": f"call-{i}"} for i, name in enumerate(names)]
+    return {"messages": [AIMessage(content="", tool_calls=calls)]}
+
+
+def node() -> ParallelToolNode:
+    return ParallelToolNode([echo, stuck, broken], timeouts={"stuck": 0.2})
+
+
+async def ainvoke(tool_state: dict) -> dict:
+    result = await node().ainvoke(tool_state)
+    # Lets asyncio.run() shut down its executor, where the sync tool is still blocked
+    release.set()
+    return result
+
+
+def test_results_come_back_in_call_order_with_partial_failures():
+    for messages in (node().invoke(state("echo", "stuck", "broken", "echo"))["messages"],
+                     asyncio.run(ainvoke(state("echo", "stuck", "broken", "echo")))["messages"]):
+        assert [m.tool_call_id for m in messages] == ["call-0", "call-1", "call-2", "call-3"]
+        assert [m.status for m in messages] == ["success", "error", "error", "success"]
+        assert messages[0].content == "echo-0" and messages[3].content == "echo-3"
+        assert "did not respond within 0.2s" in messages[1].content
+        assert "broken tool" in messages[2].content
+
+
+def test_calls_run_concurrently():
+    started = time.monotonic()
+    node().invoke(state(*["echo"] * 8))
+    assert time.monotonic() - started < 0.3
+
+
+def test_timed_out_sync_calls_are_reported_and_bounded(monkeypatch):
+    monkeypatch.setattr(parallel_tool_node, "TOOL_MAX_ABANDONED", 1)
+    before = tool_call_stats()
+    node().invoke(state("stuck"))
+    assert tool_call_stats()["abandoned_running"] == before["abandoned_running"] + 1
+
+    # The pool is saturated: new calls fail fast instead of queueing behind the stuck thread
+    started = time.monotonic()
+    (message,) = node().invoke(state("echo"))["messages"]
+    assert message.status == "error" and "overloaded" in message.content
+    assert time.monotonic() - started < 0.1
+
+    release.set()
+    deadline = time.monotonic() + 2
+    while tool_call_stats()["abandoned_running"] > before["abandoned_running"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert tool_call_stats()["abandoned_running"] == before["abandoned_running"]
+    assert node().invoke(state("echo"))["messages"][0].status == "success"
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from langgraphagenticai.utils.rate_limit import AdaptiveLimiter, TokenBucket
+
+
+def test_bucket_reservations_wait_in_order_once_the_burst_is_spent():
+    bucket = TokenBucket(per_minute=60, burst=2)  # one token per second
+    now = bucket.updated
+    assert bucket.reserve(1, now) == 0.0
+    assert bucket.reserve(1, now) == 0.0
+    assert bucket.reserve(1, now) == pytest.approx(1.0)
+    assert bucket.reserve(1, now) == pytest.approx(2.0)
+    # Refilled one token later: the queue is one second shorter
+    assert bucket.reserve(1, now + 1.0) == pytest.approx(2.0)
+
+
+def test_bucket_pause_and_sync_lower_the_level():
+    bucket = TokenBucket(per_minute=60, burst=10)
+    now = bucket.updated
+    bucket.sync(3, now)
+    assert bucket.level == 3
+    bucket.pause(5, now)
+    assert bucket.reserve(1, now + 1.0) == pytest.approx(4.0)
+
+
+def test_limit_grows_additively_and_halves_on_throttling():
+    limiter = AdaptiveLimiter("test", max_concurrency=8, decrease_cooldown=0)
+    assert limiter.limit == 4
+    for _ in range(4):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == pytest.approx(5, abs=0.1)
+
+    limiter.release(limiter.acquire(), throttled=True, retry_after=0)
+    assert limiter.limit == pytest.approx(2.5, abs=0.1)
+    for _ in range(100):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 8
+
+
+def test_decreases_respect_the_cooldown_and_the_floor():
+    limiter = AdaptiveLimiter("test", max_concurrency=16, min_concurrency=2, latency_target=0.5,
+                              decrease_cooldown=60)
+    first, second = limiter.acquire(), limiter.acquire()
+    limiter.release(first, throttled=True, retry_after=0)
+    limiter.release(second, throttled=True, retry_after=0)
+    assert limiter.limit == 4  # one decrease per cooldown
+
+    limiter._last_decrease = 0.0
+    limiter.decrease_cooldown = 0
+    limiter.release(limiter.acquire(), latency=1.0)
+    assert limiter.limit == pytest.approx(3.6)
+    for _ in range(20):
+        limiter.release(limiter.acquire(), throttled=True, retry_after=0)
+    assert limiter.limit == 2
+    assert limiter.stats()["throttled"] == 22
+
+
+def test_waiters_are_admitted_first_come_first_served():
+    limiter = AdaptiveLimiter("test", max_concurrency=1)  # one slot: admission order is visible
+    holder = limiter.acquire()
+    admitted = []
+
+    def worker(i):
+        ticket = limiter.acquire()
+        admitted.append(i)
+        limiter.release(ticket)
+
+    threads = []
+    for i in range(5):
+        threads.append(threading.Thread(target=worker, args=(i,)))
+        threads[-1].start()
+        # Each thread is queued before the next one starts
+        while limiter.stats()["queue_depth"] < i + 1:
+            time.sleep(0.001)
+
+    limiter.release(holder)
+    for thread in threads:
+        thread.join(timeout=5)
+    assert admitted == [0, 1, 2, 3, 4]
+
+
+def test_async_waiters_are_woken_in_order_and_cancellation_leaves_the_queue():
+    async def scenario():
+        limiter = AdaptiveLimiter("test", max_concurrency=1)
+        holder = await limiter.aacquire()
+        admitted = []
+
+        async def worker(i):
+            ticket = await limiter.aacquire()
+            admitted.append(i)
+            limiter.release(ticket)
+
+        tasks = [asyncio.create_task(worker(i)) for i in range(4)]
+        await asyncio.sleep(0)
+        tasks[1].cancel()
+        await asyncio.sleep(0)
+        assert limiter.stats()["queue_depth"] == 3
+
+        limiter.release(holder)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return admitted, limiter.stats()
+
+    admitted, stats = asyncio.run(scenario())
+    assert admitted == [0, 2, 3]
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
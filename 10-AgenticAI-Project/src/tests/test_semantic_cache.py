@@ -0,0 +1,40 @@
+import pytest
+
+from langgraphagenticai.nodes.consultant_bot_node import CONSULTATION_CACHE_THRESHOLD
+from langgraphagenticai.utils.semantic_cache import SemanticCache
+
+
+def cached(query: str) -> SemanticCache:
+    cache = SemanticCache(threshold=CONSULTATION_CACHE_THRESHOLD)
+    cache.add(query, cache.embed(query), f"answer to {query}")
+    return cache
+
+
+@pytest.mark.parametrize("stored, asked", [
+    ("Should I quit my job to start a startup?", "Should I not quit my job to start a startup?"),
+    ("Should I quit my job to start a startup?", "Shouldn't I quit my job to start a startup?"),
+    ("Is it safe to invest in crypto?", "Is it not safe to invest in crypto?"),
+    ("How do I save for retirement at 30?", "How do I save for retirement at 50?"),
+    ("How should I split a 10000 budget?", "How should I split a 100000 budget?"),
+])
+def test_near_misses_are_not_served_from_the_cache(stored, asked):
+    cache = cached(stored)
+    assert cache.lookup(cache.embed(asked), asked) is None
+
+
+@pytest.mark.parametrize("stored, asked", [
+    ("How do I start a business?", "how can I start a business"),
+    ("Should I quit my job to start a startup?", "should i quit my job to start a startup"),
+    ("How do I save for retirement at 30?", "How can I save for retirement at 30"),
+])
+def test_paraphrases_are_served_from_the_cache(stored, asked):
+    cache = cached(stored)
+    assert cache.lookup(cache.embed(asked), asked) == f"answer to {stored}"
+
+
+def test_a_matching_entry_behind_a_near_miss_is_found():
+    cache = cached("Should I not quit my job to start a startup?")
+    query = "Should I quit my job to start a startup?"
+    cache.add(query, cache.embed(query), "quit")
+    asked = "should i quit my job to start a startup"
+    assert cache.lookup(cache.embed(asked), asked) == "quit"
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+from langgraphagenticai.utils.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_execution_and_its_error():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+    runs, errors = [], []
+
+    def failing():
+        runs.append(1)
+        started.set()
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    def caller():
+        try:
+            flight.do("key", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=caller)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=caller) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.stats()["coalesced"] < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert len(runs) == 1
+    assert len(errors) == 4 and all(e is errors[0] for e in errors)
+    # Nothing is cached: the next call runs again
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+def test_async_followers_get_the_leaders_error_and_survive_its_cancellation():
+    async def scenario():
+        flight, runs = SingleFlight(), []
+
+        async def slow(fail):
+            runs.append(1)
+            await asyncio.sleep(0.05)
+            if fail:
+                raise ValueError("upstream failed")
+            return "answer"
+
+        leader = asyncio.create_task(flight.ado("ok", lambda: slow(False)))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.ado("ok", lambda: slow(False)))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "answer"
+
+        failing = [flight.ado("bad", lambda: slow(True)) for _ in range(3)]
+        results = await asyncio.gather(*failing, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        return runs, flight.stats()
+
+    runs, stats = asyncio.run(scenario())
+    assert len(runs) == 2
+    assert stats["executions"] == 2 and stats["coalesced"] == 3 and stats["in_flight"] == 0
+
+
+def test_event_loops_in_different_threads_run_their_own_call():
+    flight, results, barrier = SingleFlight(), [], threading.Barrier(2)
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return threading.get_ident()
+
+    def run_loop():
+        async def main():
+            barrier.wait(5)
+            return await flight.ado("key", work)
+        results.append(asyncio.run(main()))
+
+    threads = [threading.Thread(target=run_loop) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    # A task can only be awaited on its own loop, so each loop ran the call once
+    assert sorted(results) == sorted(t.ident for t in threads)
+    assert flight.stats()["executions"] == 2
+
+
+def test_a_none_key_never_coalesces():
+    flight = SingleFlight()
+    assert flight.do(None, lambda: 1) == 1
+    assert asyncio.run(flight.ado(None, lambda: asyncio.sleep(0, result=2))) == 2
+    assert flight.stats()["executions"] == 0
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_community.utilities.tavily_search import TavilySearchAPIWrapper
+
+from langgraphagenticai.tools.rate_limited_tool import with_rate_limit
+from langgraphagenticai.tools.tool_cache import CachedTool, get_tool_cache, is_error_result, with_tool_cache
+from langgraphagenticai.utils import circuit_breaker
+from langgraphagenticai.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+TOOL_NAME = "tavily_search_results_json"
+
+
+def tool_call(query: str) -> dict:
+    return {"type": "tool_call", "name": TOOL_NAME, "args": {"query": query}, "id": "call-1"}
+
+
+@pytest.fixture
+def tavily(monkeypatch):
+    """
+    Fake Tavily API: answers with one result, or raises ConnectionError while `down` is set.
+    """
+    state = {"calls": 0, "down": False}
+
+    def raw_results(wrapper, query, *args, **kwargs):
+        state["calls"] += 1
+        if state["down"]:
+            raise ConnectionError("tavily down")
+        return {"results": [{"title": query, "url": f"https://example.com/{query}", "content": query, "score": 0.9}]}
+
+    async def raw_results_async(wrapper, query, *args, **kwargs):
+        return raw_results(wrapper, query)
+
+    monkeypatch.setattr(TavilySearchAPIWrapper, "raw_results", raw_results)
+    monkeypatch.setattr(TavilySearchAPIWrapper, "raw_results_async", raw_results_async)
+    get_tool_cache(TOOL_NAME).clear()
+    yield state
+    get_tool_cache(TOOL_NAME).clear()
+
+
+def test_exception_reprs_are_errors():
+    assert is_error_result("ConnectionError('tavily down')", {})
+    assert is_error_result("HTTPError('429 Client Error')")
+    assert not is_error_result("ConnectionError('quoted in an article')", {"results": []})
+    assert not is_error_result([{"url": "https://example.com"}], {})
+
+
+def test_cached_tool_caches_results(tavily):
+    tool = CachedTool.wrap(TavilySearchResults(max_results=2))
+    first = tool.invoke(tool_call("llama"))
+    second = tool.invoke(tool_call("llama"))
+    assert first.content == second.content
+    assert tavily["calls"] == 1
+
+
+def test_cached_tool_does_not_cache_failures(tavily):
+    tool = CachedTool.wrap(TavilySearchResults(max_results=2))
+    tavily["down"] = True
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="tavily down"):
+            tool.invoke(tool_call("outage"))
+    with pytest.raises(RuntimeError, match="tavily down"):
+        asyncio.run(tool.ainvoke(tool_call("outage")))
+    assert tavily["calls"] == 4
+    assert get_tool_cache(TOOL_NAME).stats()["size"] == 0
+
+    # The first success after the outage is cached
+    tavily["down"] = False
+    tool.invoke(tool_call("outage"))
+    tool.invoke(tool_call("outage"))
+    assert tavily["calls"] == 5
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """
+    A fresh breaker for the search tool that opens once 3 of 4 calls have failed.
+    """
+    name = f"tavily:{TOOL_NAME}"
+    breaker = CircuitBreaker(name, min_calls=3, failure_rate=0.75, open_seconds=60)
+    monkeypatch.setitem(circuit_breaker._breakers, name, breaker)
+    return breaker
+
+
+def test_failures_open_the_breaker_through_the_wrapper_chain(tavily, breaker):
+    # The order create_tool_node uses: the cache in front of the rate limiter
+    (tool,) = with_tool_cache(with_rate_limit([TavilySearchResults(max_results=2)]))
+    tool.invoke(tool_call("cached before the outage"))
+
+    tavily["down"] = True
+    for _ in range(3):
+        with pytest.raises(RuntimeError, match="tavily down"):
+            tool.invoke(tool_call("outage"))
+    assert breaker.stats()["state"] == "open"
+    assert breaker.stats()["failure_rate"] == 0.75
+
+    # Rejected without calling Tavily; a cached result is still served
+    with pytest.raises(CircuitOpenError):
+        tool.invoke(tool_call("outage"))
+    assert "cached before the outage" in tool.invoke(tool_call("cached before the outage")).content
+    assert tavily["calls"] == 4
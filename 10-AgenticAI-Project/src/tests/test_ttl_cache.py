@@ -0,0 +1,29 @@
+import json
+import time
+
+from langgraphagenticai.utils.ttl_cache import TTLCache
+
+
+def test_sets_are_persisted_in_the_background(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = TTLCache(ttl=60, persist_path=str(path), save_interval=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # set() doesn't write the file itself
+    assert not path.exists()
+
+    deadline = time.time() + 5
+    while not path.exists() and time.time() < deadline:
+        time.sleep(0.01)
+    assert [key for key, _, _ in json.loads(path.read_text())["entries"]] == ["a", "b"]
+
+
+def test_flush_writes_pending_changes_for_the_next_process(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = TTLCache(ttl=60, persist_path=str(path), save_interval=3600)
+    cache.set("a", {"value": 1})
+    cache.flush()
+
+    reloaded = TTLCache(ttl=60, persist_path=str(path))
+    value, age = reloaded.get("a")
+    assert value == {"value": 1} and age < 60
@@ -1,8 +1,9 @@
 import uvicorn
 from fastapi import FastAPI, Request
 from src.graphs.graphbuilder import GraphBuilder
-from src.llms.groqllm import Groqllm
-from src.states.blogstate import Blogstate
+from src.llms.groqllm import Groqllm, GROQ_MODEL
+from src.llms.client_pool import llm_client_pool
+from src.states.blogstate import Blogstate, load_blog
 import os
 from dotenv import load_dotenv
 
@@ -15,6 +16,18 @@ print(os.getenv("langsmith_API_KEY"))
 os.environ["LANGSMITH_API_KEY"]=os.getenv("langsmith_API_KEY")
 
 
+@app.on_event("startup")
+def warm_up_llm_clients():
+    ## open the Groq connection before the first request (set GROQ_WARMUP=0 to skip)
+    if os.getenv("GROQ_WARMUP", "1") == "1" and os.getenv("GROQ_API_KEY"):
+        llm_client_pool.warm_up("groq", [GROQ_MODEL], os.getenv("GROQ_API_KEY"))
+
+
+@app.get("/metrics/llm_pool")
+async def llm_pool_metrics():
+    return llm_client_pool.stats()
+
+
 @app.post("/blogs")
 async def create_blogs(request:Request):
     
@@ -38,7 +51,10 @@ async def create_blogs(request:Request):
     elif topic:
         graph=graph_builder.setup_graph(usecase="topic")
         state=graph.invoke({"topic":topic})
-    
+
+    ## the blog body is a blob store handle in the state; return the blog itself
+    state["blog"]=load_blog(state.get("blog"))
+
 
     return {"data":state}
 
@@ -1,5 +1,6 @@
 from src.graphs.graphbuilder import GraphBuilder
 from src.llms.groqllm import Groqllm
+from src.states.blogstate import load_blog
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -16,6 +17,7 @@ def test_blog_generator(topic: str):
         "current_language": "English",
         "blog": {"title": "", "content": ""}   # ✅ pass Blog dict
     })
+    state["blog"] = load_blog(state.get("blog"))
 
     return state
 
@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+import httpx
+from langchain_groq import ChatGroq
+
+# Endpoints hit by warm_up() to open a keep-alive connection before the first request
+WARMUP_URLS = {
+    "groq": "https://api.groq.com/openai/v1/models",
+}
+
+logger = logging.getLogger(__name__)
+
+
+def _fingerprint(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMClientPool:
+    """
+    Process-wide registry of ChatGroq clients keyed by (provider, model, hashed API key).
+    Clients are evicted in LRU order and share one keep-alive HTTP connection pool.
+    """
+
+    def __init__(self, max_size: int = 16, max_connections: int = 50,
+                 max_keepalive_connections: int = 10, keepalive_expiry: float = 60.0):
+        self.max_size = max_size
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http_client = httpx.Client(limits=limits, timeout=60.0)
+        self.http_async_client = httpx.AsyncClient(limits=limits, timeout=60.0)
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+        self._warmed_up = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_client(self, provider: str, model: str, api_key: str):
+        if provider != "groq":
+            raise ValueError(f"Unsupported LLM provider: {provider}")
+
+        key = (provider, model, _fingerprint(api_key))
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+
+            self.misses += 1
+            client = ChatGroq(
+                api_key=api_key,
+                model=model,
+                http_client=self.http_client,
+                http_async_client=self.http_async_client,
+            )
+            self._clients[key] = client
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+            return client
+
+    def warm_up(self, provider: str, models, api_key: str):
+        """
+        Creates clients for the given models and opens a keep-alive connection to the provider.
+        Repeated calls for the same provider and key are no-ops.
+        """
+        warmup_key = (provider, _fingerprint(api_key))
+        with self._lock:
+            if warmup_key in self._warmed_up:
+                return
+            self._warmed_up.add(warmup_key)
+
+        for model in models:
+            self.get_client(provider, model, api_key)
+
+        url = WARMUP_URLS.get(provider)
+        if not url:
+            return
+        try:
+            self.http_client.get(url, headers={"Authorization": f"Bearer {api_key}"})
+        except httpx.HTTPError as e:
+            logger.warning("Warm-up request to %s failed: %s", provider, e)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "reuse_rate": self.hits / total if total else 0.0,
+            }
+
+
+llm_client_pool = LLMClientPool(max_size=int(os.getenv("LLM_CLIENT_POOL_SIZE", "16")))
@@ -16,9 +16,11 @@
 #             raise ValueError(f"Error occurred with exception :{e}")
 
 
-from langchain_groq import ChatGroq
 import os
 from dotenv import load_dotenv
+from src.llms.client_pool import llm_client_pool
+
+GROQ_MODEL = "llama3-70b-8192"
 
 class Groqllm:
     def __init__(self):
@@ -32,8 +34,8 @@ class Groqllm:
                 raise ValueError("GROQ_API_KEY not found in environment variables")
             
             os.environ["GROQ_API_KEY"] = self.groq_api_key
-            # Return the LLM client
-            return ChatGroq(api_key=self.groq_api_key, model="llama3-70b-8192")
+            # Return the pooled, long-lived LLM client
+            return llm_client_pool.get_client("groq", GROQ_MODEL, self.groq_api_key)
         except Exception as e:
             raise ValueError(f"Error occurred with exception: {e}")
 
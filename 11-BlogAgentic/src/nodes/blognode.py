@@ -166,7 +166,7 @@
 #         else:
 #             return language
 
-from src.states.blogstate import Blogstate, Blog
+from src.states.blogstate import Blogstate, Blog, store_blog, load_blog
 from langchain_core.messages import SystemMessage, HumanMessage
 
 class BlogNode:
@@ -199,12 +199,16 @@ class BlogNode:
             Generate a detailed blog content with detailed breakdown for the {topic}"""
             system_message = system_prompt.format(topic=state["topic"])
             response = self.llm.invoke(system_message)
-            return {"blog": Blog(title=state["blog"].title, content=response.content)}
+            blog = load_blog(state["blog"])
+            return {"blog": store_blog(Blog(title=blog.title, content=response.content))}
     
     def translation(self, state: Blogstate):
         """
         Translate the content to the specified language.
         """
+        # The blog body is loaded from the blob store only here
+        blog = load_blog(state["blog"])
+
         # First translate the title
         title_translation_prompt = """
         Translate the following title into {current_language}.
@@ -218,7 +222,7 @@ class BlogNode:
         title_messages = [
             HumanMessage(title_translation_prompt.format(
                 current_language=state["current_language"], 
-                blog_title=state["blog"].title
+                blog_title=blog.title
             ))
         ]
         translated_title_response = self.llm.invoke(title_messages)
@@ -235,7 +239,7 @@ class BlogNode:
         """
         
         print(state["current_language"])
-        blog_content = state["blog"].content
+        blog_content = blog.content
         content_messages = [
             HumanMessage(content_translation_prompt.format(
                 current_language=state["current_language"], 
@@ -249,7 +253,7 @@ class BlogNode:
             title=translated_title_response.content.strip(),
             content=translated_content_response.content.strip()
         )
-        return {"blog": translated_blog}
+        return {"blog": store_blog(translated_blog)}
     
     def route(self, state: Blogstate):
         return {"current_language": state["current_language"]}
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TypedDict
+
+# `memory` (per process) or `disk` (one file per blob under BLOB_STORE_DIR, read with mmap)
+BLOB_STORE = os.getenv("BLOB_STORE", "memory")
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "./.blobs")
+# Values smaller than this (JSON-encoded) stay in the state
+BLOB_MIN_BYTES = int(os.getenv("BLOB_MIN_BYTES", "4096"))
+BLOB_STORE_MAX_BYTES = int(os.getenv("BLOB_STORE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+class BlobRef(TypedDict):
+    """
+    Handle kept in the graph state in place of a large value: the SHA-256 of its JSON
+    encoding and its size in bytes. A plain dict, so every checkpoint serializer keeps it.
+    """
+    blob_sha256: str
+    size: int
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, dict) and len(value) == 2 and "blob_sha256" in value and "size" in value
+
+
+def encode(value) -> bytes:
+    # Sorted keys: equal values get the same digest
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class BlobStore:
+    """
+    Content-addressed store of JSON values; equal values are stored once.
+    Blobs are kept in memory (LRU beyond `max_bytes`) or, with `directory`, on disk.
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = BLOB_STORE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._blobs = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.stored = 0
+        self.deduplicated = 0
+        self.loaded = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def put(self, value, data: bytes = None) -> BlobRef:
+        data = data if data is not None else encode(value)
+        digest = hashlib.sha256(data).hexdigest()
+        written = self._write_file(digest, data) if self.directory else self._write_memory(digest, data)
+        with self._lock:
+            if written:
+                self.stored += 1
+            else:
+                self.deduplicated += 1
+        return BlobRef(blob_sha256=digest, size=len(data))
+
+    def get(self, ref: BlobRef):
+        digest = ref["blob_sha256"]
+        data = self._read_file(digest) if self.directory else self._read_memory(digest)
+        if data is None:
+            raise KeyError(f"Blob {digest} is no longer in the store")
+        with self._lock:
+            self.loaded += 1
+        return json.loads(data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "stored": self.stored,
+                "deduplicated": self.deduplicated,
+                "loaded": self.loaded,
+                "bytes_in_memory": self._bytes,
+            }
+
+    def _write_memory(self, digest: str, data: bytes) -> bool:
+        with self._lock:
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+                return False
+            self._blobs[digest] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._blobs) > 1:
+                _, evicted = self._blobs.popitem(last=False)
+                self._bytes -= len(evicted)
+            return True
+
+    def _read_memory(self, digest: str):
+        with self._lock:
+            return self._blobs.get(digest)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _write_file(self, digest: str, data: bytes) -> bool:
+        path = self._path(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written to a temporary file and renamed, so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+
+    def _read_file(self, digest: str):
+        try:
+            with open(self._path(digest), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return m[:]
+        except FileNotFoundError:
+            return None
+
+
+blob_store = BlobStore(BLOB_STORE_DIR if BLOB_STORE == "disk" else None)
+
+
+def offload(value, min_bytes: int = BLOB_MIN_BYTES):
+    """
+    Returns a BlobRef to `value` when its JSON encoding is at least `min_bytes` long,
+    else `value` itself.
+    """
+    if value is None or is_blob_ref(value):
+        return value
+    data = encode(value)
+    if len(data) < min_bytes:
+        return value
+    return blob_store.put(value, data)
+
+
+def resolve(value):
+    """
+    Loads the value behind a BlobRef; any other value is returned unchanged.
+    """
+    if is_blob_ref(value):
+        return blob_store.get(value)
+    return value
@@ -1,6 +1,8 @@
-from typing import TypedDict, Optional
+from typing import TypedDict, Optional, Union
 from pydantic import BaseModel, Field
 
+from src.states.blob_store import BlobRef, is_blob_ref, offload, resolve
+
 class Blog(BaseModel):
     title: str = Field(..., title="The title of the blog post")
     content: str = Field(..., title="The content of the blog post")
@@ -9,4 +11,23 @@ class Blog(BaseModel):
 class Blogstate(TypedDict):
     topic: str
     current_language: str
-    blog: Optional[Blog]
\ No newline at end of file
+    blog: Optional[Union[Blog, BlobRef]]  # a blob store handle once the content is written
+
+
+def store_blog(blog: Blog):
+    """
+    Returns the blog, or a BlobRef to it when its content is large, so the full body
+    isn't carried through every node transition and checkpoint.
+    """
+    ref = offload(blog.model_dump())
+    return ref if is_blob_ref(ref) else blog
+
+
+def load_blog(value) -> Optional[Blog]:
+    """
+    Returns the Blog behind a `blog` state value (Blog, dict or BlobRef).
+    """
+    value = resolve(value)
+    if isinstance(value, dict):
+        return Blog(**value)
+    return value
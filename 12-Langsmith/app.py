@@ -16,6 +16,8 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableParallel, RunnablePassthrough, RunnableLambda
 from langchain_core.output_parsers import StrOutputParser
 
+from prompt_packing import PackItem, PromptPacker
+
 load_dotenv()
 
 PDF_PATH = "AgenticAi.pdf"  # change to your file
@@ -133,8 +135,24 @@ prompt = ChatPromptTemplate.from_messages([
     ("human", "Question: {question}\n\nContext:\n{context}")
 ])
 
+# Token budget for retrieved context; chunks beyond it are cut at a sentence boundary or dropped
+CONTEXT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKENS", "3000"))
+context_packer = PromptPacker(CONTEXT_TOKEN_BUDGET)
+
+@traceable(name="pack_context")
+def pack_context(docs):
+    # The retriever returns chunks best-first, so rank by retrieval position
+    packed = context_packer.pack([PackItem(text=d.page_content, score=-rank) for rank, d in enumerate(docs)])
+    return {
+        "text": packed.text,
+        "used_tokens": packed.used_tokens,
+        "dropped_tokens": packed.dropped_tokens,
+        "truncated": packed.truncated,
+        "dropped": packed.dropped,
+    }
+
 def format_docs(docs):
-    return "\n\n".join(d.page_content for d in docs)
+    return pack_context(docs)["text"]
 
 @traceable(name="setup_pipeline", tags=["setup"])
 def setup_pipeline(
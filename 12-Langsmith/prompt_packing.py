@@ -0,0 +1,125 @@
+"""
+Token-budget-aware packing of retrieved context into a prompt.
+"""
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Counts tokens with tiktoken's cl100k_base encoding, or ~4 characters per token without it.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding()
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    if max_tokens <= 0 or not text:
+        return ""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    tokens = encoding.encode(text, disallowed_special=())
+    return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+
+def truncate_at_sentence(text: str, max_tokens: int) -> str:
+    """
+    Returns the longest prefix of `text` that ends at a sentence boundary and fits in
+    `max_tokens`; when even the first sentence is too long it is cut at the token limit.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    # Token counts grow with the prefix, so binary search the sentence boundaries
+    boundaries = [match.start() for match in _SENTENCE_END.finditer(text)]
+    low, high, best = 0, len(boundaries) - 1, None
+    while low <= high:
+        middle = (low + high) // 2
+        if count_tokens(text[:boundaries[middle]]) <= max_tokens:
+            best = boundaries[middle]
+            low = middle + 1
+        else:
+            high = middle - 1
+
+    if best is not None:
+        return text[:best]
+    return truncate_to_tokens(text, max_tokens)
+
+
+@dataclass
+class PackItem:
+    text: str
+    score: float = 0.0
+
+
+@dataclass
+class PackResult:
+    text: str
+    items: list = field(default_factory=list)
+    used_tokens: int = 0
+    dropped_tokens: int = 0
+    truncated: int = 0
+    dropped: int = 0
+
+
+class PromptPacker:
+    """
+    Packs context items into a token budget in one pass.
+    Items are ranked by score (ties keep their input order); an item that doesn't fit is
+    truncated at a sentence boundary if at least `min_item_tokens` remain, otherwise dropped.
+    """
+    def __init__(self, budget_tokens: int, separator: str = "\n\n", min_item_tokens: int = 48):
+        self.budget_tokens = budget_tokens
+        self.separator = separator
+        self.min_item_tokens = min_item_tokens
+        self._separator_tokens = count_tokens(separator)
+
+    def pack(self, items: list) -> PackResult:
+        ranked = sorted(items, key=lambda item: item.score, reverse=True)
+        result = PackResult(text="")
+        parts = []
+
+        for item in ranked:
+            tokens = count_tokens(item.text)
+            overhead = self._separator_tokens if parts else 0
+            remaining = self.budget_tokens - result.used_tokens - overhead
+
+            if tokens <= remaining:
+                parts.append(item.text)
+                result.items.append(item)
+                result.used_tokens += tokens + overhead
+                continue
+
+            if remaining >= self.min_item_tokens:
+                text = truncate_at_sentence(item.text, remaining)
+                text_tokens = count_tokens(text)
+                if text and text_tokens <= remaining:
+                    parts.append(text)
+                    result.items.append(PackItem(text=text, score=item.score))
+                    result.used_tokens += text_tokens + overhead
+                    result.dropped_tokens += tokens - text_tokens
+                    result.truncated += 1
+                    continue
+
+            result.dropped_tokens += tokens
+            result.dropped += 1
+
+        result.text = self.separator.join(parts)
+        return result